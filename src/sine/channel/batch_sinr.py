@@ -267,11 +267,9 @@ class LinksSinrComputer:
                     polarization=link.polarization,
                 )
 
-                # Get path result for signal
-                path_result = engine.compute_paths()
-
-                # Cache paths for visualization
-                path_details = engine.get_path_details()
+                # Get path result for signal, and path details to cache for
+                # visualization, from one trace
+                path_result, path_details = engine.compute_paths_with_details()
                 path_cache.store(
                     tx_node=link.tx_node,
                     rx_node=link.rx_node,
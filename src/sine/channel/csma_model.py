@@ -9,6 +9,8 @@ import logging
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,10 +37,7 @@ def compute_distance(
     Returns:
         Distance in meters
     """
-    dx = pos1[0] - pos2[0]
-    dy = pos1[1] - pos2[1]
-    dz = pos1[2] - pos2[2]
-    return math.sqrt(dx * dx + dy * dy + dz * dz)
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1], pos1[2] - pos2[2])
 
 
 class CSMAModel:
@@ -104,26 +103,33 @@ class CSMAModel:
         tx_pos = positions[tx_node]
         interferer_pos = positions[interferer_node]
 
-        # Distance from interferer to TX node
-        dist_to_tx = compute_distance(interferer_pos, tx_pos)
+        # Squared distance from interferer to TX node. Comparing squares against
+        # the squared CS range is a monotone transform of the distance check, so
+        # the CS-range filtering result is identical without the sqrt.
+        dx = interferer_pos[0] - tx_pos[0]
+        dy = interferer_pos[1] - tx_pos[1]
+        dz = interferer_pos[2] - tx_pos[2]
+        dist_sq = dx * dx + dy * dy + dz * dz
 
         # Carrier sense range
         cs_range = communication_range * self.cs_multiplier
 
-        if dist_to_tx < cs_range:
+        if dist_sq < cs_range * cs_range:
             # Interferer can sense TX node, defers transmission (CSMA/CA)
-            logger.debug(
-                f"CSMA: {interferer_node} within CS range of {tx_node} "
-                f"({dist_to_tx:.1f}m < {cs_range:.1f}m) → Pr[TX]=0.0"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"CSMA: {interferer_node} within CS range of {tx_node} "
+                    f"({math.sqrt(dist_sq):.1f}m < {cs_range:.1f}m) → Pr[TX]=0.0"
+                )
             return 0.0
         else:
             # Hidden node: interferer cannot sense TX, may transmit
             # Probability = traffic load (duty cycle)
-            logger.debug(
-                f"CSMA: {interferer_node} hidden from {tx_node} "
-                f"({dist_to_tx:.1f}m > {cs_range:.1f}m) → Pr[TX]={traffic_load}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"CSMA: {interferer_node} hidden from {tx_node} "
+                    f"({math.sqrt(dist_sq):.1f}m > {cs_range:.1f}m) → Pr[TX]={traffic_load}"
+                )
             return traffic_load
 
     def compute_interference_probabilities(
@@ -149,23 +155,25 @@ class CSMAModel:
         Returns:
             Dictionary {interferer_name: Pr[TX]}
         """
-        probs = {}
-
-        for interferer in interferer_nodes:
-            # Skip self and RX node
-            if interferer in (tx_node, rx_node):
-                continue
-
-            prob = self.compute_interference_probability(
-                tx_node=tx_node,
-                rx_node=rx_node,
-                interferer_node=interferer,
-                positions=positions,
-                communication_range=communication_range,
-                traffic_load=traffic_load,
-            )
-
-            probs[interferer] = prob
+        if traffic_load is None:
+            traffic_load = self.traffic_load
+
+        # Skip self and RX node
+        interferers = [n for n in interferer_nodes if n not in (tx_node, rx_node)]
+
+        probs: dict[str, float] = {}
+        if interferers:
+            # Squared distances from all interferers to TX node in one
+            # vectorized pass (compared against the squared CS range, no sqrt)
+            pos_arr = np.asarray([positions[n] for n in interferers], dtype=np.float64)
+            diff = pos_arr - np.asarray(positions[tx_node], dtype=np.float64)
+            dist_sq = np.einsum("ij,ij->i", diff, diff)
+
+            # Within CS range → defers (0.0); beyond → hidden node (traffic_load)
+            cs_range = communication_range * self.cs_multiplier
+            probs_arr = np.where(dist_sq < cs_range * cs_range, 0.0, traffic_load)
+
+            probs = dict(zip(interferers, probs_arr.tolist(), strict=True))
 
         # Count hidden nodes
         num_hidden = sum(1 for p in probs.values() if p > 0)
@@ -10,6 +10,7 @@ Key insight: Use PathSolver for point-to-point interference links, not RadioMapS
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 import logging
 import numpy as np
@@ -24,7 +25,16 @@ except ImportError:
     _sionna_available = False
 
 
-@dataclass
+def _link_end(
+    position: tuple[float, float, float],
+    antenna_pattern: Optional[str],
+    polarization: Optional[str],
+) -> tuple:
+    """One end of a path cache key: position and resolved antenna pattern/polarization."""
+    return (position, antenna_pattern or "iso", polarization or "V")
+
+
+@dataclass(frozen=True)
 class TransmitterInfo:
     """Information about a transmitter for interference computation."""
 
@@ -37,6 +47,15 @@ class TransmitterInfo:
     frequency_hz: float = 5.18e9
     bandwidth_hz: float = 80e6  # Default 80 MHz for WiFi 6
 
+    @cached_property
+    def _cache_partial(self) -> tuple:
+        """Transmitter half of the path cache key, built on first lookup and reused.
+
+        Safe to cache because the dataclass is frozen: position, pattern and
+        polarization cannot change after construction.
+        """
+        return _link_end(self.position, self.antenna_pattern, self.polarization)
+
 
 @dataclass
 class InterferenceTerm:
@@ -95,32 +114,31 @@ def calculate_aclr_db(
         >>> calculate_aclr_db(200e6, 80e6, 80e6)
         45.0
     """
-    freq_sep_mhz = abs(freq_separation_hz) / 1e6
-    tx_bw_mhz = tx_bandwidth_hz / 1e6
-    rx_bw_mhz = rx_bandwidth_hz / 1e6
+    # Work in Hz throughout: this runs once per interferer per receiver query
+    freq_sep_hz = abs(freq_separation_hz)
 
     # Use TX bandwidth to determine spectral mask thresholds (transmitter-based ACLR)
-    half_tx_bw = tx_bw_mhz / 2.0
+    half_tx_bw_hz = tx_bandwidth_hz / 2.0
 
     # Check for channel overlap (co-channel interference)
     # Channels overlap if separation < half of larger bandwidth
     # This is a simplified model: actual overlap depends on both bandwidths
     # For practical purposes, use TX bandwidth (spectral mask is transmitter property)
-    if freq_sep_mhz < half_tx_bw:
+    if freq_sep_hz < half_tx_bw_hz:
         # Channels overlap → co-channel interference (0 dB ACLR)
         return 0.0
 
     # Non-overlapping channels: Apply IEEE 802.11ax spectral mask
     # Values based on 802.11ax-2021 Table 27-20 (transmit spectrum mask)
     # Thresholds are based on TX bandwidth
+    excess_hz = freq_sep_hz - half_tx_bw_hz
 
-    if freq_sep_mhz < half_tx_bw + 40:
+    if excess_hz < 40e6:
         # Transition band: BW/2 to BW/2+40 MHz
         # For 80 MHz BW: 40-80 MHz separation
         # Linear interpolation from -20 to -28 dB
-        excess = freq_sep_mhz - half_tx_bw
-        return 20.0 + (excess / 40.0) * 8.0
-    elif freq_sep_mhz < half_tx_bw + 80:
+        return 20.0 + (excess_hz / 40e6) * 8.0
+    elif excess_hz < 80e6:
         # 1st adjacent: BW/2+40 to BW/2+80 MHz
         # For 80 MHz BW: 80-120 MHz separation
         return 40.0
@@ -130,6 +148,21 @@ def calculate_aclr_db(
         return 45.0
 
 
+def _orthogonal_threshold_hz(tx_bandwidth_hz: float) -> float:
+    """Frequency separation above which an interferer is treated as orthogonal.
+
+    Matches where calculate_aclr_db returns 45 dB: half the TX bandwidth plus
+    80 MHz (IEEE 802.11ax), beyond which leakage is negligible.
+    """
+    return tx_bandwidth_hz / 2.0 + 80e6
+
+
+def _is_orthogonal(interferer: TransmitterInfo, rx_frequency_hz: float) -> bool:
+    """Whether an interferer is far enough off-channel to be ignored."""
+    freq_separation = abs(interferer.frequency_hz - rx_frequency_hz)
+    return freq_separation > _orthogonal_threshold_hz(interferer.bandwidth_hz)
+
+
 class InterferenceEngine:
     """
     Compute interference from multiple transmitters using PathSolver.
@@ -210,6 +243,7 @@ class InterferenceEngine:
         Compute interference from all active interferers at RX position.
 
         Uses PathSolver iteratively for each interferer to compute interference power.
+        Paths are cached per link; a cached reverse link is reused (reciprocity).
         Applies ACLR (Adjacent-Channel Leakage Ratio) based on frequency separation.
         Filters out orthogonal interferers (>2× max bandwidth separation).
         Aggregates interference in linear domain (power sum).
@@ -234,6 +268,7 @@ class InterferenceEngine:
 
         interference_terms = []
         total_interference_linear = 0.0
+        rx_cache_partial = _link_end(rx_position, rx_antenna_pattern, rx_polarization)
 
         for interferer in interferers:
             # Skip inactive interferers
@@ -245,15 +280,12 @@ class InterferenceEngine:
             freq_separation = abs(interferer.frequency_hz - rx_frequency_hz)
 
             # Skip orthogonal interferers (> half_tx_bw + 80 MHz → 45 dB ACLR, negligible)
-            # This threshold matches where calculate_aclr_db returns 45 dB
-            half_tx_bw_hz = interferer.bandwidth_hz / 2.0
-            orthogonal_threshold_hz = half_tx_bw_hz + 80e6  # 80 MHz from IEEE 802.11ax
-            if freq_separation > orthogonal_threshold_hz:
+            if _is_orthogonal(interferer, rx_frequency_hz):
                 logger.debug(
                     "Skipping orthogonal interferer %s: %.1f MHz separation > %.1f MHz threshold",
                     interferer.node_name,
                     freq_separation / 1e6,
-                    orthogonal_threshold_hz / 1e6,
+                    _orthogonal_threshold_hz(interferer.bandwidth_hz) / 1e6,
                 )
                 continue
 
@@ -266,36 +298,34 @@ class InterferenceEngine:
 
             # DEBUG: Log frequency separation and ACLR for co-channel diagnosis
             logger.warning(
-                f"ACLR DEBUG: {interferer.node_name}→{rx_node} | "
-                f"TX_freq={interferer.frequency_hz/1e9:.4f} GHz, RX_freq={rx_frequency_hz/1e9:.4f} GHz, "
-                f"Separation={freq_separation/1e6:.2f} MHz, TX_BW={interferer.bandwidth_hz/1e6:.0f} MHz, "
-                f"RX_BW={rx_bandwidth_hz/1e6:.0f} MHz → ACLR={aclr_db:.2f} dB"
+                "ACLR DEBUG: %s→%s | TX_freq=%.4f GHz, RX_freq=%.4f GHz, "
+                "Separation=%.2f MHz, TX_BW=%.0f MHz, RX_BW=%.0f MHz → ACLR=%.2f dB",
+                interferer.node_name,
+                rx_node,
+                interferer.frequency_hz / 1e9,
+                rx_frequency_hz / 1e9,
+                freq_separation / 1e6,
+                interferer.bandwidth_hz / 1e6,
+                rx_bandwidth_hz / 1e6,
+                aclr_db,
             )
 
-            # Resolve antenna patterns before building the cache key.
-            tx_pattern = interferer.antenna_pattern or "iso"
-            tx_polarization = interferer.polarization or "V"
-
-            # Cache key includes everything that affects the path computation result:
-            #   - positions (geometry)
-            #   - antenna patterns & polarizations (Sionna RT embeds their gains into
-            #     path_loss_db, so paths computed with different patterns differ)
-            #   - scene path (paths are scene-specific; cache is cleared on scene reload,
-            #     but including the scene here adds defence-in-depth)
-            cache_key = (
-                self._scene_path,
-                interferer.position,
-                rx_position,
-                tx_pattern,
-                rx_antenna_pattern,
-                tx_polarization,
-                rx_polarization,
-            )
+            cache_key = self._cache_key(interferer._cache_partial, rx_cache_partial)
 
-            if cache_key in self._path_cache:
-                path_result = self._path_cache[cache_key]
+            path_result = self._path_cache.get(cache_key)
+            if path_result is None:
+                # Propagation is reciprocal: with TX and RX antennas swapped
+                # (both use the same fixed orientation), the reverse link has the
+                # same path loss and delays. Reuse it so each node pair is traced
+                # once, e.g. 3 PathSolver runs instead of 6 for a 3-node triangle.
+                path_result = self._path_cache.get(
+                    self._cache_key(rx_cache_partial, interferer._cache_partial)
+                )
+
+            if path_result is not None:
                 logger.debug("Using cached path for %s→%s", interferer.node_name, rx_node)
             else:
+                _, tx_pattern, tx_polarization = interferer._cache_partial
                 path_result = self._compute_interference_path(
                     interferer.position,
                     rx_position,
@@ -374,6 +404,129 @@ class InterferenceEngine:
             num_interferers=len(interference_terms)
         )
 
+    def compute_interference_batch(
+        self,
+        receivers: list[tuple[str, tuple[float, float, float]]],
+        interferers: dict[str, list[TransmitterInfo]],
+        rx_antenna_gain_dbi: float,
+        active_states: Optional[dict[str, bool]] = None,
+        rx_frequency_hz: float = 5.18e9,
+        rx_bandwidth_hz: float = 80e6,
+        rx_antenna_pattern: str = "iso",
+        rx_polarization: str = "V",
+    ) -> dict[str, InterferenceResult]:
+        """
+        Compute interference at several receivers, tracing all uncached links at once.
+
+        compute_interference_at_receiver() runs PathSolver once per uncached link.
+        Here the uncached links of all receivers are collected first (a link whose
+        reverse is already cached or planned is skipped, as propagation is
+        reciprocal) and traced together: every interferer position is placed as a
+        transmitter and every receiver position as a receiver, so one PathSolver
+        call covers them all. Sionna applies one antenna array to all transmitters,
+        so interferers are traced in one batch per TX antenna pattern/polarization.
+
+        Args:
+            receivers: (rx_node, rx_position) pairs
+            interferers: rx_node -> potential interferers of that receiver
+            rx_antenna_gain_dbi: Receiver antenna gain in dBi (all receivers)
+            active_states: Dict of {node_name: is_transmitting}. If None, all active.
+            rx_frequency_hz: Receiver center frequency in Hz (for ACLR calculation)
+            rx_bandwidth_hz: Receiver channel bandwidth in Hz (for ACLR calculation)
+            rx_antenna_pattern: Receiver antenna pattern (all receivers)
+            rx_polarization: Receiver polarization (all receivers)
+
+        Returns:
+            rx_node -> InterferenceResult, same as compute_interference_at_receiver()
+        """
+        if not self._scene_loaded:
+            raise RuntimeError("Scene must be loaded before computing interference")
+
+        # Uncached links, grouped by TX antenna: (tx_pattern, tx_pol) -> {cache_key: (tx, rx)}
+        batches: dict[tuple[str, str], dict[tuple, tuple]] = {}
+        for rx_node, rx_position in receivers:
+            rx_cache_partial = _link_end(rx_position, rx_antenna_pattern, rx_polarization)
+            for interferer in interferers.get(rx_node, []):
+                if active_states is not None and not active_states.get(interferer.node_name, True):
+                    continue
+                if _is_orthogonal(interferer, rx_frequency_hz):
+                    continue
+                if interferer.position == rx_position:
+                    # Coincident TX/RX is not traced in a batch; handled on demand
+                    continue
+
+                _, tx_pattern, tx_polarization = interferer._cache_partial
+                cache_key = self._cache_key(interferer._cache_partial, rx_cache_partial)
+                reverse_key = self._cache_key(rx_cache_partial, interferer._cache_partial)
+                if cache_key in self._path_cache or reverse_key in self._path_cache:
+                    continue
+                if any(cache_key in links or reverse_key in links for links in batches.values()):
+                    continue
+                batches.setdefault((tx_pattern, tx_polarization), {})[cache_key] = (
+                    interferer.position, rx_position
+                )
+
+        for (tx_pattern, tx_polarization), links in batches.items():
+            if len(links) < 2:
+                # A single link gains nothing from batching; traced on demand below
+                continue
+
+            tx_names = {pos: f"tx_{i}" for i, pos in enumerate(dict.fromkeys(
+                tx_position for tx_position, _ in links.values()
+            ))}
+            rx_names = {pos: f"rx_{i}" for i, pos in enumerate(dict.fromkeys(
+                rx_position for _, rx_position in links.values()
+            ))}
+
+            self._engine.clear_devices()
+            for tx_position, name in tx_names.items():
+                self._engine.add_transmitter(name, tx_position, tx_pattern, tx_polarization)
+            for rx_position, name in rx_names.items():
+                self._engine.add_receiver(name, rx_position, rx_antenna_pattern, rx_polarization)
+
+            link_paths = self._engine.compute_link_paths()
+            for cache_key, (tx_position, rx_position) in links.items():
+                self._path_cache[cache_key] = link_paths[
+                    (tx_names[tx_position], rx_names[rx_position])
+                ]
+
+            logger.debug(
+                "Batch-traced %d interference links (%d TX x %d RX) in one PathSolver call",
+                len(links), len(tx_names), len(rx_names),
+            )
+
+        return {
+            rx_node: self.compute_interference_at_receiver(
+                rx_position=rx_position,
+                rx_antenna_gain_dbi=rx_antenna_gain_dbi,
+                rx_node=rx_node,
+                interferers=interferers.get(rx_node, []),
+                active_states=active_states,
+                rx_frequency_hz=rx_frequency_hz,
+                rx_bandwidth_hz=rx_bandwidth_hz,
+                rx_antenna_pattern=rx_antenna_pattern,
+                rx_polarization=rx_polarization,
+            )
+            for rx_node, rx_position in receivers
+        }
+
+    def _cache_key(self, tx_partial: tuple, rx_partial: tuple) -> tuple:
+        """
+        Path cache key for one directed link.
+
+        The key includes everything that affects the path computation result:
+          - positions (geometry)
+          - antenna patterns & polarizations (Sionna RT embeds their gains into
+            path_loss_db, so paths computed with different patterns differ)
+          - scene path (paths are scene-specific; cache is cleared on scene reload,
+            but including the scene here adds defence-in-depth)
+
+        Each end is a prebuilt _link_end() tuple (TransmitterInfo._cache_partial
+        for interferers), so a lookup hashes three items instead of seven and
+        the reverse link's key is the same ends swapped.
+        """
+        return (self._scene_path, tx_partial, rx_partial)
+
     def _compute_interference_path(
         self,
         tx_position: tuple[float, float, float],
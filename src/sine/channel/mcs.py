@@ -1,25 +1,40 @@
 """MCS (Modulation and Coding Scheme) table support."""
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
 import csv
 import logging
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import pairwise
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
-logger = logging.getLogger(__name__)
-
-# Bits per symbol for each modulation scheme
-MODULATION_BITS = {
-    "bpsk": 1,
-    "qpsk": 2,
-    "16qam": 4,
-    "64qam": 6,
-    "256qam": 8,
-    "1024qam": 10,
-}
+import numpy as np
+import numpy.typing as npt
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+# Bits per symbol for each modulation scheme (read-only). Keys are interned so
+# lookups with interned modulation strings (see from_csv_columns) hit on identity.
+MODULATION_BITS = MappingProxyType({
+    sys.intern(modulation): bits
+    for modulation, bits in {
+        "bpsk": 1,
+        "qpsk": 2,
+        "16qam": 4,
+        "64qam": 6,
+        "256qam": 8,
+        "1024qam": 10,
+    }.items()
+})
+
+
+@dataclass(frozen=True, slots=True)
 class MCSEntry:
     """Single MCS table entry."""
 
@@ -32,74 +47,192 @@ class MCSEntry:
     bandwidth_mhz: Optional[float] = None  # Optional, overrides interface bandwidth
     spreading_factor: Optional[int] = None  # For spread spectrum (future)
     processing_gain_db: Optional[float] = None  # For spread spectrum (future)
+    # Spectral efficiency (bits/symbol * code_rate), derived once at construction
+    spectral_efficiency: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def spectral_efficiency(self) -> float:
-        """Return spectral efficiency (bits/symbol * code_rate)."""
-        return self.bits_per_symbol * self.code_rate
+    def __post_init__(self) -> None:
+        """Derive spectral efficiency (frozen, so bypass __setattr__)."""
+        object.__setattr__(
+            self, "spectral_efficiency", self.bits_per_symbol * self.code_rate
+        )
 
     @classmethod
     def from_csv_row(cls, row: dict) -> "MCSEntry":
         """Create MCSEntry from CSV row dictionary."""
-        modulation = row["modulation"].lower()
-        bits = MODULATION_BITS.get(modulation, 6)
-
-        # Handle optional bandwidth_mhz column
-        bandwidth_mhz = None
-        if "bandwidth_mhz" in row and row["bandwidth_mhz"]:
-            bandwidth_mhz = float(row["bandwidth_mhz"])
-
-        # Handle optional spread spectrum columns (future)
-        spreading_factor = None
-        if "spreading_factor" in row and row["spreading_factor"]:
-            spreading_factor = int(row["spreading_factor"])
-
-        processing_gain_db = None
-        if "processing_gain_db" in row and row["processing_gain_db"]:
-            processing_gain_db = float(row["processing_gain_db"])
-
-        return cls(
-            mcs_index=int(row["mcs_index"]),
-            modulation=modulation,
-            code_rate=float(row["code_rate"]),
-            min_snr_db=float(row["min_snr_db"]),
-            fec_type=row.get("fec_type", "ldpc").lower(),
-            bits_per_symbol=bits,
-            bandwidth_mhz=bandwidth_mhz,
-            spreading_factor=spreading_factor,
-            processing_gain_db=processing_gain_db,
+        return cls.from_csv_columns({name: (value,) for name, value in row.items()})[0]
+
+    @classmethod
+    def from_csv_columns(cls, columns: dict[str, Sequence[str]]) -> tuple["MCSEntry", ...]:
+        """
+        Create MCSEntries from CSV data laid out column by column.
+
+        Each column is converted in one pass (e.g. ``map(float, ...)``) rather
+        than looking fields up per row.
+
+        Args:
+            columns: Column name -> cell strings, all columns the same length
+
+        Returns:
+            One MCSEntry per row, in file order
+        """
+        num_rows = len(columns["mcs_index"])
+
+        def optional(name: str, convert: Callable[[str], float]) -> list[float | None]:
+            # Optional columns: absent or empty cells become None
+            values = columns.get(name)
+            if values is None:
+                return [None] * num_rows
+            return [convert(v) if v else None for v in values]
+
+        modulations = [sys.intern(m.lower()) for m in columns["modulation"]]
+        bits_for = MODULATION_BITS.get
+        # An explicit bits_per_symbol column wins; otherwise (or for empty
+        # cells) derive it from the modulation
+        bits_column = columns.get("bits_per_symbol")
+        if bits_column is None:
+            bits_per_symbol = [bits_for(m, 6) for m in modulations]
+        else:
+            bits_per_symbol = [
+                int(b) if b else bits_for(m, 6)
+                for b, m in zip(bits_column, modulations, strict=True)
+            ]
+        fec_types = columns.get("fec_type") or ("ldpc",) * num_rows
+
+        return tuple(
+            cls(*fields)
+            for fields in zip(
+                map(int, columns["mcs_index"]),
+                modulations,
+                map(float, columns["code_rate"]),
+                map(float, columns["min_snr_db"]),
+                (f.lower() for f in fec_types),
+                bits_per_symbol,
+                optional("bandwidth_mhz", float),
+                # Spread spectrum columns (future)
+                optional("spreading_factor", int),
+                optional("processing_gain_db", float),
+                strict=True,
+            )
         )
 
 
+@lru_cache(maxsize=32)
+def _load_csv_entries(path_str: str, mtime_ns: int) -> tuple[MCSEntry, ...]:
+    """Parse an MCS table CSV into entries, cached per path and mtime.
+
+    The modification time is part of the key so an edited file is re-read.
+    Entries are frozen, so the cached tuple is safely shared by every table
+    built from it.
+    """
+    with open(path_str, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Skip blank lines, pad short rows and drop cells beyond the header,
+        # as csv.DictReader would
+        width = len(header)
+        rows = [row[:width] + [""] * (width - len(row)) for row in reader if row]
+
+    entries = (
+        MCSEntry.from_csv_columns(dict(zip(header, zip(*rows, strict=True), strict=True)))
+        if rows
+        else ()
+    )
+
+    logger.info(f"Loaded MCS table with {len(entries)} entries from {path_str}")
+    return entries
+
+
 class MCSTable:
     """MCS lookup table with SNR-based selection."""
 
     DEFAULT_HYSTERESIS_DB = 2.0
 
-    def __init__(self, entries: list[MCSEntry], hysteresis_db: float = 2.0):
+    def __init__(self, entries: Sequence[MCSEntry], hysteresis_db: float = 2.0):
         """
         Initialize MCS table.
 
         Args:
-            entries: List of MCS entries (will be sorted by min_snr_db ascending)
+            entries: MCS entries (sorted by min_snr_db ascending if not already)
             hysteresis_db: SNR hysteresis for stable MCS selection
         """
-        self.entries = sorted(entries, key=lambda e: e.min_snr_db)
+        if not entries:
+            raise ValueError("MCS table must have at least one entry")
+        # -1 is the "no current MCS" sentinel in the per-link hysteresis state
+        negative = [e.mcs_index for e in entries if e.mcs_index < 0]
+        if negative:
+            raise ValueError(f"MCS indices must be non-negative, got {negative}")
+
+        # One pass collects the thresholds and checks the order; tables loaded
+        # from CSV are usually sorted already, so the sort is normally skipped.
+        # Thresholds are kept as a contiguous C double array for bisect-based
+        # selection; the min_snr_db column below is a zero-copy NumPy view of
+        # the same buffer.
+        thresholds = array("d", (e.min_snr_db for e in entries))
+        if any(a > b for a, b in pairwise(thresholds)):
+            entries = sorted(entries, key=lambda e: e.min_snr_db)
+            thresholds = array("d", (e.min_snr_db for e in entries))
+        self.entries = tuple(entries)
+        self._snr_thresholds = thresholds
         self.hysteresis_db = hysteresis_db
-        self._current_mcs: dict[str, int] = {}  # Track current MCS per link
 
-        if not self.entries:
-            raise ValueError("MCS table must have at least one entry")
+        # Per-link hysteresis state: each link_id is interned to a small int
+        # slot, and the current MCS index per slot lives in a compact array
+        # (-1 = no history). Hot callers can resolve the slot once with
+        # link_idx() and call select_mcs_by_link_idx() directly.
+        self._link_ids: dict[str, int] = {}
+        self._link_current = array("h")
+
+        # Read-only columnar (structure-of-arrays) view of entries, row i
+        # matching entries[i]. Vectorized paths read these contiguous arrays
+        # instead of chasing MCSEntry attributes.
+        self.min_snr_db = np.frombuffer(self._snr_thresholds, dtype=np.float64)
+        self.min_snr_db.setflags(write=False)
+        self.mcs_index = self._column([e.mcs_index for e in self.entries], np.int16)
+        self.code_rate = self._column([e.code_rate for e in self.entries], np.float32)
+        self.bits_per_symbol = self._column(
+            [e.bits_per_symbol for e in self.entries], np.int8
+        )
+        # min_snr_db by mcs_index (NaN where no entry), for vectorized hysteresis
+        threshold_by_index = np.full(max(e.mcs_index for e in self.entries) + 1, np.nan)
+        for entry in reversed(self.entries):
+            threshold_by_index[entry.mcs_index] = entry.min_snr_db
+        self._threshold_by_index = threshold_by_index
+
+        # First entry wins on duplicate indices, as with the previous linear scan
+        self._by_index = {e.mcs_index: e for e in reversed(self.entries)}
+
+    @staticmethod
+    def _column(values: Sequence[float], dtype: npt.DTypeLike) -> np.ndarray:
+        """Build a read-only NumPy column from per-entry values."""
+        column = np.array(values, dtype=dtype)
+        column.setflags(write=False)
+        return column
 
     def reset_hysteresis(self) -> None:
         """Clear per-link MCS hysteresis history."""
-        self._current_mcs.clear()
+        self.reset_all_link_states()
+
+    def link_idx(self, link_id: str) -> int:
+        """
+        Return the hysteresis slot for a link, assigning one on first sight.
+
+        Slots stay valid for the lifetime of the table (resets only clear
+        their history), so callers may cache them.
+        """
+        idx = self._link_ids.get(link_id)
+        if idx is None:
+            idx = self._link_ids[link_id] = len(self._link_current)
+            self._link_current.append(-1)
+        return idx
 
     @classmethod
     def from_csv(cls, csv_path: str | Path, hysteresis_db: float = 2.0) -> "MCSTable":
         """
         Load MCS table from CSV file.
 
+        Parsed entries are cached per (path, mtime), so loading the same file
+        again only builds a new table (with its own hysteresis state).
+
         Args:
             csv_path: Path to CSV file
             hysteresis_db: SNR hysteresis value
@@ -111,13 +244,7 @@ class MCSTable:
         if not path.exists():
             raise FileNotFoundError(f"MCS table not found: {csv_path}")
 
-        entries = []
-        with open(path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                entries.append(MCSEntry.from_csv_row(row))
-
-        logger.info(f"Loaded MCS table with {len(entries)} entries from {csv_path}")
+        entries = _load_csv_entries(str(path.resolve()), path.stat().st_mtime_ns)
         return cls(entries, hysteresis_db)
 
     def select_mcs(
@@ -145,18 +272,40 @@ class MCSTable:
         Returns:
             Selected MCSEntry
         """
-        # Find highest MCS where SNR >= min_snr_db
-        selected = self.entries[0]  # Default to lowest MCS
+        if link_id:
+            return self.select_mcs_by_link_idx(snr_db, self.link_idx(link_id))
+
+        return self.entries[self._threshold_position(snr_db)]
+
+    def _threshold_position(self, snr_db: float) -> int:
+        """Position of the highest entry whose min_snr_db the SNR meets.
+
+        Falls back to the lowest entry when the SNR is below every threshold
+        or NaN (bisect would otherwise place NaN after every threshold).
+        """
+        if math.isnan(snr_db):
+            return 0
+        return max(bisect_right(self._snr_thresholds, snr_db) - 1, 0)
 
-        for entry in self.entries:
-            if snr_db >= entry.min_snr_db:
-                selected = entry
-            else:
-                break
+    def select_mcs_by_link_idx(self, snr_db: float, link_idx: int) -> MCSEntry:
+        """
+        Select MCS with hysteresis for a link identified by its slot.
+
+        Same as select_mcs(snr_db, link_id) with link_idx = link_idx(link_id),
+        minus the link_id lookup.
+
+        Args:
+            snr_db: Current SNR in dB
+            link_idx: Hysteresis slot from link_idx()
+
+        Returns:
+            Selected MCSEntry
+        """
+        selected = self.entries[self._threshold_position(snr_db)]
 
         # Apply hysteresis if we have history for this link
-        if link_id and link_id in self._current_mcs:
-            current_idx = self._current_mcs[link_id]
+        current_idx = self._link_current[link_idx]
+        if current_idx != -1:
             new_idx = selected.mcs_index
 
             if new_idx > current_idx:
@@ -177,26 +326,96 @@ class MCSTable:
                     # SNR still within margin, stay at current MCS
                     selected = current_entry
 
-        if link_id:
-            self._current_mcs[link_id] = selected.mcs_index
+        self._link_current[link_idx] = selected.mcs_index
+
+        return selected
+
+    def select_mcs_batch(self, snr_db: np.ndarray) -> np.ndarray:
+        """
+        Select MCS for many links at once (vectorized, no hysteresis).
+
+        Equivalent to ``select_mcs(snr).mcs_index`` for each element without a
+        link_id, but computed with a single np.searchsorted call.
+
+        Args:
+            snr_db: Array of SNR values in dB (any shape)
+
+        Returns:
+            Array of selected MCS indices with the same shape as snr_db. Use
+            get_by_index() to look up the MCSEntry objects when needed.
+        """
+        return self.mcs_index[self._threshold_positions(snr_db)]
+
+    def _threshold_positions(self, snr_db: np.ndarray) -> np.ndarray:
+        """Vectorized _threshold_position: NaN maps to the lowest entry."""
+        pos = np.clip(np.searchsorted(self.min_snr_db, snr_db, side="right") - 1, 0, len(self) - 1)
+        return np.where(np.isnan(snr_db), 0, pos)
+
+    def select_mcs_batch_by_link_idx(
+        self, snr_db: np.ndarray, link_idx: np.ndarray
+    ) -> np.ndarray:
+        """
+        Select MCS with hysteresis for many links at once (vectorized).
+
+        Equivalent to calling select_mcs_by_link_idx() for each (snr, slot)
+        pair, but the threshold search and the upgrade/downgrade rules run as
+        whole-array NumPy operations. Intended for per-tick updates of many
+        links. Each slot must appear at most once per call.
+
+        Args:
+            snr_db: 1-D array of SNR values in dB
+            link_idx: 1-D array of hysteresis slots from link_idx(), same length
+
+        Returns:
+            Array of selected MCS indices, one per link
+        """
+        snr_db = np.asarray(snr_db, dtype=np.float64)
+        link_idx = np.asarray(link_idx, dtype=np.intp)
+
+        pos = self._threshold_positions(snr_db)
+        selected = self.mcs_index[pos].astype(np.int16)
+
+        # Zero-copy view of the per-slot state; released before returning (even
+        # on error) so link_idx() can still grow the array afterwards
+        state = np.frombuffer(self._link_current, dtype=np.int16)
+        try:
+            current = state[link_idx]
+            has_history = current != -1
+
+            # UPGRADE: stay unless SNR clears the new threshold by the margin
+            hold_upgrade = (
+                has_history
+                & (selected > current)
+                & (snr_db < self.min_snr_db[pos] + self.hysteresis_db)
+            )
+            # DOWNGRADE: stay while SNR is within the margin below the current threshold
+            current_threshold = self._threshold_by_index[np.where(has_history, current, 0)]
+            hold_downgrade = (
+                has_history
+                & (selected < current)
+                & (snr_db >= current_threshold - self.hysteresis_db)
+            )
+
+            selected = np.where(hold_upgrade | hold_downgrade, current, selected)
+            state[link_idx] = selected
+        finally:
+            del state
 
         return selected
 
     def get_by_index(self, mcs_index: int) -> Optional[MCSEntry]:
         """Get MCS entry by index."""
-        for entry in self.entries:
-            if entry.mcs_index == mcs_index:
-                return entry
-        return None
+        return self._by_index.get(mcs_index)
 
     def reset_link_state(self, link_id: str) -> None:
         """Reset hysteresis state for a link."""
-        if link_id in self._current_mcs:
-            del self._current_mcs[link_id]
+        idx = self._link_ids.get(link_id)
+        if idx is not None:
+            self._link_current[idx] = -1
 
     def reset_all_link_states(self) -> None:
         """Reset hysteresis state for all links."""
-        self._current_mcs.clear()
+        self._link_current = array("h", [-1]) * len(self._link_current)
 
     @property
     def max_mcs(self) -> MCSEntry:
@@ -210,7 +429,7 @@ class MCSTable:
 
     def __len__(self) -> int:
         """Return number of MCS entries."""
-        return len(self.entries)
+        return len(self.min_snr_db)
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -711,8 +711,7 @@ def _run_single_path(
         polarization=link.polarization,
     )
 
-    path_result = engine.compute_paths()
-    path_details = engine.get_path_details()
+    path_result, path_details = engine.compute_paths_with_details()
 
     path_cache.store(
         tx_node=link.tx_node,
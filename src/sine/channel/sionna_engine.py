@@ -44,6 +44,57 @@ def get_sionna_import_error() -> Optional[str]:
     return _sionna_import_error
 
 
+def _delay_statistics(
+    valid_taus: np.ndarray, valid_powers: np.ndarray
+) -> tuple[float, float, float]:
+    """
+    Delay statistics of the valid paths of one link.
+
+    Args:
+        valid_taus: Path delays in seconds
+        valid_powers: Path powers |a|^2 (linear), used as RMS delay spread weights
+
+    Returns:
+        (min_delay_ns, max_delay_ns, delay_spread_ns), all zero when there are no paths
+    """
+    if len(valid_taus) == 0:
+        return 0.0, 0.0, 0.0
+
+    min_delay_ns = float(np.min(valid_taus) * 1e9)
+    max_delay_ns = float(np.max(valid_taus) * 1e9)
+
+    # Compute RMS delay spread (second moment of power delay profile)
+    # Note: For single-path channels, delay spread is zero by definition
+    if len(valid_taus) > 1:
+        mean_delay = np.average(valid_taus, weights=valid_powers)
+        delay_variance = np.average((valid_taus - mean_delay) ** 2, weights=valid_powers)
+        delay_spread_ns = float(np.sqrt(delay_variance) * 1e9)
+    else:
+        # Single path - no multipath dispersion
+        delay_spread_ns = 0.0
+
+    return min_delay_ns, max_delay_ns, delay_spread_ns
+
+
+def _path_type_from_interactions(path_interactions: np.ndarray) -> str:
+    """
+    Classify a path from its Sionna RT interaction codes.
+
+    Args:
+        path_interactions: Interaction code per bounce of one path (0 = none,
+            3 = diffraction)
+
+    Returns:
+        "los" with no interactions, "diffraction" if any bounce diffracts,
+        otherwise "nlos" (reflections, scattering, etc.)
+    """
+    if np.all(path_interactions == 0):
+        return "los"
+    if np.any(path_interactions == 3):
+        return "diffraction"
+    return "nlos"
+
+
 @dataclass
 class SinglePathInfo:
     """Information about a single propagation path."""
@@ -139,6 +190,10 @@ class ChannelEngine(ABC):
     @abstractmethod
     def get_path_details(self) -> "PathDetails": ...
 
+    def compute_paths_with_details(self) -> tuple["PathResult", "PathDetails"]:
+        """Compute the PathResult and PathDetails of the current link."""
+        return self.compute_paths(), self.get_path_details()
+
     @abstractmethod
     def clear_devices(self) -> None: ...
 
@@ -173,6 +228,31 @@ class SionnaEngine(ChannelEngine):
         self._scene_loaded = False
         self._transmitters: dict[str, tuple[float, float, float]] = {}
         self._receivers: dict[str, tuple[float, float, float]] = {}
+        # Keyword overrides for PathSolver calls (empty = Sionna defaults)
+        self._solver_kwargs: dict[str, int] = {}
+
+    def configure_solver(
+        self,
+        max_depth: Optional[int] = None,
+        samples_per_src: Optional[int] = None,
+    ) -> None:
+        """
+        Override PathSolver settings for subsequent traces.
+
+        Ray sample count dominates trace time. Scenes where only the direct
+        path matters (e.g. free space) can use a shallow depth and far fewer
+        samples without changing the result.
+
+        Args:
+            max_depth: Maximum number of interactions per path (None = Sionna default)
+            samples_per_src: Rays shot per transmitter (None = Sionna default)
+        """
+        overrides = {"max_depth": max_depth, "samples_per_src": samples_per_src}
+        self._solver_kwargs = {k: v for k, v in overrides.items() if v is not None}
+
+    def _trace_paths(self):
+        """Run PathSolver on the current scene and devices."""
+        return self.path_solver(self.scene, **self._solver_kwargs)
 
     def load_scene(
         self,
@@ -308,8 +388,38 @@ class SionnaEngine(ChannelEngine):
             raise RuntimeError("At least one transmitter and receiver must be added")
 
         # Compute paths using PathSolver (Sionna 1.2+ API)
-        paths = self.path_solver(self.scene)
+        return self._path_result(self._trace_paths())
+
+    def compute_paths_with_details(self) -> tuple[PathResult, PathDetails]:
+        """
+        Compute the PathResult and PathDetails of the current link from one ray trace.
+
+        Equivalent to compute_paths() followed by get_path_details(), but
+        PathSolver runs once and its Paths are passed to both extractions
+        instead of being traced twice.
+
+        Returns:
+            (PathResult, PathDetails) for the current devices
+        """
+        if not self._scene_loaded:
+            raise RuntimeError("Scene must be loaded before computing paths")
+
+        if not self._transmitters or not self._receivers:
+            raise RuntimeError("At least one transmitter and receiver must be added")
+
+        paths = self._trace_paths()
+        return self._path_result(paths), self._path_details(paths)
+
+    def _path_result(self, paths) -> PathResult:
+        """
+        Summarize traced paths as a PathResult.
+
+        Args:
+            paths: Sionna Paths from _trace_paths()
 
+        Returns:
+            PathResult with path loss, delays, and path information
+        """
         # Get channel impulse response
         # Sionna v1.2.1 cir() with out_type='numpy' returns:
         # - a: np.array (complex) with shape [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_steps]
@@ -376,23 +486,7 @@ class SionnaEngine(ChannelEngine):
         valid_taus = tau_np.flatten()[valid_mask]
         valid_powers = path_powers.flatten()[valid_mask]
 
-        if len(valid_taus) > 0:
-            min_delay_ns = float(np.min(valid_taus) * 1e9)
-            max_delay_ns = float(np.max(valid_taus) * 1e9)
-
-            # Compute RMS delay spread (second moment of power delay profile)
-            # Note: For single-path channels, delay spread is zero by definition
-            if len(valid_taus) > 1:
-                mean_delay = np.average(valid_taus, weights=valid_powers)
-                delay_variance = np.average((valid_taus - mean_delay) ** 2, weights=valid_powers)
-                delay_spread_ns = float(np.sqrt(delay_variance) * 1e9)
-            else:
-                # Single path - no multipath dispersion
-                delay_spread_ns = 0.0
-        else:
-            min_delay_ns = 0.0
-            max_delay_ns = 0.0
-            delay_spread_ns = 0.0
+        min_delay_ns, max_delay_ns, delay_spread_ns = _delay_statistics(valid_taus, valid_powers)
 
         # Validate OFDM operating assumptions (WiFi 6 target)
         # These warnings help users understand when SiNE's channel model may be invalid
@@ -414,13 +508,7 @@ class SionnaEngine(ChannelEngine):
             # Get interactions for strongest path (first rx/tx antenna pair)
             path_interactions = interactions[:, 0, 0, 0, 0, strongest_idx]
 
-            # Check interaction types
-            if np.all(path_interactions == 0):
-                dominant_path_type = "los"  # No interactions = line of sight
-            elif np.any(path_interactions == 3):
-                dominant_path_type = "diffraction"  # Diffraction present
-            else:
-                dominant_path_type = "nlos"  # Reflections, scattering, etc.
+            dominant_path_type = _path_type_from_interactions(path_interactions)
         except (AttributeError, IndexError, Exception):
             # Fallback heuristic: short delay likely indicates LOS
             # Use 10 ns threshold (~3m indoor, reasonable for LOS detection)
@@ -438,6 +526,113 @@ class SionnaEngine(ChannelEngine):
             dominant_path_type=dominant_path_type,
         )
 
+    def compute_link_paths(self) -> dict[tuple[str, str], PathResult]:
+        """
+        Compute a PathResult for every transmitter/receiver pair from a single ray trace.
+
+        compute_paths() describes one link. Here all transmitters and receivers
+        are traced together (one PathSolver call) and the CIR is split per
+        (transmitter, receiver) pair, using the same incoherent summation and
+        delay statistics as compute_paths(). Useful when many links share one
+        scene, e.g. all interference links of a topology.
+
+        The dominant path type comes from the interactions of each link's
+        strongest path, as in compute_paths(), falling back to its delay
+        heuristic (LOS when the first path arrives within 10 ns) when Sionna
+        provides no interaction data.
+
+        Returns:
+            (transmitter name, receiver name) -> PathResult (200 dB path loss
+            and dominant_path_type "none" when the pair has no valid path).
+            Pairs whose transmitter and receiver share a position are omitted.
+        """
+        if not self._scene_loaded:
+            raise RuntimeError("Scene must be loaded before computing paths")
+
+        if not self._transmitters or not self._receivers:
+            raise RuntimeError("At least one transmitter and receiver must be added")
+
+        paths = self._trace_paths()
+        cir_result = paths.cir(out_type='numpy')
+        if isinstance(cir_result, tuple) and len(cir_result) == 2:
+            a_np, tau_np = cir_result
+        else:
+            raise ValueError(f"Unexpected CIR result format: {type(cir_result)}")
+
+        if isinstance(a_np, tuple) and len(a_np) == 2:
+            a_np = a_np[0] + 1j * a_np[1]
+
+        # interactions: [max_depth, num_rx, num_tx, num_paths] (synthetic_array=True)
+        # or [max_depth, num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths]
+        try:
+            interactions = paths.interactions.numpy()
+        except Exception as e:
+            logger.debug(f"Could not get path interactions: {e}")
+            interactions = None
+
+        # a: [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_steps]
+        # tau: [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths] or [num_rx, num_tx, num_paths]
+        per_antenna_tau = tau_np.ndim == a_np.ndim - 1
+
+        results = {}
+        for rx_idx, rx_name in enumerate(self.scene.receivers):
+            for tx_idx, tx_name in enumerate(self.scene.transmitters):
+                # A device that is both transmitter and receiver (e.g. a node
+                # hearing the others) has a zero-distance pair with itself;
+                # it is not a link, so no result is reported for it
+                if tuple(self._transmitters[tx_name]) == tuple(self._receivers[rx_name]):
+                    continue
+
+                a_link = a_np[rx_idx, :, tx_idx]
+                tau_link = tau_np[rx_idx, :, tx_idx] if per_antenna_tau else tau_np[rx_idx, tx_idx]
+
+                # Delays are per path, amplitudes per path and time step
+                path_powers = np.abs(a_link) ** 2
+                valid_mask = np.abs(a_link) > 1e-10
+                num_valid_paths = int(np.sum(valid_mask))
+                if num_valid_paths == 0:
+                    results[(tx_name, rx_name)] = PathResult(
+                        path_loss_db=200.0,
+                        min_delay_ns=0.0,
+                        max_delay_ns=0.0,
+                        delay_spread_ns=0.0,
+                        num_paths=0,
+                        dominant_path_type="none",
+                    )
+                    continue
+
+                valid_taus = np.broadcast_to(tau_link[..., np.newaxis], a_link.shape)[valid_mask]
+                min_delay_ns, max_delay_ns, delay_spread_ns = _delay_statistics(
+                    valid_taus, path_powers[valid_mask]
+                )
+
+                # Classify by the strongest path's interactions
+                rx_ant, tx_ant, path_idx = np.unravel_index(
+                    np.argmax(path_powers), path_powers.shape
+                )[:3]
+                try:
+                    if interactions.ndim == 4:
+                        path_interactions = interactions[:, rx_idx, tx_idx, path_idx]
+                    else:
+                        path_interactions = interactions[
+                            :, rx_idx, rx_ant, tx_idx, tx_ant, path_idx
+                        ]
+                    dominant_path_type = _path_type_from_interactions(path_interactions)
+                except (AttributeError, IndexError):
+                    # No interaction data: short delay likely indicates LOS
+                    dominant_path_type = "los" if min_delay_ns < 10.0 else "nlos"
+
+                results[(tx_name, rx_name)] = PathResult(
+                    path_loss_db=float(-10 * np.log10(np.sum(path_powers) + 1e-30)),
+                    min_delay_ns=min_delay_ns,
+                    max_delay_ns=max_delay_ns,
+                    delay_spread_ns=delay_spread_ns,
+                    num_paths=num_valid_paths,
+                    dominant_path_type=dominant_path_type,
+                )
+
+        return results
+
     def get_path_details(self) -> PathDetails:
         """
         Get detailed information about all propagation paths for debugging.
@@ -452,9 +647,18 @@ class SionnaEngine(ChannelEngine):
         if not self._transmitters or not self._receivers:
             raise RuntimeError("At least one transmitter and receiver must be added")
 
-        # Compute paths using PathSolver
-        paths = self.path_solver(self.scene)
+        return self._path_details(self._trace_paths())
+
+    def _path_details(self, paths) -> PathDetails:
+        """
+        Extract per-path debugging information from traced paths.
+
+        Args:
+            paths: Sionna Paths from _trace_paths()
 
+        Returns:
+            PathDetails for the first transmitter/receiver pair
+        """
         # Get CIR for power/delay info
         cir_result = paths.cir(out_type='numpy')
         if isinstance(cir_result, tuple) and len(cir_result) == 2:
@@ -704,7 +908,7 @@ class SionnaEngine(ChannelEngine):
         paths = None
         if include_paths and self._transmitters and self._receivers:
             try:
-                paths = self.path_solver(self.scene)
+                paths = self._trace_paths()
                 logger.info(f"Computed propagation paths for rendering")
             except Exception as e:
                 logger.warning(f"Could not compute paths for rendering: {e}")
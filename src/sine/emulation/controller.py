@@ -208,21 +208,25 @@ class EmulationController:
         """Stop the emulation."""
         logger.info("Stopping emulation")
 
+        await self.stop_control_loop()
+
+        # Destroy containers
+        if self.clab_manager:
+            self.clab_manager.destroy()
+
+        logger.info("Emulation stopped")
+
+    async def stop_control_loop(self) -> None:
+        """Stop control polling but leave the deployed containers running."""
         self._running = False
 
-        # Cancel control polling
         if self._control_task:
             self._control_task.cancel()
             try:
                 await self._control_task
             except asyncio.CancelledError:
                 pass
-
-        # Destroy containers
-        if self.clab_manager:
-            self.clab_manager.destroy()
-
-        logger.info("Emulation stopped")
+            self._control_task = None
 
     def _has_wireless_links(self) -> bool:
         """Check if topology has any wireless links (P2P or shared bridge)."""
@@ -339,34 +343,24 @@ class EmulationController:
         results = []
         if link_requests:
             scene_config = self.config.topology.scene
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                endpoint = (
-                    "/compute/links_sinr"
-                    if self.config.topology.enable_sinr
-                    else "/compute/links_snr"
-                )
-                response = await client.post(
-                    f"{self.channel_server_url}{endpoint}",
-                    json={
-                        "scene": {
-                            "scene_file": scene_config.file,
-                            "frequency_hz": link_requests[0][
-                                "frequency_hz"
-                            ],
-                            "bandwidth_hz": link_requests[0][
-                                "bandwidth_hz"
-                            ],
-                        },
-                        "links": link_requests,
-                        "active_states": self._build_active_states_dict(),
+            endpoint = (
+                "/compute/links_sinr"
+                if self.config.topology.enable_sinr
+                else "/compute/links_snr"
+            )
+            response_data = await self._compute_links(
+                endpoint,
+                {
+                    "scene": {
+                        "scene_file": scene_config.file,
+                        "frequency_hz": link_requests[0]["frequency_hz"],
+                        "bandwidth_hz": link_requests[0]["bandwidth_hz"],
                     },
-                )
-                if response.status_code != 200:
-                    logger.error(
-                        f"Channel server error: {response.text}"
-                    )
-                response.raise_for_status()
-                results = response.json()["results"]
+                    "links": link_requests,
+                    "active_states": self._build_active_states_dict(),
+                },
+            )
+            results = response_data["results"]
 
         logger.info(f"Computed {len(results)} cross-node link conditions")
 
@@ -458,11 +452,21 @@ class EmulationController:
             bridge_ifaces, per_iface_config, ip_map
         )
 
-        # 6. Apply per-destination netem to all (node, interface) pairs
+        # 6. Apply per-destination netem to all (node, interface) pairs.
+        #    Each interface is an independent sudo/nsenter/tc subprocess in its
+        #    own namespace, so run them concurrently in worker threads rather
+        #    than blocking the event loop on each one in turn.
         configurator = SharedNetemConfigurator(self.clab_manager)
 
-        for (node_name, iface_name), config in per_iface_config.items():
-            success = configurator.apply_per_destination_netem(config)
+        iface_configs = list(per_iface_config.items())
+        successes = await asyncio.gather(
+            *(
+                asyncio.to_thread(configurator.apply_per_destination_netem, config)
+                for _, config in iface_configs
+            )
+        )
+
+        for ((node_name, iface_name), _), success in zip(iface_configs, successes, strict=True):
             if not success:
                 logger.error(
                     f"Failed to apply per-dest netem to "
@@ -652,6 +656,27 @@ class EmulationController:
         else:
             return 45.0  # Orthogonal
 
+    async def _compute_links(self, endpoint: str, payload: dict) -> dict:
+        """
+        Run a batch link computation on the channel server.
+
+        Args:
+            endpoint: Channel server endpoint (e.g., "/compute/links_snr")
+            payload: JSON request body
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            httpx.HTTPStatusError: If the channel server returns an error
+        """
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            response = await client.post(f"{self.channel_server_url}{endpoint}", json=payload)
+            if response.status_code != 200:
+                logger.error(f"Channel server error: {response.text}")
+            response.raise_for_status()
+            return response.json()
+
     async def _update_all_links(self) -> None:
         """Update channel conditions for all links (point-to-point or shared bridge)."""
         # Detect shared bridge mode
@@ -743,26 +768,23 @@ class EmulationController:
         # Send batch request to channel server
         scene_config = self.config.topology.scene
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            endpoint = (
-                "/compute/links_sinr"
-                if self.config.topology.enable_sinr
-                else "/compute/links_snr"
-            )
-            response = await client.post(
-                f"{self.channel_server_url}{endpoint}",
-                json={
-                    "scene": {
-                        "scene_file": scene_config.file,
-                        "frequency_hz": link_requests[0]["frequency_hz"],
-                        "bandwidth_hz": link_requests[0]["bandwidth_hz"],
-                    },
-                    "links": link_requests,
-                    "active_states": self._build_active_states_dict(),
+        endpoint = (
+            "/compute/links_sinr"
+            if self.config.topology.enable_sinr
+            else "/compute/links_snr"
+        )
+        results = await self._compute_links(
+            endpoint,
+            {
+                "scene": {
+                    "scene_file": scene_config.file,
+                    "frequency_hz": link_requests[0]["frequency_hz"],
+                    "bandwidth_hz": link_requests[0]["bandwidth_hz"],
                 },
-            )
-            response.raise_for_status()
-            results = response.json()
+                "links": link_requests,
+                "active_states": self._build_active_states_dict(),
+            },
+        )
 
         # Apply netem configurations
         # Note: TDMA throughput multiplier already applied by channel server
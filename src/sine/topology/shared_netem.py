@@ -84,12 +84,6 @@ class SharedNetemConfigurator:
             return False
 
         interface = config.interface
-
-        # IMPORTANT: Remove any existing tc configuration first (idempotency)
-        # This prevents "RTNETLINK answers: File exists" errors when redeploying
-        logger.debug(f"Removing any existing tc configuration on {config.node}:{interface}")
-        self._remove_tc_config_silent(pid, interface)
-
         commands = self._generate_tc_commands(config)
 
         logger.info(
@@ -97,22 +91,33 @@ class SharedNetemConfigurator:
             f"({len(config.dest_params)} destinations)"
         )
 
-        # Execute all commands in container namespace
-        for cmd in commands:
-            try:
-                subprocess.run(
-                    ["sudo", "nsenter", "-t", str(pid), "-n", "sh", "-c", cmd],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                logger.debug(f"  ✓ {cmd[:60]}...")
-            except subprocess.CalledProcessError as e:
-                logger.error(
-                    f"Failed to apply tc command on {config.node}:{interface}: {cmd}"
-                )
-                logger.error(f"  Error: {e.stderr}")
-                return False
+        # IMPORTANT: Remove any existing tc configuration first (idempotency)
+        # This prevents "RTNETLINK answers: File exists" errors when redeploying.
+        # The removal is best-effort (no existing config is fine), and runs in
+        # the same namespace entry as the batch so each interface costs a
+        # single sudo/nsenter invocation.
+        script = f"tc qdisc del dev {interface} root 2>/dev/null; exec tc -batch -"
+
+        # Execute all commands in one `tc -batch` run inside the container
+        # namespace. This keeps a single netlink socket open instead of paying
+        # a sudo/nsenter/tc fork-exec per qdisc, class and filter.
+        batch = "\n".join(cmd.removeprefix("tc ") for cmd in commands) + "\n"
+        try:
+            subprocess.run(
+                ["sudo", "nsenter", "-t", str(pid), "-n", "sh", "-c", script],
+                input=batch,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            logger.debug(f"  ✓ {len(commands)} tc commands applied in batch")
+        except subprocess.CalledProcessError as e:
+            logger.error(
+                f"Failed to apply tc batch on {config.node}:{interface} "
+                f"({len(commands)} commands)"
+            )
+            logger.error(f"  Error: {e.stderr}")
+            return False
 
         logger.info(
             f"Successfully configured per-destination netem on {config.node}:{interface}"
@@ -193,40 +198,6 @@ class SharedNetemConfigurator:
 
         return commands
 
-    def _remove_tc_config_silent(self, pid: int, interface: str) -> None:
-        """
-        Remove tc configuration without logging errors (for idempotent cleanup).
-
-        This is used before applying new tc rules to ensure a clean slate.
-        Errors are suppressed since we don't care if there's no existing config.
-
-        Args:
-            pid: Container PID
-            interface: Interface name
-        """
-        try:
-            subprocess.run(
-                [
-                    "sudo",
-                    "nsenter",
-                    "-t",
-                    str(pid),
-                    "-n",
-                    "tc",
-                    "qdisc",
-                    "del",
-                    "dev",
-                    interface,
-                    "root",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,  # Don't raise on error
-            )
-        except Exception:
-            # Silently ignore all errors - this is best-effort cleanup
-            pass
-
     def remove_per_destination_netem(self, node: str, interface: str) -> bool:
         """
         Remove per-destination netem configuration from interface.
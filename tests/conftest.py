@@ -2,13 +2,24 @@
 
 This file provides shared fixtures available to all test files.
 Fixtures are automatically discovered by pytest - no imports needed.
+
+Temporary files (tempfile.* and pytest's tmp_path) are placed on the
+/dev/shm ramdisk when it is available and TMPDIR is not already set, so
+generated topology YAMLs never wait on disk writes. Set TMPDIR explicitly
+to override; systems without /dev/shm (e.g., macOS) keep the default.
 """
 
+import os
+import tempfile
+
 import pytest
 from pathlib import Path
 
+# Ramdisk used for temporary test files when available
+RAMDISK_TMPDIR = "/dev/shm"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory.
 
@@ -19,6 +30,23 @@ def project_root() -> Path:
     return Path(__file__).parent.parent
 
 
+@pytest.fixture(scope="session", autouse=True)
+def ramdisk_tmpdir():
+    """Root temporary files on /dev/shm for the whole session.
+
+    No-op if TMPDIR is already set or /dev/shm is missing or not writable.
+    """
+    if "TMPDIR" in os.environ or not os.access(RAMDISK_TMPDIR, os.W_OK):
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TMPDIR", RAMDISK_TMPDIR)
+        # tempfile caches its directory on first use; force re-evaluation
+        mp.setattr(tempfile, "tempdir", None)
+        yield
+
+
 @pytest.fixture
 def examples_dir(project_root: Path) -> Path:
     """Return the examples directory.
@@ -58,6 +86,46 @@ def fixtures_dir() -> Path:
     return Path(__file__).parent / "fixtures"
 
 
+def pytest_addoption(parser):
+    """Add command-line options."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="Run tests marked slow or very_slow (skipped by default)",
+    )
+    parser.addoption(
+        "--persist-paths",
+        action="store_true",
+        default=False,
+        help=(
+            "Reuse InterferenceEngine path results from earlier runs via the "
+            "pytest cache (clear with --cache-clear after engine changes)"
+        ),
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow and very_slow tests unless --runslow is given.
+
+    Also pins every sionna-marked test to the "gpu" xdist group, so under
+    `pytest -n auto --dist loadgroup` GPU tests run serially on one worker
+    (concurrent Sionna runs contend for the single GPU) while CPU-only tests
+    spread across the others. Without pytest-xdist the group is inert.
+    """
+    gpu_serial = pytest.mark.xdist_group("gpu")
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    runslow = config.getoption("--runslow")
+
+    for item in items:
+        if item.get_closest_marker("sionna"):
+            item.add_marker(gpu_serial)
+        if not runslow and (
+            item.get_closest_marker("slow") or item.get_closest_marker("very_slow")
+        ):
+            item.add_marker(skip_slow)
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line(
@@ -9,7 +9,7 @@ def examples_for_user(project_root: Path) -> Path:
     return project_root / "examples" / "for_user"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def examples_for_tests(project_root: Path) -> Path:
     """Return examples/for_tests directory (flat structure).
 
@@ -19,6 +19,32 @@ def examples_for_tests(project_root: Path) -> Path:
     return project_root / "examples" / "for_tests"
 
 
+@pytest.fixture(scope="session")
+def shared_bridge_yaml(examples_for_tests: Path) -> Path:
+    """Return the equal-triangle shared bridge topology, resolved once.
+
+    Skips every dependent test with one message if the example is missing.
+    """
+    yaml_path = examples_for_tests / "shared_sionna_snr_equal-triangle" / "network.yaml"
+    if not yaml_path.exists():
+        pytest.skip(f"Example not found: {yaml_path}")
+    return yaml_path
+
+
+@pytest.fixture(scope="session")
+def shared_bridge_varied_nf_yaml(examples_for_tests: Path) -> Path:
+    """Return the varied noise figure shared bridge topology, resolved once.
+
+    Skips every dependent test with one message if the example is missing.
+    """
+    yaml_path = (
+        examples_for_tests / "shared_sionna_snr_equal-triangle-varied-nf" / "network.yaml"
+    )
+    if not yaml_path.exists():
+        pytest.skip(f"Example not found: {yaml_path}")
+    return yaml_path
+
+
 @pytest.fixture
 def examples_common(project_root: Path) -> Path:
     """Return examples/common_data directory (shared by for_user and for_tests)."""
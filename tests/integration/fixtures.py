@@ -8,19 +8,46 @@ This module contains:
 Import these in integration test files to avoid duplication.
 """
 
+import asyncio
 import atexit
+import codecs
 import logging
+import os
+import select
 import signal
 import subprocess
+import sys
 import time
 import urllib.error
 import urllib.request
+from contextlib import ExitStack
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 
+from sine.emulation.controller import EmulationController
+
 logger = logging.getLogger(__name__)
 
+# Line printed by `sine deploy` once the emulation is up. Kept as bytes so the
+# deployment output can be scanned in raw chunks without decoding first.
+DEPLOY_READY_MARKER = b"Emulation deployed successfully!"
+
+# Read size for draining deployment stdout (one os.read per pipe chunk)
+_DEPLOY_READ_SIZE = 64 * 1024
+
+# Minimum interval between flushes when echoing subprocess output
+_ECHO_FLUSH_INTERVAL_SEC = 0.1
+
+# iperf3 server port for the shared equal-triangle deployment (not the default
+# 5201, so it cannot collide with per-test servers of other topologies)
+SHARED_BRIDGE_IPERF3_PORT = 5211
+
+# PHY rate of shared_sionna_snr_equal-triangle (64-QAM, 80 MHz, rate-1/2 LDPC):
+# 80 MHz × 6 bits/symbol × 0.5 code_rate × 0.8 efficiency = 192 Mbps
+SHARED_BRIDGE_PHY_RATE_MBPS = 80 * 6 * 0.5 * 0.8
+
 
 # =============================================================================
 # Global cleanup tracking (for Ctrl+C handling)
@@ -213,6 +240,46 @@ def extract_container_prefix(yaml_path: str | Path) -> str:
     return f"{prefix}-{lab_name}"
 
 
+class _RawOutputEcho:
+    """Echo raw subprocess output to stdout with time-based flushing.
+
+    Bytes are written straight to ``sys.stdout.buffer`` instead of being
+    decoded and passed through ``print()`` per line, and flushed at most once
+    per ``_ECHO_FLUSH_INTERVAL_SEC``. When pytest captures stdout the interim
+    flushes are skipped, since the captured output is only read at the end.
+    """
+
+    def __init__(self) -> None:
+        sys.stdout.flush()  # Keep ordering with text printed before the echo
+        self._buffer = getattr(sys.stdout, "buffer", None)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._live = sys.stdout is sys.__stdout__
+        self._last_flush = time.monotonic()
+        self.pending = False
+
+    def write(self, data: bytes) -> None:
+        """Echo a chunk of output, flushing if the interval has elapsed."""
+        if self._buffer is not None:
+            self._buffer.write(data)
+        else:
+            sys.stdout.write(self._decoder.decode(data))
+
+        if not self._live:
+            return
+
+        self.pending = True
+        if time.monotonic() - self._last_flush >= _ECHO_FLUSH_INTERVAL_SEC:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush any echoed output that has not reached the terminal yet."""
+        if self._buffer is not None:
+            self._buffer.flush()
+        sys.stdout.flush()
+        self._last_flush = time.monotonic()
+        self.pending = False
+
+
 def deploy_topology(yaml_path: str, enable_control: bool = False, channel_server_url: str = "http://localhost:8000") -> subprocess.Popen:
     """Deploy a topology using sine deploy command.
 
@@ -251,37 +318,48 @@ def deploy_topology(yaml_path: str, enable_control: bool = False, channel_server
     if enable_control:
         cmd.append("--enable-control")
 
-    # Start deployment in background
+    # Start deployment in background (binary stdout, read in raw chunks)
     process = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
     )
 
     # Wait for deployment to complete (read stdout until success message)
     print("Waiting for deployment to complete...")
     deployment_ready = False
-    output_lines = []  # Capture all output for error reporting
+    output = bytearray()  # Capture all output for error reporting
+    echo = _RawOutputEcho()
 
     # Type assertion: stdout is guaranteed to be available since we passed PIPE
     assert process.stdout is not None, "stdout should not be None when PIPE is used"
+    stdout_fd = process.stdout.fileno()
 
-    for line in process.stdout:
-        output_lines.append(line)
-        print(line, end="")
-        if "Emulation deployed successfully!" in line:
+    while True:
+        if echo.pending:
+            # Flush echoed output if the deployment goes quiet for a full interval
+            readable, _, _ = select.select([stdout_fd], [], [], _ECHO_FLUSH_INTERVAL_SEC)
+            if not readable:
+                echo.flush()
+        chunk = os.read(stdout_fd, _DEPLOY_READ_SIZE)
+        if not chunk:
+            break
+        # Rescan the tail of the previous chunk in case the marker straddles reads
+        search_start = max(0, len(output) - len(DEPLOY_READY_MARKER) + 1)
+        output += chunk
+        echo.write(chunk)
+        if DEPLOY_READY_MARKER in output[search_start:]:
             deployment_ready = True
             break
         if process.poll() is not None:
             # Process exited - capture remaining output and report error
             remaining = process.stdout.read()
             if remaining:
-                output_lines.append(remaining)
-                print(remaining, end="")
+                output += remaining
+                echo.write(remaining)
+            echo.flush()
 
-            full_output = ''.join(output_lines)
+            full_output = output.decode(errors="replace")
             raise RuntimeError(
                 f"Deployment failed (exit code {process.returncode})\n\n"
                 f"{'='*70}\n"
@@ -296,13 +374,14 @@ def deploy_topology(yaml_path: str, enable_control: bool = False, channel_server
         try:
             remaining = process.stdout.read()
             if remaining:
-                output_lines.append(remaining)
-                print(remaining, end="")
+                output += remaining
+                echo.write(remaining)
         except Exception:
             pass
+        echo.flush()
 
         process.terminate()
-        full_output = ''.join(output_lines)
+        full_output = output.decode(errors="replace")
         raise RuntimeError(
             f"Deployment did not complete successfully\n\n"
             f"{'='*70}\n"
@@ -312,6 +391,7 @@ def deploy_topology(yaml_path: str, enable_control: bool = False, channel_server
             f"{'='*70}"
         )
 
+    echo.flush()
     print("\n" + "="*70)
     print("Deployment complete!")
     print("="*70 + "\n")
@@ -361,9 +441,11 @@ def destroy_topology(yaml_path: str) -> None:
     print(f"Destroying topology: {yaml_path}")
     print(f"{'='*70}\n")
 
+    # Only stderr is ever reported, so discard stdout at the pipe endpoint
     result = subprocess.run(
         ["sudo", uv_path, "run", "sine", "destroy", str(yaml_path)],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
 
@@ -378,6 +460,111 @@ def destroy_topology(yaml_path: str) -> None:
         logger.debug(f"Unregistered topology from cleanup: {yaml_path_obj}")
 
 
+def teardown_deployment(
+    process: subprocess.Popen | None, yaml_path: str, destroy: bool = True
+) -> None:
+    """Stop a deployment process and destroy its topology.
+
+    Every step runs even if an earlier one raises, so a failed process
+    shutdown cannot leak containers into the next test. Once all steps have
+    run, the last error raised is propagated, with any earlier one chained
+    as its ``__context__``.
+
+    Args:
+        process: The deployment process to stop, or None
+        yaml_path: Path to topology YAML file
+        destroy: Whether to destroy the topology (False keeps it running)
+    """
+    with ExitStack() as cleanup:
+        # Callbacks run last-registered first: stop the process, then destroy
+        if destroy:
+            cleanup.callback(destroy_topology, yaml_path)
+        cleanup.callback(stop_deployment_process, process)
+
+
+def deployment_exists(container_prefix: str) -> bool:
+    """Check whether any containers from a previous deployment still exist.
+
+    A cheap `docker ps` probe used to skip the pre-deploy `sine destroy` (which
+    spins up the CLI and containerlab) when nothing is deployed.
+
+    Args:
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+
+    Returns:
+        True if at least one container (running or stopped) matches the prefix
+    """
+    result = subprocess.run(
+        ["docker", "ps", "-a", "--filter", f"name=^{container_prefix}-", "-q"],
+        capture_output=True,
+        text=True,
+    )
+    # If docker itself fails, assume a deployment may exist so destroy still runs
+    return result.returncode != 0 or bool(result.stdout.strip())
+
+
+def keep_alive_enabled() -> bool:
+    """Check whether deployments should be reused and kept between test runs.
+
+    Set SINE_TESTS_KEEP_ALIVE=1 during local development to skip the
+    containerlab bring-up when a healthy topology is already running. CI
+    leaves it unset so every run starts from a clean state.
+
+    Returns:
+        True if SINE_TESTS_KEEP_ALIVE is set to "1"
+    """
+    return os.environ.get("SINE_TESTS_KEEP_ALIVE") == "1"
+
+
+def deployment_running(container_prefix: str, nodes: list[str]) -> bool:
+    """Check whether every node container of a deployment is running.
+
+    Args:
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+        nodes: Node names expected in the deployment (e.g., ["node1", "node2"])
+
+    Returns:
+        True if a running container exists for every node
+    """
+    result = subprocess.run(
+        ["docker", "ps", "--format", "{{.Names}}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return False
+    running = set(result.stdout.split())
+    return all(f"{container_prefix}-{node}" in running for node in nodes)
+
+
+def ensure_deployed(
+    yaml_path: str, nodes: list[str]
+) -> subprocess.Popen | None:
+    """Deploy a topology unless a healthy one can be reused.
+
+    With SINE_TESTS_KEEP_ALIVE=1 and all node containers already running,
+    the existing deployment is reused. Otherwise any leftovers are destroyed
+    and the topology is deployed fresh.
+
+    Args:
+        yaml_path: Path to topology YAML file
+        nodes: Node names expected in the deployment
+
+    Returns:
+        The deployment process, or None if the running deployment was reused
+    """
+    container_prefix = extract_container_prefix(yaml_path)
+
+    if keep_alive_enabled() and deployment_running(container_prefix, nodes):
+        print(f"\nReusing running deployment: {container_prefix}")
+        return None
+
+    if deployment_exists(container_prefix):
+        destroy_topology(yaml_path)
+
+    return deploy_topology(yaml_path)
+
+
 def wait_for_iperf3(container_name: str, max_wait_sec: int = 60) -> None:
     """Wait for iperf3 to be available in a container.
 
@@ -412,6 +599,53 @@ def wait_for_iperf3(container_name: str, max_wait_sec: int = 60) -> None:
     )
 
 
+def start_iperf3_servers(container_prefix: str, nodes: list[str], port: int) -> None:
+    """Start one long-lived iperf3 server (daemon) per node.
+
+    Lets throughput tests in a module share servers instead of starting and
+    killing one per measurement. Pass the same port to run_iperf3_test /
+    run_iperf3_bidir via server_port. Use a port per topology so modules that
+    run concurrently do not collide.
+
+    Args:
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+        nodes: Node names to start a server on
+        port: TCP port the servers listen on
+
+    Raises:
+        subprocess.CalledProcessError: If a server fails to start
+    """
+    for node in nodes:
+        container_name = f"{container_prefix}-{node}"
+        wait_for_iperf3(container_name)
+        print(f"Starting iperf3 server on {container_name}:{port}...")
+        subprocess.run(
+            ["docker", "exec", container_name, "sh", "-c",
+             f"pkill -9 iperf3; iperf3 -s -D -p {port}"],
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+    # Give the daemons time to start listening
+    time.sleep(1)
+
+
+def stop_iperf3_servers(container_prefix: str, nodes: list[str]) -> None:
+    """Stop iperf3 servers started by start_iperf3_servers.
+
+    Args:
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+        nodes: Node names the servers run on
+    """
+    for node in nodes:
+        subprocess.run(
+            ["docker", "exec", f"{container_prefix}-{node}", "pkill", "iperf3"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+
+
 def run_iperf3_test(
     container_prefix: str,
     server_node: str,
@@ -420,6 +654,9 @@ def run_iperf3_test(
     duration_sec: int = 8,
     protocol: str = "tcp",
     udp_bandwidth_mbps: int = 300,
+    parallel_streams: int = 1,
+    window: str | None = None,
+    server_port: int | None = None,
 ) -> float:
     """Run iperf3 throughput test between two containers.
 
@@ -431,9 +668,15 @@ def run_iperf3_test(
         duration_sec: Test duration in seconds
         protocol: Protocol to use ("tcp" or "udp")
         udp_bandwidth_mbps: Target bandwidth for UDP tests (default: 300 Mbps)
+        parallel_streams: Number of parallel client streams (iperf3 -P).
+            Several streams reach line rate sooner than one CPU-bound stream.
+        window: Socket buffer/window size (iperf3 -w, e.g. "512K"), optional
+        server_port: Port of an iperf3 server already running on server_node
+            (see start_iperf3_servers). If given, that server is reused rather
+            than started and killed around this test.
 
     Returns:
-        Measured throughput in Mbps
+        Measured throughput in Mbps (summed over all streams)
 
     Raises:
         RuntimeError: If iperf3 test fails
@@ -446,26 +689,27 @@ def run_iperf3_test(
     server_container = f"{container_prefix}-{server_node}"
     client_container = f"{container_prefix}-{client_node}"
 
-    # Wait for iperf3 to be available in both containers
-    # (containerlab exec commands run asynchronously)
-    print(f"Waiting for iperf3 to be available in {server_container} and {client_container}...")
-    wait_for_iperf3(server_container)
-    wait_for_iperf3(client_container)
-    print("iperf3 is available in both containers\n")
-
-    # Kill any existing iperf3 processes first
-    print(f"\nCleaning up any existing iperf3 processes on {server_container}...")
-    kill_cmd = f"docker exec {server_container} pkill -9 iperf3 || true"
-    subprocess.run(kill_cmd, shell=True)
-    time.sleep(0.5)
+    if server_port is None:
+        # Wait for iperf3 to be available in both containers
+        # (containerlab exec commands run asynchronously)
+        print(f"Waiting for iperf3 to be available in {server_container} and {client_container}...")
+        wait_for_iperf3(server_container)
+        wait_for_iperf3(client_container)
+        print("iperf3 is available in both containers\n")
 
-    # Start iperf3 server in background
-    print(f"Starting iperf3 server on {server_container}...")
-    server_cmd = f"docker exec -d {server_container} iperf3 -s"
-    subprocess.run(server_cmd, shell=True, check=True)
+        # Kill any existing iperf3 processes first
+        print(f"\nCleaning up any existing iperf3 processes on {server_container}...")
+        kill_cmd = f"docker exec {server_container} pkill -9 iperf3 || true"
+        subprocess.run(kill_cmd, shell=True)
+        time.sleep(0.5)
 
-    # Give server time to start
-    time.sleep(2)
+        # Start iperf3 server in background
+        print(f"Starting iperf3 server on {server_container}...")
+        server_cmd = f"docker exec -d {server_container} iperf3 -s"
+        subprocess.run(server_cmd, shell=True, check=True)
+
+        # Give server time to start
+        time.sleep(2)
 
     # Build client command based on protocol
     print(f"Running iperf3 client ({protocol.upper()}) on {client_container} -> {server_ip}... "
@@ -482,6 +726,13 @@ def run_iperf3_test(
             f"-t {duration_sec} -J"
         )
 
+    if parallel_streams > 1:
+        client_cmd += f" -P {parallel_streams}"
+    if window is not None:
+        client_cmd += f" -w {window}"
+    if server_port is not None:
+        client_cmd += f" -p {server_port}"
+
     # Add timeout: test duration + 5 seconds grace period
     # This accounts for:
     # - Docker exec overhead (~1s)
@@ -568,13 +819,110 @@ def run_iperf3_test(
 
     print(f"Measured throughput: {throughput_mbps:.2f} Mbps\n")
 
-    # Kill iperf3 server
-    kill_cmd = f"docker exec {server_container} pkill iperf3"
-    subprocess.run(kill_cmd, shell=True, timeout=10)
+    # Kill iperf3 server (unless it is a shared, long-lived one)
+    if server_port is None:
+        kill_cmd = f"docker exec {server_container} pkill iperf3"
+        subprocess.run(kill_cmd, shell=True, timeout=10)
 
     return throughput_mbps
 
 
+def run_iperf3_bidir(
+    container_prefix: str,
+    server_node: str,
+    client_node: str,
+    server_ip: str,
+    duration_sec: int = 8,
+    parallel_streams: int = 1,
+    window: str | None = None,
+    server_port: int | None = None,
+) -> tuple[float, float]:
+    """Run a bidirectional TCP iperf3 test (--bidir) between two containers.
+
+    Both directions run concurrently in one iperf3 session, so they see the
+    same channel conditions and the test takes one duration instead of two.
+
+    Args:
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+        server_node: Server node name
+        client_node: Client node name
+        server_ip: IP address of the server (where client connects)
+        duration_sec: Test duration in seconds
+        parallel_streams: Number of parallel streams per direction (iperf3 -P)
+        window: Socket buffer/window size (iperf3 -w, e.g. "512K"), optional
+        server_port: Port of an iperf3 server already running on server_node
+            (see start_iperf3_servers), reused instead of a per-test server
+
+    Returns:
+        Tuple of (client → server, server → client) throughput in Mbps
+
+    Raises:
+        RuntimeError: If iperf3 does not produce valid bidirectional results
+        subprocess.CalledProcessError: If the iperf3 client fails
+        subprocess.TimeoutExpired: If test doesn't complete within duration_sec + 5 seconds
+    """
+    import json
+
+    server_container = f"{container_prefix}-{server_node}"
+    client_container = f"{container_prefix}-{client_node}"
+
+    if server_port is None:
+        print(f"Waiting for iperf3 to be available in {server_container} and {client_container}...")
+        wait_for_iperf3(server_container)
+        wait_for_iperf3(client_container)
+        print("iperf3 is available in both containers\n")
+
+        # Kill any existing iperf3 processes first
+        print(f"\nCleaning up any existing iperf3 processes on {server_container}...")
+        subprocess.run(f"docker exec {server_container} pkill -9 iperf3 || true", shell=True)
+        time.sleep(0.5)
+
+        print(f"Starting iperf3 server on {server_container}...")
+        subprocess.run(f"docker exec -d {server_container} iperf3 -s", shell=True, check=True)
+        time.sleep(2)
+
+    client_cmd = (
+        f"docker exec {client_container} iperf3 -c {server_ip} "
+        f"--bidir -t {duration_sec} -J"
+    )
+    if parallel_streams > 1:
+        client_cmd += f" -P {parallel_streams}"
+    if window is not None:
+        client_cmd += f" -w {window}"
+    if server_port is not None:
+        client_cmd += f" -p {server_port}"
+
+    print(f"Running bidirectional iperf3 client on {client_container} <-> {server_ip}... "
+          f"(expected duration {duration_sec}s)")
+
+    try:
+        result = subprocess.run(
+            client_cmd, shell=True, capture_output=True, text=True, check=True,
+            timeout=duration_sec + 5,
+        )
+    finally:
+        if server_port is None:
+            subprocess.run(f"docker exec {server_container} pkill iperf3", shell=True, timeout=10)
+
+    try:
+        end = json.loads(result.stdout)["end"]
+        # sum_received: client → server as measured at the server;
+        # sum_received_bidir_reverse: server → client as measured at the client
+        forward_bps = end["sum_received"]["bits_per_second"]
+        reverse_bps = end["sum_received_bidir_reverse"]["bits_per_second"]
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"Stdout: {result.stdout[:500]}")
+        print(f"Stderr: {result.stderr[:500]}")
+        raise RuntimeError(f"iperf3 did not produce valid --bidir JSON output: {e}")
+
+    forward_mbps = forward_bps / 1e6
+    reverse_mbps = reverse_bps / 1e6
+    print(f"Measured throughput: {client_node}→{server_node} {forward_mbps:.2f} Mbps, "
+          f"{server_node}→{client_node} {reverse_mbps:.2f} Mbps\n")
+
+    return forward_mbps, reverse_mbps
+
+
 def run_netcat_udp_test(
     container_prefix: str,
     server_node: str,
@@ -799,6 +1147,67 @@ def run_netcat_udp_test(
     return throughput_mbps
 
 
+def _ping_ok(src_container: str, dst_ip: str) -> bool:
+    """Ping dst_ip from a container, discarding the ping output.
+
+    Args:
+        src_container: Docker container name to ping from
+        dst_ip: Destination IP address
+
+    Returns:
+        True if the ping succeeded
+    """
+    cmd = f"docker exec {src_container} ping -c 3 -W 2 {dst_ip}"
+    result = subprocess.run(
+        cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def _ping_all_ok(src_container: str, dst_ips: list[str]) -> bool:
+    """Ping several destinations from a container in a single docker exec.
+
+    Uses fping when the image has it, which probes all destinations in
+    parallel. Otherwise the pings run sequentially inside one shell and are
+    chained with ``&&``. Either way the exit code is non-zero if any
+    destination fails.
+
+    Args:
+        src_container: Docker container name to ping from
+        dst_ips: Destination IP addresses
+
+    Returns:
+        True if every ping succeeded
+    """
+    targets = " ".join(dst_ips)
+    pings = " && ".join(f"ping -c 3 -W 2 {dst_ip} >/dev/null" for dst_ip in dst_ips)
+    script = (
+        f"if command -v fping >/dev/null 2>&1; "
+        f"then fping -q -c 3 -t 2000 -B 1 {targets}; "
+        f"else {pings}; fi"
+    )
+    cmd = f"docker exec {src_container} sh -c '{script}'"
+    result = subprocess.run(
+        cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def _ping_diagnostics(src_container: str, dst_ip: str) -> str:
+    """Re-run a failed ping with output captured for the failure message.
+
+    Args:
+        src_container: Docker container name to ping from
+        dst_ip: Destination IP address
+
+    Returns:
+        Combined stdout and stderr of the ping
+    """
+    cmd = f"docker exec {src_container} ping -c 3 -W 2 {dst_ip}"
+    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    return f"{result.stdout}\n{result.stderr}"
+
+
 def verify_ping_connectivity(container_prefix: str, node_ips: dict[str, str]) -> None:
     """Test all-to-all ping connectivity between nodes.
 
@@ -816,27 +1225,28 @@ def verify_ping_connectivity(container_prefix: str, node_ips: dict[str, str]) ->
     print(f"{'='*70}\n")
 
     for src_node in nodes:
-        for dst_node in nodes:
-            if src_node == dst_node:
-                continue
+        src_container = f"{container_prefix}-{src_node}"
+        dst_nodes = [dst_node for dst_node in nodes if dst_node != src_node]
 
-            src_container = f"{container_prefix}-{src_node}"
+        # One docker exec per source pings every destination in turn
+        if _ping_all_ok(src_container, [node_ips[dst_node] for dst_node in dst_nodes]):
+            for dst_node in dst_nodes:
+                print(f"Ping {src_node} -> {dst_node} ({node_ips[dst_node]})... ✓ SUCCESS")
+            continue
+
+        # Batch failed: ping each destination separately to find the broken link
+        for dst_node in dst_nodes:
             dst_ip = node_ips[dst_node]
 
             print(f"Ping {src_node} -> {dst_node} ({dst_ip})...", end=" ")
 
-            cmd = f"docker exec {src_container} ping -c 3 -W 2 {dst_ip}"
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
+            if _ping_ok(src_container, dst_ip):
                 print("✓ SUCCESS")
             else:
                 print("✗ FAILED")
                 raise AssertionError(
                     f"Ping failed: {src_node} -> {dst_node} ({dst_ip})\n"
-                    f"Output: {result.stdout}\n{result.stderr}"
+                    f"Output: {_ping_diagnostics(src_container, dst_ip)}"
                 )
 
     print(f"\n{'='*70}")
@@ -874,19 +1284,14 @@ def verify_selective_ping_connectivity(
 
             print(f"  {src_node} -> {dst_node} ({dst_ip})...", end=" ")
 
-            cmd = f"docker exec {src_container} ping -c 3 -W 2 {dst_ip}"
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True
-            )
-
-            if result.returncode == 0:
+            if _ping_ok(src_container, dst_ip):
                 print("✓ SUCCESS (as expected)")
             else:
                 print("✗ FAILED (unexpected!)")
                 raise AssertionError(
                     f"Ping unexpectedly failed: {src_node} -> {dst_node} ({dst_ip})\n"
                     f"This link was expected to succeed (positive SINR).\n"
-                    f"Output: {result.stdout}\n{result.stderr}"
+                    f"Output: {_ping_diagnostics(src_container, dst_ip)}"
                 )
 
     # Test expected failures
@@ -898,12 +1303,7 @@ def verify_selective_ping_connectivity(
 
             print(f"  {src_node} -> {dst_node} ({dst_ip})...", end=" ")
 
-            cmd = f"docker exec {src_container} ping -c 3 -W 2 {dst_ip}"
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True
-            )
-
-            if result.returncode != 0:
+            if not _ping_ok(src_container, dst_ip):
                 print("✓ FAILED (as expected, negative SINR)")
             else:
                 print("✗ SUCCESS (unexpected!)")
@@ -970,6 +1370,42 @@ def verify_route_to_cidr(
     )
 
 
+# Separates the qdisc/filter/class sections of a tc snapshot
+_TC_SNAPSHOT_SEPARATOR = "---sine-tc-snapshot---"
+
+
+def snapshot_tc_state(container_name: str, interface: str) -> dict[str, str]:
+    """Capture qdisc, filter and class state of an interface in one docker exec.
+
+    The snapshot can be passed to verify_tc_config to check several
+    destinations of the same node without re-running tc for each one.
+
+    Args:
+        container_name: Docker container name (e.g., "clab-mylab-node1")
+        interface: Interface name (e.g., "eth1")
+
+    Returns:
+        Dict with "qdisc", "filter" and "class" keys holding `tc ... show` output
+
+    Raises:
+        subprocess.CalledProcessError: If any tc command fails
+    """
+    script = (
+        f"tc qdisc show dev {interface} && echo {_TC_SNAPSHOT_SEPARATOR} && "
+        f"tc filter show dev {interface} && echo {_TC_SNAPSHOT_SEPARATOR} && "
+        f"tc class show dev {interface}"
+    )
+    cmd = ["docker", "exec", container_name, "sh", "-c", script]
+    print(f"Running: docker exec {container_name} tc {{qdisc,filter,class}} show dev {interface}")
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    qdisc_output, filter_output, class_output = (
+        section.strip("\n") + "\n"
+        for section in result.stdout.split(_TC_SNAPSHOT_SEPARATOR)
+    )
+    return {"qdisc": qdisc_output, "filter": filter_output, "class": class_output}
+
+
 def verify_tc_config(
     container_prefix: str,
     node: str,
@@ -982,7 +1418,8 @@ def verify_tc_config(
     delay_tolerance_ms: float = 0.01,
     jitter_tolerance_ms: float = 0.01,
     loss_tolerance_percent: float = 0.1,
-    rate_tolerance_mbps: float = 1.0
+    rate_tolerance_mbps: float = 1.0,
+    snapshot: dict[str, str] | None = None,
 ) -> dict[str, float | str | None]:
     """Verify TC configuration matches expected parameters.
 
@@ -999,6 +1436,8 @@ def verify_tc_config(
         jitter_tolerance_ms: Tolerance for jitter comparison (default: 0.01 ms)
         loss_tolerance_percent: Tolerance for loss comparison (default: 0.1%)
         rate_tolerance_mbps: Tolerance for rate comparison (default: 1.0 Mbps)
+        snapshot: Output of snapshot_tc_state for this node/interface (optional).
+            If omitted, a fresh snapshot is taken.
 
     Returns:
         Dict with actual values:
@@ -1030,11 +1469,11 @@ def verify_tc_config(
         "filter_match": None,
     }
 
+    if snapshot is None:
+        snapshot = snapshot_tc_state(container_name, interface)
+
     # Get qdisc info
-    cmd = f"docker exec {container_name} tc qdisc show dev {interface}"
-    print(f"Running: {cmd}")
-    qdisc_result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
-    qdisc_output = qdisc_result.stdout
+    qdisc_output = snapshot["qdisc"]
     print(f"Qdisc output:\n{qdisc_output}")
 
     # Detect mode
@@ -1053,10 +1492,7 @@ def verify_tc_config(
             raise ValueError("dst_node_ip required for shared_bridge mode")
 
         # Get filters to find classid for destination IP
-        filter_cmd = f"docker exec {container_name} tc filter show dev {interface}"
-        print(f"Running: {filter_cmd}")
-        filter_result = subprocess.run(filter_cmd, shell=True, capture_output=True, text=True, check=True)
-        filter_output = filter_result.stdout
+        filter_output = snapshot["filter"]
         print(f"Filter output:\n{filter_output}")
 
         # Parse filter output to find classid/flowid for dst_ip
@@ -1090,10 +1526,7 @@ def verify_tc_config(
             )
 
         # Get HTB class info for rate
-        class_cmd = f"docker exec {container_name} tc class show dev {interface}"
-        print(f"Running: {class_cmd}")
-        class_result = subprocess.run(class_cmd, shell=True, capture_output=True, text=True, check=True)
-        class_output = class_result.stdout
+        class_output = snapshot["class"]
         print(f"Class output:\n{class_output}")
 
         # Extract rate from class
@@ -1205,6 +1638,26 @@ def verify_tc_config(
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class DeploymentHandle:
+    """A deployed topology shared by the tests of one module.
+
+    Yielded by module-scoped deployment fixtures so tests can use the resolved
+    paths and names directly instead of rebuilding them per test.
+
+    Attributes:
+        yaml_path: Path to the topology YAML file (resolved once)
+        container_prefix: Docker container name prefix (e.g., "clab-mylab")
+        node_ips: Dictionary mapping node names to IP addresses
+        controller: In-process controller driving the deployment, if any
+    """
+
+    yaml_path: str
+    container_prefix: str
+    node_ips: dict[str, str]
+    controller: EmulationController | None = None
+
+
 def force_kill_port_occupants(port: int) -> bool:
     """Forcibly kill any processes using the specified port.
 
@@ -1645,7 +2098,92 @@ def control_api_sinr_deployment(channel_server, examples_for_tests):
         destroy_topology(str(yaml_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def shared_bridge_deployment(channel_server, shared_bridge_yaml, bridge_node_ips):
+    """Deploy shared_sionna_snr_equal-triangle once per test module.
+
+    The equal-triangle tests only inspect the deployed topology, so each
+    module shares one deploy/destroy cycle instead of paying for one per
+    test. The example path comes from the session-scoped shared_bridge_yaml.
+
+    With SINE_TESTS_KEEP_ALIVE=1 a running deployment is reused and left up
+    afterwards (see keep_alive_enabled).
+
+    The emulation is driven in-process by EmulationController (as the
+    asymmetric NF controller test does) rather than a `sine deploy`
+    subprocess, so deployment errors surface as Python tracebacks. One event
+    loop is kept for the lifetime of the module so the controller's polling
+    task belongs to the same loop that later stops it.
+
+    Depends on channel_server (port 8000) being running.
+
+    Yields:
+        DeploymentHandle for the deployed topology
+    """
+    yaml_path = shared_bridge_yaml
+    yaml_str = str(yaml_path)
+    container_prefix = extract_container_prefix(yaml_str)
+    keep_alive = keep_alive_enabled()
+
+    if keep_alive and deployment_running(container_prefix, list(bridge_node_ips)):
+        print(f"\nReusing running deployment: {container_prefix}")
+        yield DeploymentHandle(
+            yaml_path=yaml_str,
+            container_prefix=container_prefix,
+            node_ips=bridge_node_ips,
+        )
+        return
+
+    # Cleanup any existing deployment first
+    if deployment_exists(container_prefix):
+        destroy_topology(yaml_str)
+
+    loop = asyncio.new_event_loop()
+    controller = EmulationController(yaml_path)
+    try:
+        print(f"\nDeploying topology in-process: {yaml_str}")
+        if not loop.run_until_complete(controller.start()):
+            pytest.fail(f"Deployment of {yaml_str} failed")
+        print("Deployment complete!\n")
+        yield DeploymentHandle(
+            yaml_path=yaml_str,
+            container_prefix=container_prefix,
+            node_ips=bridge_node_ips,
+            controller=controller,
+        )
+    finally:
+        try:
+            if keep_alive:
+                # Leave the containers up for the next run; only stop polling
+                loop.run_until_complete(controller.stop_control_loop())
+            else:
+                loop.run_until_complete(controller.stop())
+        finally:
+            loop.close()
+
+
+@pytest.fixture(scope="module")
+def shared_bridge_iperf3_port(shared_bridge_deployment):
+    """Run one iperf3 server per equal-triangle node for the whole module.
+
+    Throughput tests pass the yielded port as server_port to run_iperf3_test /
+    run_iperf3_bidir so they reuse these servers. The port is specific to
+    this topology to avoid clashing with other deployments' servers.
+
+    Yields:
+        TCP port the iperf3 servers listen on
+    """
+    nodes = list(shared_bridge_deployment.node_ips)
+    start_iperf3_servers(
+        shared_bridge_deployment.container_prefix, nodes, SHARED_BRIDGE_IPERF3_PORT
+    )
+    try:
+        yield SHARED_BRIDGE_IPERF3_PORT
+    finally:
+        stop_iperf3_servers(shared_bridge_deployment.container_prefix, nodes)
+
+
+@pytest.fixture(scope="session")
 def bridge_node_ips() -> dict[str, str]:
     """Standard shared bridge node IPs (192.168.100.x/24).
 
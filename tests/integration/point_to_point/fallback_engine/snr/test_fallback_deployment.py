@@ -202,7 +202,7 @@ class TestFallbackVsAutoMode:
 
     def test_auto_mode_uses_fallback_when_no_gpu(self, examples_for_tests, tmp_path):
         """Test that AUTO mode gracefully falls back when GPU unavailable."""
-        from sine.channel.server import is_sionna_available
+        from sine.channel.sionna_engine import is_sionna_available
 
         # Skip if Sionna is available (can't test fallback behavior)
         if is_sionna_available():
@@ -0,0 +1,42 @@
+"""Shared bridge SNR test configuration."""
+from pathlib import Path
+
+import pytest
+
+from tests.integration.fixtures import (
+    deployment_exists,
+    destroy_topology,
+    extract_container_prefix,
+    keep_alive_enabled,
+)
+
+# Example topologies deployed by the tests in this directory. All of them
+# attach to the same host bridge, so none may be left over from an earlier run.
+SNR_SHARED_BRIDGE_EXAMPLES = [
+    "shared_sionna_snr_equal-triangle",
+    "shared_sionna_snr_equal-triangle-varied-nf",
+    "shared_sionna_snr_dual-band",
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def destroy_leftover_deployments(examples_for_tests: Path) -> None:
+    """Destroy deployments left behind by a previous (aborted) run, once.
+
+    Every test destroys its own topology in a finally block, so within a
+    session nothing needs destroying before a deploy. This clears whatever
+    an interrupted earlier session left running, using a cheap `docker ps`
+    probe so a clean host pays no `sine destroy` at all.
+
+    Skipped with SINE_TESTS_KEEP_ALIVE=1, where running deployments are
+    deliberately reused.
+    """
+    if keep_alive_enabled():
+        return
+
+    for example in SNR_SHARED_BRIDGE_EXAMPLES:
+        yaml_path = examples_for_tests / example / "network.yaml"
+        if not yaml_path.exists():
+            continue
+        if deployment_exists(extract_container_prefix(str(yaml_path))):
+            destroy_topology(str(yaml_path))
@@ -27,11 +27,10 @@ from sine.emulation.controller import EmulationController
 from tests.integration.fixtures import (
     channel_server,
     deploy_topology,
-    destroy_topology,
     extract_container_prefix,
-    stop_deployment_process,
     verify_ping_connectivity,
     verify_tc_config,
+    teardown_deployment,
 )
 
 logger = logging.getLogger(__name__)
@@ -173,8 +172,6 @@ def test_dual_band_tc_config(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -219,8 +216,7 @@ def test_dual_band_tc_config(channel_server, examples_for_tests: Path):
         print("=" * 70 + "\n")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -237,8 +233,6 @@ def test_dual_band_ping_connectivity(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -265,8 +259,7 @@ def test_dual_band_ping_connectivity(channel_server, examples_for_tests: Path):
         print("=" * 70 + "\n")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 if __name__ == "__main__":
@@ -11,10 +11,9 @@ from pathlib import Path
 from tests.integration.fixtures import (
     channel_server,
     deploy_topology,
-    destroy_topology,
-    stop_deployment_process,
     run_iperf3_test,
     extract_container_prefix,
+    teardown_deployment,
 )
 
 
@@ -32,8 +31,6 @@ def test_dual_band_throughput_5ghz(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -58,8 +55,7 @@ def test_dual_band_throughput_5ghz(channel_server, examples_for_tests: Path):
         print(f"✓ 5 GHz band throughput validated: {throughput:.2f} Mbps")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -76,8 +72,6 @@ def test_dual_band_throughput_24ghz(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -102,8 +96,7 @@ def test_dual_band_throughput_24ghz(channel_server, examples_for_tests: Path):
         print(f"✓ 2.4 GHz band throughput validated: {throughput:.2f} Mbps")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -124,8 +117,6 @@ def test_dual_band_throughput_both_bands_bidirectional(
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -222,5 +213,4 @@ def test_dual_band_throughput_both_bands_bidirectional(
         print(f"  Band ratio: {band_ratio:.2f}x (expected ~4x)")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
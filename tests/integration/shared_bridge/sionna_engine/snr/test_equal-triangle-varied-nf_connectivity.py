@@ -10,11 +10,10 @@ from tests.integration.fixtures import (
     bridge_node_ips,
     channel_server,
     deploy_topology,
-    destroy_topology,
     extract_container_prefix,
     run_iperf3_test,
-    stop_deployment_process,
     verify_ping_connectivity,
+    teardown_deployment,
 )
 from sine.config.loader import load_topology
 
@@ -52,8 +51,6 @@ def test_asymmetric_nf_connectivity(channel_server, examples_for_tests: Path, br
     unique_nf = set(nf_values.values())
     assert len(unique_nf) >= 2, "Expected at least 2 different noise figure values"
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -64,8 +61,7 @@ def test_asymmetric_nf_connectivity(channel_server, examples_for_tests: Path, br
         verify_ping_connectivity(container_prefix, bridge_node_ips)
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -90,8 +86,6 @@ def test_asymmetric_nf_throughput(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -132,8 +126,7 @@ def test_asymmetric_nf_throughput(channel_server, examples_for_tests: Path):
         # - The key is that both directions work
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -157,8 +150,6 @@ def test_asymmetric_nf_bidirectional_snr(channel_server, examples_for_tests: Pat
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -170,5 +161,4 @@ def test_asymmetric_nf_bidirectional_snr(channel_server, examples_for_tests: Pat
         verify_ping_connectivity(container_prefix, bridge_node_ips)
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
@@ -8,10 +8,9 @@ from pathlib import Path
 from tests.integration.fixtures import (
     channel_server,
     deploy_topology,
-    destroy_topology,
     extract_container_prefix,
-    stop_deployment_process,
     verify_route_to_cidr,
+    teardown_deployment,
 )
 
 
@@ -36,8 +35,6 @@ def test_asymmetric_nf_routing(channel_server, examples_for_tests: Path):
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -55,5 +52,4 @@ def test_asymmetric_nf_routing(channel_server, examples_for_tests: Path):
             )
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
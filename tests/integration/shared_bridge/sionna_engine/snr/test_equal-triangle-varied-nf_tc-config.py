@@ -4,22 +4,34 @@ Tests that traffic control parameters reflect asymmetric SNR values based on
 heterogeneous receiver noise figures.
 """
 
-import pytest
+import asyncio
+import logging
 from pathlib import Path
+
+import pytest
+
+from sine.emulation.controller import EmulationController
 from tests.integration.fixtures import (
     channel_server,
-    deploy_topology,
+    deployment_exists,
     destroy_topology,
+    ensure_deployed,
     extract_container_prefix,
-    stop_deployment_process,
+    keep_alive_enabled,
     verify_tc_config,
+    teardown_deployment,
 )
 
+logger = logging.getLogger(__name__)
+
+# Node containers expected in shared_sionna_snr_equal-triangle-varied-nf
+VARIED_NF_NODES = ["node1", "node2", "node3"]
+
 
 @pytest.mark.integration
 @pytest.mark.slow
 @pytest.mark.sionna
-def test_asymmetric_nf_tc_config(channel_server, examples_for_tests: Path):
+def test_asymmetric_nf_tc_config(channel_server, shared_bridge_varied_nf_yaml: Path):
     """Verify asymmetric SNR/loss rates with heterogeneous receivers.
 
     Validates that:
@@ -33,16 +45,11 @@ def test_asymmetric_nf_tc_config(channel_server, examples_for_tests: Path):
     - Rates depend on SNR-based MCS selection (may be symmetric or asymmetric)
     - Loss rates may differ if SNR difference crosses BER threshold
     """
-    yaml_path = examples_for_tests / "shared_sionna_snr_equal-triangle-varied-nf" / "network.yaml"
-
-    if not yaml_path.exists():
-        pytest.skip(f"Example not found: {yaml_path}")
-
-    destroy_topology(str(yaml_path))
+    yaml_path = shared_bridge_varied_nf_yaml
 
     deploy_process = None
     try:
-        deploy_process = deploy_topology(str(yaml_path))
+        deploy_process = ensure_deployed(str(yaml_path), VARIED_NF_NODES)
 
         # Get container prefix from topology
         container_prefix = extract_container_prefix(str(yaml_path))
@@ -81,14 +88,15 @@ def test_asymmetric_nf_tc_config(channel_server, examples_for_tests: Path):
         # because the 3 dB NF difference may not cross MCS threshold at this distance.
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(
+            deploy_process, str(yaml_path), destroy=not keep_alive_enabled()
+        )
 
 
 @pytest.mark.integration
 @pytest.mark.slow
 @pytest.mark.sionna
-def test_asymmetric_nf_multiple_links(channel_server, examples_for_tests: Path):
+def test_asymmetric_nf_multiple_links(channel_server, shared_bridge_varied_nf_yaml: Path):
     """Verify TC config for multiple heterogeneous links.
 
     Validates that:
@@ -97,16 +105,11 @@ def test_asymmetric_nf_multiple_links(channel_server, examples_for_tests: Path):
     - node3→node1 uses node1's NF (7 dB, medium receiver)
     - All links have valid per-destination filters
     """
-    yaml_path = examples_for_tests / "shared_sionna_snr_equal-triangle-varied-nf" / "network.yaml"
-
-    if not yaml_path.exists():
-        pytest.skip(f"Example not found: {yaml_path}")
-
-    destroy_topology(str(yaml_path))
+    yaml_path = shared_bridge_varied_nf_yaml
 
     deploy_process = None
     try:
-        deploy_process = deploy_topology(str(yaml_path))
+        deploy_process = ensure_deployed(str(yaml_path), VARIED_NF_NODES)
 
         # Get container prefix from topology
         container_prefix = extract_container_prefix(str(yaml_path))
@@ -139,5 +142,93 @@ def test_asymmetric_nf_multiple_links(channel_server, examples_for_tests: Path):
         )
 
     finally:
-        stop_deployment_process(deploy_process)
+        teardown_deployment(
+            deploy_process, str(yaml_path), destroy=not keep_alive_enabled()
+        )
+
+
+# Expected SNR gap between node1→node3 and node1→node2: receiver NFs 10 dB vs 5 dB
+NF_SNR_DELTA_DB = 10.0 - 5.0
+NF_SNR_DELTA_TOLERANCE_DB = 0.5
+
+# All 6 directional links (3 nodes × 2 directions) on the shared bridge
+ASYMMETRIC_NF_LINKS = [
+    ("node1", "node2"),
+    ("node1", "node3"),
+    ("node2", "node1"),
+    ("node2", "node3"),
+    ("node3", "node1"),
+    ("node3", "node2"),
+]
+
+
+@pytest.fixture(scope="module")
+def asymmetric_nf_controller(channel_server, shared_bridge_varied_nf_yaml: Path):
+    """Start the varied-NF topology in-process once for the link state tests.
+
+    CRITICAL REGRESSION FIXTURE: shared bridge mode with asymmetric noise
+    figures must keep working alongside the bidirectional P2P computation.
+
+    Topology: 3-node triangle on shared bridge with asymmetric NF (uses inline YAML from for_tests)
+    - node1: NF=7 dB (WiFi 6)
+    - node2: NF=10 dB (IoT device)
+    - node3: NF=5 dB (high-end base station)
+
+    Yields:
+        Tuple of (started EmulationController, expected (tx, rx) link pairs)
+    """
+    yaml_path = shared_bridge_varied_nf_yaml
+
+    # The tc tests may leave this topology running (SINE_TESTS_KEEP_ALIVE=1)
+    if deployment_exists(extract_container_prefix(str(yaml_path))):
         destroy_topology(str(yaml_path))
+
+    loop = asyncio.new_event_loop()
+    controller = EmulationController(yaml_path)
+    try:
+        loop.run_until_complete(controller.start())
+        yield controller, ASYMMETRIC_NF_LINKS
+    finally:
+        try:
+            loop.run_until_complete(controller.stop())
+        finally:
+            loop.close()
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.parametrize("tx,rx", ASYMMETRIC_NF_LINKS)
+def test_shared_bridge_asymmetric_nf_link_state_exists(tx, rx, asymmetric_nf_controller):
+    """Each directional shared bridge link has a computed link state.
+
+    Each node has ONE interface (eth1) on the shared bridge, so link states
+    are keyed (tx, "eth1", rx, "eth1").
+    """
+    controller, _ = asymmetric_nf_controller
+
+    link_state = controller._link_states.get((tx, "eth1", rx, "eth1"))
+    assert link_state is not None, f"Link state {tx}→{rx} missing"
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_shared_bridge_asymmetric_nf_snr_difference(asymmetric_nf_controller):
+    """SNR per destination follows the receiver's noise figure.
+
+    Example: node1:eth1 should have:
+    - Packets to node2 (192.168.100.2): Uses node2's NF=10dB → higher loss
+    - Packets to node3 (192.168.100.3): Uses node3's NF=5dB → lower loss
+    """
+    controller, _ = asymmetric_nf_controller
+
+    # node1→node2 (RX NF=10dB) vs node1→node3 (RX NF=5dB) should differ by NF_SNR_DELTA_DB
+    snr_12 = controller._link_states[("node1", "eth1", "node2", "eth1")]["rf"]["snr_db"]
+    snr_13 = controller._link_states[("node1", "eth1", "node3", "eth1")]["rf"]["snr_db"]
+
+    snr_diff = snr_13 - snr_12  # node3 has better NF → higher SNR
+    assert abs(snr_diff - NF_SNR_DELTA_DB) < NF_SNR_DELTA_TOLERANCE_DB, (
+        f"Expected ~{NF_SNR_DELTA_DB:.0f} dB SNR difference (NF: 10dB vs 5dB), "
+        f"got {snr_diff:.1f} dB (to node2: {snr_12:.1f} dB, to node3: {snr_13:.1f} dB)"
+    )
+
+    logger.info("✅ Shared bridge bidirectional computation with asymmetric NF verified")
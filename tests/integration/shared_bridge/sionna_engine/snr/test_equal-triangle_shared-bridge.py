@@ -0,0 +1,254 @@
+"""
+Integration tests for the MANET shared bridge (equal triangle) topology.
+
+These tests deploy the manet_triangle_shared example once and validate:
+1. All nodes can reach each other (ping connectivity)
+2. Routes to the bridge subnet are installed on every node
+3. Per-destination TC (HTB classes, netem qdiscs, flower filters) is configured
+4. iperf3 throughput matches expected rates
+5. Bidirectional throughput symmetry
+
+Every check is a plain ``check_*`` function run by a single parametrized test
+against the module-scoped shared_bridge_deployment fixture, so the topology is
+deployed and destroyed exactly once. Read-only checks come first in CHECKS; the
+iperf3 checks, which load the links, run last.
+
+Requirements:
+- Channel server running (automatically started by test fixture)
+- sudo access for netem configuration (passwordless or pre-authenticated)
+- containerlab installed
+- iperf3 installed in container images
+
+Running these tests:
+    UV_PATH=$(which uv) sudo -E pytest -s --runslow tests/integration/shared_bridge/sionna_engine/snr/test_equal-triangle_shared-bridge.py -v
+
+Running a single check:
+    UV_PATH=$(which uv) sudo -E pytest -s --runslow "tests/integration/shared_bridge/sionna_engine/snr/test_equal-triangle_shared-bridge.py::test_manet_shared_bridge[tc_config]" -v
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Import shared fixtures and helpers
+from tests.integration.fixtures import (
+    SHARED_BRIDGE_PHY_RATE_MBPS,
+    DeploymentHandle,
+    bridge_node_ips,
+    channel_server,
+    run_iperf3_bidir,
+    run_iperf3_test,
+    shared_bridge_deployment,
+    shared_bridge_iperf3_port,
+    snapshot_tc_state,
+    verify_ping_connectivity,
+    verify_route_to_cidr,
+    verify_tc_config,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Prevent "imported but unused" warnings - these are pytest fixtures
+__all__ = [
+    "bridge_node_ips",
+    "channel_server",
+    "shared_bridge_deployment",
+    "shared_bridge_iperf3_port",
+]
+
+NODES = ["node1", "node2", "node3"]
+BRIDGE_SUBNET = "192.168.100.0/24"
+
+# iperf3 settings for the ~192 Mbps links: two streams with a 512K window reach
+# line rate quickly, so a 5 s run is as accurate as the 8 s single-stream default
+IPERF3_OPTS = {"duration_sec": 5, "parallel_streams": 2, "window": "512K"}
+
+# Lowest acceptable TCP throughput as a fraction of the PHY rate
+MIN_THROUGHPUT_FRACTION = 0.86
+
+
+def check_connectivity(deployment: DeploymentHandle, iperf3_port: int) -> None:
+    """
+    Check MANET shared bridge connectivity.
+
+    Expected: All nodes can ping each other (all-to-all connectivity).
+    """
+    verify_ping_connectivity(deployment.container_prefix, deployment.node_ips)
+
+
+def check_routing(deployment: DeploymentHandle, iperf3_port: int) -> None:
+    """
+    Check MANET shared bridge routing configuration.
+
+    Expected: All nodes have routes to the bridge subnet (192.168.100.0/24) on eth1.
+    """
+    # Verify routing for all nodes; the docker exec probes are read-only, so
+    # run them concurrently. map() re-raises the first failure in node order.
+    with ThreadPoolExecutor(max_workers=len(NODES)) as executor:
+        list(executor.map(
+            lambda node: verify_route_to_cidr(
+                deployment.container_prefix,
+                node,
+                BRIDGE_SUBNET,
+                "eth1"
+            ),
+            NODES,
+        ))
+
+    for node in NODES:
+        logger.info(f"✓ {node}: Route to {BRIDGE_SUBNET} verified on eth1")
+
+    print("\n" + "="*70)
+    print("All routing verification tests passed!")
+    print("="*70 + "\n")
+
+
+def check_tc_config(deployment: DeploymentHandle, iperf3_port: int) -> None:
+    """
+    Check MANET shared bridge TC configuration.
+
+    Expected: Per-destination TC with HTB classes, netem qdiscs, and flower filters.
+    """
+    container_prefix = deployment.container_prefix
+
+    # Expected parameters (from network.yaml: 64-QAM, 80 MHz, rate-1/2 LDPC)
+    expected_rate = SHARED_BRIDGE_PHY_RATE_MBPS
+    # Note: Delay may be very small (<0.1ms) and might not show up in netem
+    # We'll verify it's present but not check exact value
+    expected_loss = 0.0  # High SNR (no packet loss)
+
+    # (tx node, destination node, destination IP) for each direction checked
+    pairs = [
+        ("node1", "node2", "192.168.100.2"),
+        ("node1", "node3", "192.168.100.3"),
+        ("node2", "node1", "192.168.100.1"),
+    ]
+
+    # Snapshot each source node's tc state once (node1 serves two pairs). The
+    # snapshots only read state via docker exec, so take them concurrently.
+    src_nodes = sorted({tx for tx, _, _ in pairs})
+    print(f"\nSnapshotting TC configuration on {', '.join(src_nodes)}...")
+    with ThreadPoolExecutor(max_workers=len(src_nodes)) as executor:
+        snapshots = dict(zip(src_nodes, executor.map(
+            lambda node: snapshot_tc_state(f"{container_prefix}-{node}", "eth1"),
+            src_nodes,
+        ), strict=True))
+
+    results = [
+        verify_tc_config(
+            container_prefix=container_prefix,
+            node=tx,
+            interface="eth1",
+            dst_node_ip=dst_ip,
+            expected_rate_mbps=expected_rate,
+            expected_loss_percent=expected_loss,
+            rate_tolerance_mbps=2.0,  # Allow 2 Mbps tolerance
+            loss_tolerance_percent=0.1,
+            snapshot=snapshots[tx],
+        )
+        for tx, _, dst_ip in pairs
+    ]
+
+    for (tx, rx, _), result in zip(pairs, results, strict=True):
+        assert result["mode"] == "shared_bridge"
+        assert result["filter_match"] is True
+        # Delay and jitter may be 0 or very small for short distances - just verify they exist
+        assert result["delay_ms"] is not None
+        assert result["jitter_ms"] is not None
+        logger.info(f"✓ {tx} → {rx}: mode={result['mode']}, rate={result['rate_mbps']:.1f}Mbps, "
+                   f"delay={result['delay_ms']:.3f}ms, jitter={result['jitter_ms']:.3f}ms, "
+                   f"loss={result['loss_percent']:.2f}%, classid={result['htb_classid']}")
+
+    print("\n" + "="*70)
+    print("All TC configuration verification tests passed!")
+    print("="*70 + "\n")
+
+
+def check_throughput(deployment: DeploymentHandle, iperf3_port: int) -> None:
+    """
+    Check MANET shared bridge throughput.
+
+    Expected: Throughput matches configured rate (~192 Mbps for 64-QAM, 80 MHz, rate-1/2).
+    PHY rate = 80 MHz × 6 bits/symbol × 0.5 code_rate × 0.8 efficiency = 192 Mbps
+    """
+    # Run iperf3 test (using the shared bridge IPs already configured)
+    throughput = run_iperf3_test(
+        container_prefix=deployment.container_prefix,
+        server_node="node1",
+        client_node="node2",
+        server_ip=deployment.node_ips["node1"],
+        server_port=iperf3_port,
+        **IPERF3_OPTS,
+    )
+
+    # Validate: 86-100% of ~192 Mbps (64-QAM, 80 MHz, rate-1/2)
+    # Allow for protocol overhead and measurement variance
+    # Relaxed from 92% to 86% to account for TCP overhead and timing variance
+    min_throughput = MIN_THROUGHPUT_FRACTION * SHARED_BRIDGE_PHY_RATE_MBPS
+    assert min_throughput <= throughput <= SHARED_BRIDGE_PHY_RATE_MBPS, (
+        f"Throughput {throughput:.1f} Mbps not in expected range "
+        f"[{min_throughput:.1f}-{SHARED_BRIDGE_PHY_RATE_MBPS:.0f} Mbps] (86-100% of PHY rate)"
+    )
+
+
+def check_bidirectional_throughput(deployment: DeploymentHandle, iperf3_port: int) -> None:
+    """
+    Check bidirectional throughput in MANET shared bridge.
+
+    Expected: Both directions achieve similar throughput (symmetric links).
+    """
+    # Run both directions at once: node2 (client) → node1 and node1 → node2
+    throughput_2_to_1, throughput_1_to_2 = run_iperf3_bidir(
+        container_prefix=deployment.container_prefix,
+        server_node="node1",
+        client_node="node2",
+        server_ip=deployment.node_ips["node1"],
+        server_port=iperf3_port,
+        **IPERF3_OPTS,
+    )
+
+    # Both directions should be within 8% of each other (parallel streams give
+    # steadier totals than a single stream, so this is tighter than before)
+    ratio = max(throughput_1_to_2, throughput_2_to_1) / min(throughput_1_to_2, throughput_2_to_1)
+    assert ratio <= 1.08, (
+        f"Bidirectional throughput asymmetry too high: "
+        f"{throughput_1_to_2:.1f} Mbps vs {throughput_2_to_1:.1f} Mbps (ratio: {ratio:.2f})"
+    )
+
+    logger.info(
+        f"Bidirectional throughput test passed: "
+        f"node1→node2: {throughput_1_to_2:.1f} Mbps, "
+        f"node2→node1: {throughput_2_to_1:.1f} Mbps"
+    )
+
+
+# Run order: read-only checks first, then the iperf3 checks that load the links
+CHECKS = [
+    ("connectivity", check_connectivity),
+    ("routing", check_routing),
+    ("tc_config", check_tc_config),
+    ("throughput", check_throughput),
+    ("bidirectional_throughput", check_bidirectional_throughput),
+]
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.parametrize("name,fn", CHECKS, ids=[c[0] for c in CHECKS])
+def test_manet_shared_bridge(
+    name: str,
+    fn,
+    shared_bridge_deployment: DeploymentHandle,
+    shared_bridge_iperf3_port: int,
+):
+    """
+    Run one shared bridge check against the single shared deployment.
+    """
+    logger.info(f"Running shared bridge check: {name}")
+    fn(shared_bridge_deployment, shared_bridge_iperf3_port)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -9,10 +9,9 @@ from pathlib import Path
 from tests.integration.fixtures import (
     channel_server,
     deploy_topology,
-    destroy_topology,
-    stop_deployment_process,
     run_iperf3_test,
     extract_container_prefix,
+    teardown_deployment,
 )
 
 
@@ -33,8 +32,6 @@ def test_equal_triangle_throughput_node1_to_node2(channel_server, examples_for_t
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -60,8 +57,7 @@ def test_equal_triangle_throughput_node1_to_node2(channel_server, examples_for_t
         print(f"✓ Node1→Node2 throughput validated: {throughput:.2f} Mbps")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
 
 
 @pytest.mark.integration
@@ -83,8 +79,6 @@ def test_equal_triangle_throughput_all_pairs(channel_server, examples_for_tests:
     if not yaml_path.exists():
         pytest.skip(f"Example not found: {yaml_path}")
 
-    destroy_topology(str(yaml_path))
-
     deploy_process = None
     try:
         deploy_process = deploy_topology(str(yaml_path))
@@ -132,5 +126,4 @@ def test_equal_triangle_throughput_all_pairs(channel_server, examples_for_tests:
         print(f"  Min: {min(throughputs):.2f} Mbps, Max: {max(throughputs):.2f} Mbps")
 
     finally:
-        stop_deployment_process(deploy_process)
-        destroy_topology(str(yaml_path))
+        teardown_deployment(deploy_process, str(yaml_path))
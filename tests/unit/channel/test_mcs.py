@@ -5,22 +5,29 @@ Tests MCS table loading, SNR-based selection, and hysteresis behavior.
 """
 
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from sine.channel.mcs import MCSTable, MCSEntry, MODULATION_BITS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_mcs_table_path() -> Path:
     """Return path to test MCS table."""
     return Path(__file__).parent.parent.parent.parent / "examples" / "common_data" / "wifi6_mcs.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcs_table(test_mcs_table_path: Path) -> MCSTable:
-    """Load test MCS table."""
+    """Load test MCS table once per module."""
     return MCSTable.from_csv(test_mcs_table_path, hysteresis_db=2.0)
 
 
+@pytest.fixture(autouse=True)
+def _reset_link_states(mcs_table: MCSTable) -> None:
+    """Clear hysteresis history left on the shared table by earlier tests."""
+    mcs_table.reset_all_link_states()
+
+
 class TestMCSEntry:
     """Test MCSEntry dataclass."""
 
@@ -89,6 +96,34 @@ class TestMCSEntry:
         entry = MCSEntry.from_csv_row(row)
         assert entry.bandwidth_mhz == 80.0
 
+    def test_from_csv_row_explicit_bits_per_symbol(self):
+        """Test that an explicit bits_per_symbol column overrides the derived value."""
+        row = {
+            "mcs_index": "5",
+            "modulation": "64qam",
+            "code_rate": "0.5",
+            "min_snr_db": "20.0",
+            "fec_type": "ldpc",
+            "bits_per_symbol": "4",
+        }
+
+        entry = MCSEntry.from_csv_row(row)
+        assert entry.bits_per_symbol == 4
+        assert entry.spectral_efficiency == 2.0
+
+    def test_from_csv_row_empty_bits_per_symbol(self):
+        """Test that an empty bits_per_symbol cell falls back to the modulation."""
+        row = {
+            "mcs_index": "5",
+            "modulation": "64qam",
+            "code_rate": "0.5",
+            "min_snr_db": "20.0",
+            "bits_per_symbol": "",
+        }
+
+        entry = MCSEntry.from_csv_row(row)
+        assert entry.bits_per_symbol == 6
+
     def test_from_csv_row_missing_fec_type(self):
         """Test that fec_type defaults to 'ldpc' if missing."""
         row = {
@@ -115,6 +150,20 @@ class TestMCSEntry:
         with pytest.raises(Exception):  # dataclass(frozen=True) raises FrozenInstanceError
             entry.mcs_index = 10
 
+    def test_mcs_entry_slots(self):
+        """Test that MCSEntry uses __slots__ (no per-instance __dict__)."""
+        entry = MCSEntry(
+            mcs_index=5,
+            modulation="64qam",
+            code_rate=0.5,
+            min_snr_db=20.0,
+            fec_type="ldpc",
+            bits_per_symbol=6,
+        )
+
+        assert "mcs_index" in MCSEntry.__slots__
+        assert not hasattr(entry, "__dict__")
+
 
 class TestMCSTableLoading:
     """Test MCS table loading from CSV."""
@@ -126,6 +175,53 @@ class TestMCSTableLoading:
         assert len(table) == 12  # wifi6_mcs.csv has 12 entries
         assert table.hysteresis_db == 2.0
 
+    def test_load_reuses_parsed_entries(self, test_mcs_table_path: Path):
+        """Reloading an unchanged file shares entries but not hysteresis state."""
+        table_a = MCSTable.from_csv(test_mcs_table_path)
+        table_b = MCSTable.from_csv(test_mcs_table_path)
+
+        assert table_a is not table_b
+        assert all(a is b for a, b in zip(table_a.entries, table_b.entries, strict=True))
+
+        # Hysteresis history on table_a must not leak into table_b
+        table_a.select_mcs(snr_db=20.0, link_id="link1")
+        assert table_b.select_mcs(snr_db=24.0, link_id="link1").mcs_index == 6
+
+    def test_load_rereads_modified_file(self, tmp_path: Path):
+        """Editing the CSV (new mtime) invalidates the cached entries."""
+        import os
+
+        csv_path = tmp_path / "mcs.csv"
+        header = "mcs_index,modulation,code_rate,min_snr_db,fec_type\n"
+        csv_path.write_text(header + "0,bpsk,0.5,5.0,ldpc\n")
+        assert len(MCSTable.from_csv(csv_path)) == 1
+
+        csv_path.write_text(header + "0,bpsk,0.5,5.0,ldpc\n1,qpsk,0.5,8.0,ldpc\n")
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert len(MCSTable.from_csv(csv_path)) == 2
+
+    def test_load_matches_row_parsing(self, tmp_path: Path):
+        """Column-wise CSV loading agrees with MCSEntry.from_csv_row per row."""
+        import csv
+
+        csv_path = tmp_path / "mcs.csv"
+        csv_path.write_text(
+            "mcs_index,modulation,code_rate,min_snr_db,bandwidth_mhz\n"
+            "0,BPSK,0.5,5.0,20\n"
+            "\n"
+            "1,qpsk,0.75,8.0,\n"
+        )
+
+        table = MCSTable.from_csv(csv_path)
+
+        with open(csv_path, newline="") as f:
+            expected = [MCSEntry.from_csv_row(row) for row in csv.DictReader(f)]
+        assert list(table.entries) == expected
+        assert table.entries[0].fec_type == "ldpc"
+        assert table.entries[0].bandwidth_mhz == 20.0
+        assert table.entries[1].bandwidth_mhz is None
+
     def test_load_nonexistent_file(self):
         """Test that loading nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -138,11 +234,38 @@ class TestMCSTableLoading:
                 mcs_table.entries[i].min_snr_db <= mcs_table.entries[i + 1].min_snr_db
             ), "MCS entries not sorted by SNR"
 
+    def test_unsorted_entries_are_sorted(self, mcs_table: MCSTable):
+        """Test that entries given out of order are sorted into a tuple."""
+        table = MCSTable(entries=list(reversed(mcs_table.entries)))
+
+        assert table.entries == mcs_table.entries
+        assert table.min_snr_db.tolist() == mcs_table.min_snr_db.tolist()
+
     def test_empty_table_raises_error(self):
         """Test that empty MCS table raises ValueError."""
         with pytest.raises(ValueError, match="at least one entry"):
             MCSTable(entries=[], hysteresis_db=2.0)
 
+    def test_negative_mcs_index_raises_error(self, mcs_table: MCSTable):
+        """-1 is the no-history sentinel, so negative MCS indices are rejected."""
+        bad = replace(mcs_table.entries[0], mcs_index=-1)
+        with pytest.raises(ValueError, match="non-negative"):
+            MCSTable(entries=[bad, *mcs_table.entries[1:]])
+
+    def test_columns_match_entries(self, mcs_table: MCSTable):
+        """Columnar arrays mirror the sorted entries row by row and are read-only."""
+        assert mcs_table.min_snr_db.tolist() == [e.min_snr_db for e in mcs_table.entries]
+        assert mcs_table.mcs_index.tolist() == [e.mcs_index for e in mcs_table.entries]
+        assert mcs_table.bits_per_symbol.tolist() == [
+            e.bits_per_symbol for e in mcs_table.entries
+        ]
+        assert mcs_table.code_rate.tolist() == pytest.approx(
+            [e.code_rate for e in mcs_table.entries]
+        )
+
+        with pytest.raises(ValueError):
+            mcs_table.min_snr_db[0] = 0.0
+
     def test_table_len(self, mcs_table: MCSTable):
         """Test table length."""
         assert len(mcs_table) == 12
@@ -174,6 +297,14 @@ class TestMCSSelection:
         assert mcs.mcs_index == 11
         assert mcs.modulation == "1024qam"
 
+    def test_select_lowest_mcs_for_nan_snr(self, mcs_table: MCSTable):
+        """A NaN SNR selects the lowest MCS, never the highest."""
+        assert mcs_table.select_mcs(snr_db=float("nan")).mcs_index == 0
+
+        # With hysteresis history, NaN still downgrades to the lowest MCS
+        mcs_table.select_mcs(snr_db=40.0, link_id="link1")
+        assert mcs_table.select_mcs(snr_db=float("nan"), link_id="link1").mcs_index == 0
+
     @pytest.mark.parametrize(
         "snr_db,expected_mcs_index",
         [
@@ -211,12 +342,40 @@ class TestMCSSelection:
         import numpy as np
 
         snr_values = np.linspace(0, 40, 50)
-        mcs_indices = [mcs_table.select_mcs(s).mcs_index for s in snr_values]
+        mcs_indices = mcs_table.select_mcs_batch(snr_values)
 
         # Check monotonic increase
-        for i in range(len(mcs_indices) - 1):
-            assert mcs_indices[i] <= mcs_indices[i + 1], \
-                f"MCS decreased from {mcs_indices[i]} to {mcs_indices[i+1]} at SNR {snr_values[i]}→{snr_values[i+1]}"
+        steps = np.diff(mcs_indices)
+        assert np.all(steps >= 0), (
+            f"MCS decreased at SNR {snr_values[np.argmin(steps)]}"
+            f"→{snr_values[np.argmin(steps) + 1]}"
+        )
+
+    def test_select_mcs_batch(self, mcs_table: MCSTable):
+        """Vectorized selection matches scalar select_mcs for every SNR."""
+        import numpy as np
+
+        # Include values below/above all thresholds and exact thresholds
+        snr_values = np.concatenate([
+            np.linspace(-10, 50, 121),
+            [e.min_snr_db for e in mcs_table.entries],
+        ])
+
+        batch = mcs_table.select_mcs_batch(snr_values)
+
+        assert batch.shape == snr_values.shape
+        assert batch.tolist() == [mcs_table.select_mcs(s).mcs_index for s in snr_values]
+
+    def test_batch_selects_lowest_mcs_for_nan_snr(self, mcs_table: MCSTable):
+        """Batch selection maps NaN to the lowest MCS, as the scalar path does."""
+        import numpy as np
+
+        snr = np.array([np.nan, 40.0, np.nan])
+        assert mcs_table.select_mcs_batch(snr).tolist() == [0, 11, 0]
+
+        slots = np.array([mcs_table.link_idx(f"link{i}") for i in range(3)])
+        mcs_table.select_mcs_batch_by_link_idx(np.full(3, 40.0), slots)
+        assert mcs_table.select_mcs_batch_by_link_idx(snr, slots).tolist() == [0, 11, 0]
 
 
 class TestMCSHysteresis:
@@ -311,7 +470,95 @@ class TestMCSHysteresis:
         mcs_table.reset_all_link_states()
 
         # All links should behave as if first selection (no hysteresis)
-        assert mcs_table._current_mcs == {}
+        assert mcs_table.select_mcs(snr_db=24.0, link_id="link1").mcs_index == 6
+        assert mcs_table.select_mcs(snr_db=20.0, link_id="link3").mcs_index == 5
+
+    def test_select_mcs_by_link_idx(self, mcs_table: MCSTable, test_mcs_table_path: Path):
+        """Slot-based selection matches the link_id API across an SNR trace."""
+        by_id = MCSTable.from_csv(test_mcs_table_path, hysteresis_db=2.0)
+        snr_trace = [20.0, 24.0, 25.5, 19.0, 17.5, 30.0, 10.0, 10.0, 35.0]
+
+        idx = mcs_table.link_idx("link1")
+        assert mcs_table.link_idx("link1") == idx
+        assert mcs_table.link_idx("link2") != idx
+
+        for snr in snr_trace:
+            assert (
+                mcs_table.select_mcs_by_link_idx(snr, idx).mcs_index
+                == by_id.select_mcs(snr, link_id="link1").mcs_index
+            )
+
+        # The two APIs share state: the string API sees the slot's history
+        assert mcs_table.select_mcs(34.0, link_id="link1").mcs_index == by_id.select_mcs(
+            34.0, link_id="link1"
+        ).mcs_index
+
+    def test_select_mcs_batch_by_link_idx(self, mcs_table: MCSTable, test_mcs_table_path: Path):
+        """Vectorized hysteresis matches the scalar path tick by tick."""
+        import numpy as np
+
+        scalar = MCSTable.from_csv(test_mcs_table_path, hysteresis_db=2.0)
+        rng = np.random.default_rng(0)
+        links = [f"link{i}" for i in range(20)]
+        slots = np.array([mcs_table.link_idx(link) for link in links])
+
+        # Random walk around the thresholds so upgrades and downgrades are held
+        snr = rng.uniform(0, 40, len(links))
+        for _ in range(30):
+            snr = snr + rng.normal(0, 2.5, len(links))
+            batch = mcs_table.select_mcs_batch_by_link_idx(snr, slots)
+            expected = [
+                scalar.select_mcs(s, link_id=link).mcs_index
+                for s, link in zip(snr, links, strict=True)
+            ]
+            assert batch.tolist() == expected
+
+        # The state array can still grow after a batch call
+        mcs_table.link_idx("late_link")
+
+    def test_batch_error_releases_state_buffer(self, mcs_table: MCSTable):
+        """A failing batch call does not leave the state array locked against growth."""
+        import numpy as np
+
+        slot = mcs_table.link_idx("link1")
+        try:
+            mcs_table.select_mcs_batch_by_link_idx(
+                np.array([10.0, 20.0]), np.array([slot, slot + 100])
+            )
+        except IndexError:
+            # The live traceback keeps the failed call's frame (and its locals)
+            # alive; growing the state array must still work
+            mcs_table.link_idx("link_after_failed_batch")
+        else:
+            pytest.fail("out-of-range slot did not raise IndexError")
+
+    @pytest.mark.parametrize("hysteresis_db", [0.0, 1.0, 2.0, 6.0])
+    def test_batch_hysteresis_fuzz_near_thresholds(
+        self, test_mcs_table_path: Path, hysteresis_db: float
+    ):
+        """Fuzz: branchless batch decisions match the branchy scalar reference.
+
+        SNR fades around the thresholds (within the hysteresis band), where
+        upgrade/downgrade decisions flip most often.
+        """
+        import numpy as np
+
+        batch_table = MCSTable.from_csv(test_mcs_table_path, hysteresis_db=hysteresis_db)
+        reference = MCSTable.from_csv(test_mcs_table_path, hysteresis_db=hysteresis_db)
+        rng = np.random.default_rng(int(hysteresis_db * 10))
+
+        links = [f"link{i}" for i in range(32)]
+        slots = np.array([batch_table.link_idx(link) for link in links])
+        centers = rng.choice(batch_table.min_snr_db, len(links))
+
+        for _ in range(50):
+            snr = centers + rng.normal(0, hysteresis_db + 1.0, len(links))
+            batch = batch_table.select_mcs_batch_by_link_idx(snr, slots)
+            expected = [
+                reference.select_mcs(s, link_id=link).mcs_index
+                for s, link in zip(snr, links, strict=True)
+            ]
+            assert batch.tolist() == expected
 
 
 class TestMCSTableProperties:
@@ -368,6 +615,11 @@ class TestModulationBitsConstant:
         expected_mods = {"bpsk", "qpsk", "16qam", "64qam", "256qam", "1024qam"}
         assert set(MODULATION_BITS.keys()) == expected_mods
 
+    def test_modulation_bits_read_only(self):
+        """Test that MODULATION_BITS cannot be mutated."""
+        with pytest.raises(TypeError):
+            MODULATION_BITS["8psk"] = 3
+
 
 class TestMCSHysteresisEdgeCases:
     """Test edge cases in hysteresis logic."""
@@ -1,11 +1,19 @@
 """Unit tests for enable_sinr flag and is_active field in schema."""
 
 import logging
+
+import pytest
+
 from sine.config.schema import (
+    AntennaPattern,
+    FECType,
+    ModulationType,
     NetworkTopology,
+    Polarization,
     TopologyDefinition,
     NodeConfig,
     InterfaceConfig,
+    Position,
     WirelessParams,
     CSMAConfig,
     TDMAConfig,
@@ -15,96 +23,89 @@ from sine.config.schema import (
 logger = logging.getLogger(__name__)
 
 
-def _create_test_nodes():
-    """Helper to create standard test nodes for unit tests."""
-    return {
-        "node1": NodeConfig(
-            kind="linux",
-            image="alpine:latest",
-            interfaces={
-                "eth1": InterfaceConfig(
-                    wireless=WirelessParams(
-                        position={"x": 0.0, "y": 0.0, "z": 1.0},
-                        frequency_ghz=5.18,
-                        rf_power_dbm=20.0,
-                        bandwidth_mhz=80.0,
-                        antenna_pattern="hw_dipole",
-                        polarization="V",
-                        modulation="64qam",
-                        fec_type="ldpc",
-                        fec_code_rate=0.5,
-                    )
-                )
-            },
-        ),
-        "node2": NodeConfig(
-            kind="linux",
-            image="alpine:latest",
-            interfaces={
-                "eth1": InterfaceConfig(
-                    wireless=WirelessParams(
-                        position={"x": 20.0, "y": 0.0, "z": 1.0},
-                        frequency_ghz=5.18,
-                        rf_power_dbm=20.0,
-                        bandwidth_mhz=80.0,
-                        antenna_pattern="hw_dipole",
-                        polarization="V",
-                        modulation="64qam",
-                        fec_type="ldpc",
-                        fec_code_rate=0.5,
-                    )
-                )
-            },
-        ),
-    }
+# Known-valid template built with model_construct, which skips validation and
+# coercion: every value is given in its final type (enums, Position). Tests
+# derive variants with model_copy(update=...), which does not validate either,
+# so update values must also be valid and correctly typed.
+#
+# Validation is split as follows: WirelessParams' own validators are exercised
+# by the is_active tests (real constructor) and by
+# test_base_wireless_template_is_valid, which guards this template. The
+# enable_sinr/MAC warnings come from TopologyDefinition validation, which
+# still runs in every test below.
+_BASE_WIRELESS = WirelessParams.model_construct(
+    position=Position.model_construct(x=0.0, y=0.0, z=1.0),
+    frequency_ghz=5.18,
+    rf_power_dbm=20.0,
+    bandwidth_mhz=80.0,
+    antenna_pattern=AntennaPattern.HW_DIPOLE,
+    polarization=Polarization.V,
+    modulation=ModulationType.QAM64,
+    fec_type=FECType.LDPC,
+    fec_code_rate=0.5,
+)
 
+_NODE2_POSITION = Position.model_construct(x=20.0, y=0.0, z=1.0)
 
-def test_enable_sinr_explicit_true():
-    """Test enable_sinr=true with wireless interfaces."""
-    network = NetworkTopology(
-        name="test-sinr-enabled",
-        topology=TopologyDefinition(
-            enable_sinr=True,
-            scene=SceneConfig(file="scenes/vacuum.xml"),
-            nodes=_create_test_nodes(),
-            links=[{"endpoints": ["node1:eth1", "node2:eth1"]}],
-        ),
-    )
-    assert network.topology.enable_sinr is True
 
+def _wireless(**update) -> WirelessParams:
+    """Return a copy of the base wireless params with fields overridden."""
+    return _BASE_WIRELESS.model_copy(update=update)
 
-def test_enable_sinr_explicit_false():
-    """Test enable_sinr=false (SNR-only mode)."""
-    network = NetworkTopology(
-        name="test-sinr-disabled",
-        topology=TopologyDefinition(
-            enable_sinr=False,
-            scene=SceneConfig(file="scenes/vacuum.xml"),
-            nodes=_create_test_nodes(),
-            links=[{"endpoints": ["node1:eth1", "node2:eth1"]}],
-        ),
+
+def _node(**interfaces: WirelessParams) -> NodeConfig:
+    """Build a linux node with the given wireless interfaces."""
+    return NodeConfig(
+        kind="linux",
+        image="alpine:latest",
+        interfaces={
+            name: InterfaceConfig(wireless=wireless) for name, wireless in interfaces.items()
+        },
     )
-    assert network.topology.enable_sinr is False
 
 
-def test_enable_sinr_default_false():
-    """Test default value (false when not specified)."""
+@pytest.fixture
+def test_nodes() -> dict[str, NodeConfig]:
+    """Standard two-node setup; fresh copies per test so tests may mutate them."""
+    return {
+        "node1": _node(eth1=_wireless()),
+        "node2": _node(eth1=_wireless(position=_NODE2_POSITION)),
+    }
+
+
+def test_base_wireless_template_is_valid():
+    """The model_construct template must survive full validation unchanged."""
+    validated = WirelessParams.model_validate(_BASE_WIRELESS.model_dump())
+    assert validated == _BASE_WIRELESS
+    assert Position.model_validate(_NODE2_POSITION.model_dump()) == _NODE2_POSITION
+
+
+@pytest.mark.parametrize(
+    "enable_sinr, expected",
+    [(True, True), (False, False), (None, False)],
+    ids=["explicit_true", "explicit_false", "default_false"],
+)
+def test_enable_sinr(test_nodes, enable_sinr, expected):
+    """Test enable_sinr explicit values and default (false when not specified)."""
+    # None means the field is omitted so the schema default applies
+    extra = {} if enable_sinr is None else {"enable_sinr": enable_sinr}
     network = NetworkTopology(
-        name="test-sinr-default",
+        name="test-sinr",
         topology=TopologyDefinition(
             scene=SceneConfig(file="scenes/vacuum.xml"),
-            nodes=_create_test_nodes(),
+            nodes=test_nodes,
             links=[{"endpoints": ["node1:eth1", "node2:eth1"]}],
+            **extra,
         ),
     )
-    assert network.topology.enable_sinr is False
+    assert network.topology.enable_sinr is expected
 
 
-def test_enable_sinr_false_with_csma_warns(caplog):
+def test_enable_sinr_false_with_csma_warns(caplog, test_nodes):
     """Test warning when CSMA configured with enable_sinr=false."""
     caplog.set_level(logging.WARNING)
 
-    nodes = _create_test_nodes()
+    nodes = test_nodes
     # Add CSMA to node1
     nodes["node1"].interfaces["eth1"].wireless.csma = CSMAConfig(enabled=True)
 
@@ -126,11 +127,11 @@ def test_enable_sinr_false_with_csma_warns(caplog):
     )
 
 
-def test_enable_sinr_false_with_tdma_warns(caplog):
+def test_enable_sinr_false_with_tdma_warns(caplog, test_nodes):
     """Test warning when TDMA configured with enable_sinr=false."""
     caplog.set_level(logging.WARNING)
 
-    nodes = _create_test_nodes()
+    nodes = test_nodes
     # Add TDMA to node1
     nodes["node1"].interfaces["eth1"].wireless.tdma = TDMAConfig(
         enabled=True,
@@ -155,41 +156,15 @@ def test_enable_sinr_false_with_tdma_warns(caplog):
     )
 
 
-def test_is_active_field_default_true():
-    """Test is_active field defaults to True."""
-    wireless_params = WirelessParams(
-        position={"x": 0.0, "y": 0.0, "z": 1.0},
-        frequency_ghz=5.18,
-        rf_power_dbm=20.0,
-        bandwidth_mhz=80.0,
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-    )
-    assert wireless_params.is_active is True
-
-
-def test_is_active_field_explicit_false():
-    """Test is_active can be set to False."""
-    wireless_params = WirelessParams(
-        position={"x": 0.0, "y": 0.0, "z": 1.0},
-        frequency_ghz=5.18,
-        rf_power_dbm=20.0,
-        bandwidth_mhz=80.0,
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-        is_active=False,
-    )
-    assert wireless_params.is_active is False
-
-
-def test_is_active_field_explicit_true():
-    """Test is_active can be explicitly set to True."""
+@pytest.mark.parametrize(
+    "is_active, expected",
+    [(None, True), (False, False), (True, True)],
+    ids=["default_true", "explicit_false", "explicit_true"],
+)
+def test_is_active_field(is_active, expected):
+    """Test is_active defaults to True and can be set explicitly."""
+    # None means the field is omitted so the schema default applies
+    extra = {} if is_active is None else {"is_active": is_active}
     wireless_params = WirelessParams(
         position={"x": 0.0, "y": 0.0, "z": 1.0},
         frequency_ghz=5.18,
@@ -200,9 +175,9 @@ def test_is_active_field_explicit_true():
         modulation="64qam",
         fec_type="ldpc",
         fec_code_rate=0.5,
-        is_active=True,
+        **extra,
     )
-    assert wireless_params.is_active is True
+    assert wireless_params.is_active is expected
 
 
 def test_multi_radio_selective_disable():
@@ -213,59 +188,15 @@ def test_multi_radio_selective_disable():
             enable_sinr=True,
             scene=SceneConfig(file="scenes/vacuum.xml"),
             nodes={
-                "dual_band_node": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 0.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=True,  # 5 GHz active
-                            )
-                        ),
-                        "eth2": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 0.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=2.4,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=20.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=False,  # 2.4 GHz disabled
-                            )
-                        ),
-                    },
-                ),
-                "node2": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 20.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                            )
-                        )
-                    },
+                "dual_band_node": _node(
+                    eth1=_wireless(is_active=True),  # 5 GHz active
+                    eth2=_wireless(
+                        frequency_ghz=2.4,
+                        bandwidth_mhz=20.0,
+                        is_active=False,  # 2.4 GHz disabled
+                    ),
                 ),
+                "node2": _node(eth1=_wireless(position=_NODE2_POSITION)),
             },
             links=[{"endpoints": ["dual_band_node:eth1", "node2:eth1"]}],
         ),
@@ -294,46 +225,8 @@ def test_inactive_tx_interface_validation():
             enable_sinr=True,
             scene=SceneConfig(file="scenes/vacuum.xml"),
             nodes={
-                "node1": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 0.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=False,  # TX is inactive!
-                            )
-                        )
-                    },
-                ),
-                "node2": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 20.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=True,
-                            )
-                        )
-                    },
-                ),
+                "node1": _node(eth1=_wireless(is_active=False)),  # TX is inactive!
+                "node2": _node(eth1=_wireless(position=_NODE2_POSITION, is_active=True)),
             },
             links=[{"endpoints": ["node1:eth1", "node2:eth1"]}],
         ),
@@ -352,45 +245,10 @@ def test_inactive_rx_interface_allowed():
             enable_sinr=True,
             scene=SceneConfig(file="scenes/vacuum.xml"),
             nodes={
-                "node1": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 0.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=True,  # TX is active
-                            )
-                        )
-                    },
-                ),
-                "node2": NodeConfig(
-                    kind="linux",
-                    image="alpine:latest",
-                    interfaces={
-                        "eth1": InterfaceConfig(
-                            wireless=WirelessParams(
-                                position={"x": 20.0, "y": 0.0, "z": 1.0},
-                                frequency_ghz=5.18,
-                                rf_power_dbm=20.0,
-                                bandwidth_mhz=80.0,
-                                antenna_pattern="hw_dipole",
-                                polarization="V",
-                                modulation="64qam",
-                                fec_type="ldpc",
-                                fec_code_rate=0.5,
-                                is_active=False,  # RX is inactive (listen-only)
-                            )
-                        )
-                    },
+                "node1": _node(eth1=_wireless(is_active=True)),  # TX is active
+                "node2": _node(
+                    # RX is inactive (listen-only)
+                    eth1=_wireless(position=_NODE2_POSITION, is_active=False),
                 ),
             },
             links=[{"endpoints": ["node1:eth1", "node2:eth1"]}],
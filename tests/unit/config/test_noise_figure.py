@@ -5,6 +5,9 @@ Verifies that noise_figure_db can be configured at node and interface levels,
 with proper defaults and validation.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -16,20 +19,33 @@ from sine.config.schema import (
     WirelessParams,
 )
 
+# Reused as-is by every WirelessParams below (Position is not frozen; don't mutate)
+_POS_ORIGIN = Position(x=0, y=0, z=1)
+
+
+@pytest.fixture(scope="module")
+def base_wireless_kwargs() -> dict:
+    """Valid WirelessParams keyword arguments shared by the interface-level tests.
+
+    Tests build ``WirelessParams(**{**base_wireless_kwargs, ...})`` so the
+    field under test still goes through full validation.
+    """
+    return {
+        "position": _POS_ORIGIN,
+        "rf_power_dbm": 20.0,
+        "frequency_ghz": 5.18,
+        "bandwidth_mhz": 80,
+        "antenna_pattern": "hw_dipole",
+        "polarization": "V",
+        "modulation": "64qam",
+        "fec_type": "ldpc",
+        "fec_code_rate": 0.5,
+    }
+
 
-def test_default_noise_figure_interface_level():
+def test_default_noise_figure_interface_level(base_wireless_kwargs):
     """Verify default noise_figure_db is 7.0 dB at interface level."""
-    wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=20.0,
-        frequency_ghz=5.18,
-        bandwidth_mhz=80,
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-    )
+    wireless = WirelessParams(**base_wireless_kwargs)
     assert wireless.noise_figure_db == 7.0
 
 
@@ -42,211 +58,133 @@ def test_default_noise_figure_node_level():
     assert node.noise_figure_db == 7.0
 
 
-def test_custom_noise_figure_wifi6():
-    """Test custom noise figure for high-performance WiFi 6 (6.0 dB)."""
-    wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=20.0,
-        frequency_ghz=5.18,
-        bandwidth_mhz=80,
-        noise_figure_db=6.0,
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-    )
-    assert wireless.noise_figure_db == 6.0
-
-
-def test_custom_noise_figure_5g_bs():
-    """Test custom noise figure for 5G base station (4.0 dB)."""
-    wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=30.0,
-        frequency_ghz=3.5,
-        bandwidth_mhz=100,
-        noise_figure_db=4.0,
-        antenna_pattern="tr38901",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.667,
-    )
-    assert wireless.noise_figure_db == 4.0
-
-
-def test_custom_noise_figure_cheap_iot():
-    """Test custom noise figure for cheap IoT radio (10.0 dB)."""
-    wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=14.0,
-        frequency_ghz=0.915,
-        bandwidth_mhz=20,
-        noise_figure_db=10.0,
-        antenna_pattern="dipole",
-        polarization="V",
-        modulation="qpsk",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-    )
-    assert wireless.noise_figure_db == 10.0
-
-
-def test_noise_figure_validation_too_low():
-    """Test that negative noise figure is rejected."""
-    with pytest.raises(ValidationError) as excinfo:
-        WirelessParams(
-            position=Position(x=0, y=0, z=1),
-            rf_power_dbm=20.0,
-            frequency_ghz=5.18,
-            bandwidth_mhz=80,
-            noise_figure_db=-1.0,  # Invalid: negative
-            antenna_pattern="hw_dipole",
-            polarization="V",
-            modulation="64qam",
-            fec_type="ldpc",
-            fec_code_rate=0.5,
-        )
-    assert "noise_figure_db" in str(excinfo.value)
-
-
-def test_noise_figure_validation_too_high():
-    """Test that noise figure > 20 dB is rejected."""
-    with pytest.raises(ValidationError) as excinfo:
-        WirelessParams(
-            position=Position(x=0, y=0, z=1),
-            rf_power_dbm=20.0,
-            frequency_ghz=5.18,
-            bandwidth_mhz=80,
-            noise_figure_db=25.0,  # Invalid: > 20 dB
-            antenna_pattern="hw_dipole",
-            polarization="V",
-            modulation="64qam",
-            fec_type="ldpc",
-            fec_code_rate=0.5,
-        )
-    assert "noise_figure_db" in str(excinfo.value)
-
-
-def test_noise_figure_at_boundary_low():
-    """Test noise figure at lower boundary (0.0 dB - theoretical ideal)."""
-    wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=20.0,
-        frequency_ghz=5.18,
-        bandwidth_mhz=80,
-        noise_figure_db=0.0,  # Boundary: theoretical ideal receiver
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
-    )
-    assert wireless.noise_figure_db == 0.0
-
-
-def test_noise_figure_at_boundary_high():
-    """Test noise figure at upper boundary (20.0 dB - extremely poor receiver)."""
+@pytest.mark.parametrize(
+    "nf_db, overrides",
+    [
+        # High-performance WiFi 6
+        (6.0, {}),
+        # 5G base station
+        (
+            4.0,
+            {
+                "rf_power_dbm": 30.0,
+                "frequency_ghz": 3.5,
+                "bandwidth_mhz": 100,
+                "antenna_pattern": "tr38901",
+                "fec_code_rate": 0.667,
+            },
+        ),
+        # Cheap IoT radio
+        (
+            10.0,
+            {
+                "rf_power_dbm": 14.0,
+                "frequency_ghz": 0.915,
+                "bandwidth_mhz": 20,
+                "antenna_pattern": "dipole",
+                "modulation": "qpsk",
+            },
+        ),
+        # Boundary: theoretical ideal receiver
+        (0.0, {}),
+        # Boundary: extremely poor/broken receiver
+        (20.0, {}),
+    ],
+    ids=["wifi6", "5g_bs", "cheap_iot", "boundary_low", "boundary_high"],
+)
+def test_custom_noise_figure(base_wireless_kwargs, nf_db, overrides):
+    """Test custom interface-level noise figures, including the 0-20 dB boundaries."""
     wireless = WirelessParams(
-        position=Position(x=0, y=0, z=1),
-        rf_power_dbm=20.0,
-        frequency_ghz=5.18,
-        bandwidth_mhz=80,
-        noise_figure_db=20.0,  # Boundary: extremely poor/broken receiver
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
-        fec_code_rate=0.5,
+        **{**base_wireless_kwargs, **overrides, "noise_figure_db": nf_db}
     )
-    assert wireless.noise_figure_db == 20.0
-
-
-def test_node_level_noise_figure():
-    """Test node-level noise_figure_db configuration."""
-    node = NodeConfig(
-        kind="linux",
-        image="alpine:latest",
-        noise_figure_db=5.0,
-    )
-    assert node.noise_figure_db == 5.0
-
-
-def test_node_level_boundary_values():
-    """Test node-level noise_figure_db boundary validation."""
-    # Valid: 0.0 dB
-    node = NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=0.0)
-    assert node.noise_figure_db == 0.0
-
-    # Valid: 20.0 dB
-    node = NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=20.0)
-    assert node.noise_figure_db == 20.0
-
-    # Invalid: negative
-    with pytest.raises(ValidationError):
-        NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=-1.0)
-
-    # Invalid: > 20 dB
-    with pytest.raises(ValidationError):
-        NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=21.0)
-
-
-def test_full_topology_with_custom_noise_figure():
-    """Test complete topology with custom noise figure values."""
-    topology_dict = {
-        "name": "noise_figure_test",
-        "topology": {
-            "nodes": {
-                "node1": {
-                    "kind": "linux",
-                    "image": "alpine:latest",
-                    "noise_figure_db": 6.0,  # Node-level default
-                    "interfaces": {
-                        "eth1": {
-                            "wireless": {
-                                "position": {"x": 0, "y": 0, "z": 1},
-                                "rf_power_dbm": 20.0,
-                                "frequency_ghz": 5.18,
-                                "bandwidth_mhz": 80,
-                                "noise_figure_db": 7.0,  # Interface-level override
-                                "antenna_pattern": "hw_dipole",
-                                "polarization": "V",
-                                "modulation": "64qam",
-                                "fec_type": "ldpc",
-                                "fec_code_rate": 0.5,
-                            }
+    assert wireless.noise_figure_db == nf_db
+
+
+@pytest.mark.parametrize("bad_nf", [-1.0, 25.0], ids=["too_low", "too_high"])
+def test_noise_figure_validation(base_wireless_kwargs, bad_nf):
+    """Test that noise figures outside 0-20 dB are rejected."""
+    with pytest.raises(ValidationError, match=r"noise_figure_db"):
+        WirelessParams(**{**base_wireless_kwargs, "noise_figure_db": bad_nf})
+
+
+@pytest.mark.parametrize("nf_db", [0.0, 5.0, 20.0])
+def test_node_level_noise_figure(nf_db):
+    """Test node-level noise_figure_db configuration, including boundaries."""
+    node = NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=nf_db)
+    assert node.noise_figure_db == nf_db
+
+
+@pytest.mark.parametrize("bad_nf", [-1.0, 21.0], ids=["too_low", "too_high"])
+def test_node_level_noise_figure_validation(bad_nf):
+    """Test that node-level noise figures outside 0-20 dB are rejected."""
+    with pytest.raises(ValidationError, match=r"noise_figure_db"):
+        NodeConfig(kind="linux", image="alpine:latest", noise_figure_db=bad_nf)
+
+
+# Two-node topology: node1 sets a node-level noise figure and overrides it per
+# interface, node2 relies on the defaults. Read-only at the top level.
+_TOPO_DICT = MappingProxyType({
+    "name": "noise_figure_test",
+    "topology": {
+        "nodes": {
+            "node1": {
+                "kind": "linux",
+                "image": "alpine:latest",
+                "noise_figure_db": 6.0,  # Node-level default
+                "interfaces": {
+                    "eth1": {
+                        "wireless": {
+                            "position": {"x": 0, "y": 0, "z": 1},
+                            "rf_power_dbm": 20.0,
+                            "frequency_ghz": 5.18,
+                            "bandwidth_mhz": 80,
+                            "noise_figure_db": 7.0,  # Interface-level override
+                            "antenna_pattern": "hw_dipole",
+                            "polarization": "V",
+                            "modulation": "64qam",
+                            "fec_type": "ldpc",
+                            "fec_code_rate": 0.5,
                         }
-                    },
+                    }
                 },
-                "node2": {
-                    "kind": "linux",
-                    "image": "alpine:latest",
-                    "interfaces": {
-                        "eth1": {
-                            "wireless": {
-                                "position": {"x": 20, "y": 0, "z": 1},
-                                "rf_power_dbm": 20.0,
-                                "frequency_ghz": 5.18,
-                                "bandwidth_mhz": 80,
-                                "antenna_pattern": "hw_dipole",
-                                "polarization": "V",
-                                "modulation": "64qam",
-                                "fec_type": "ldpc",
-                                "fec_code_rate": 0.5,
-                            }
+            },
+            "node2": {
+                "kind": "linux",
+                "image": "alpine:latest",
+                "interfaces": {
+                    "eth1": {
+                        "wireless": {
+                            "position": {"x": 20, "y": 0, "z": 1},
+                            "rf_power_dbm": 20.0,
+                            "frequency_ghz": 5.18,
+                            "bandwidth_mhz": 80,
+                            "antenna_pattern": "hw_dipole",
+                            "polarization": "V",
+                            "modulation": "64qam",
+                            "fec_type": "ldpc",
+                            "fec_code_rate": 0.5,
                         }
-                    },
+                    }
                 },
             },
-            "links": [
-                {"endpoints": ["node1:eth1", "node2:eth1"]},
-            ],
-            "scene": {"file": "scenes/vacuum.xml"},
         },
-    }
+        "links": [
+            {"endpoints": ["node1:eth1", "node2:eth1"]},
+        ],
+        "scene": {"file": "scenes/vacuum.xml"},
+    },
+})
+
+
+@lru_cache(maxsize=1)
+def _built_topo() -> NetworkTopology:
+    """Validate _TOPO_DICT once; tests share the result and must not mutate it."""
+    return NetworkTopology(**dict(_TOPO_DICT))
 
-    topology = NetworkTopology(**topology_dict)
+
+def test_full_topology_with_custom_noise_figure():
+    """Test complete topology with custom noise figure values."""
+    topology = _built_topo()
 
     # Verify node-level noise figure
     assert topology.topology.nodes["node1"].noise_figure_db == 6.0
@@ -14,9 +14,14 @@ import pytest
 from pydantic import ValidationError
 
 from sine.config.schema import (
+    AntennaPattern,
+    FECType,
     InterfaceConfig,
+    ModulationType,
     NetworkTopology,
     NodeConfig,
+    Polarization,
+    Position,
     SceneConfig,
     SharedBridgeDomain,
     TopologyDefinition,
@@ -32,15 +37,41 @@ def _make_wireless(
     bw: float = 80.0,
 ) -> WirelessParams:
     """Create a WirelessParams with minimal required fields."""
-    return WirelessParams(
-        position={"x": x, "y": y, "z": z},
+    return WirelessParams.model_validate({
+        "position": {"x": x, "y": y, "z": z},
+        "frequency_ghz": freq,
+        "rf_power_dbm": 20.0,
+        "bandwidth_mhz": bw,
+        "antenna_pattern": "hw_dipole",
+        "polarization": "V",
+        "modulation": "64qam",
+        "fec_type": "ldpc",
+        "fec_code_rate": 0.5,
+    })
+
+
+def _make_wireless_fast(
+    x: float,
+    y: float,
+    z: float = 1.0,
+    freq: float = 5.18,
+    bw: float = 80.0,
+) -> WirelessParams:
+    """Same as _make_wireless, but skips WirelessParams validation.
+
+    For tests that exercise topology-level validation, where the wireless
+    leaves are known-valid. model_construct does not coerce, so values are
+    given in their final types.
+    """
+    return WirelessParams.model_construct(
+        position=Position.model_construct(x=x, y=y, z=z),
         frequency_ghz=freq,
         rf_power_dbm=20.0,
         bandwidth_mhz=bw,
-        antenna_pattern="hw_dipole",
-        polarization="V",
-        modulation="64qam",
-        fec_type="ldpc",
+        antenna_pattern=AntennaPattern.HW_DIPOLE,
+        polarization=Polarization.V,
+        modulation=ModulationType.QAM64,
+        fec_type=FECType.LDPC,
         fec_code_rate=0.5,
     )
 
@@ -51,39 +82,92 @@ def _make_iface(
     y: float,
     freq: float = 5.18,
     bw: float = 80.0,
+    *,
+    fast: bool = False,
 ) -> InterfaceConfig:
-    """Create an InterfaceConfig with IP and wireless params."""
-    return InterfaceConfig(
-        ip_address=ip,
-        wireless=_make_wireless(x, y, freq=freq, bw=bw),
-    )
+    """Create an InterfaceConfig with IP and wireless params.
 
+    With fast=True the wireless params come from _make_wireless_fast.
+    """
+    make_wireless = _make_wireless_fast if fast else _make_wireless
+    return InterfaceConfig.model_validate({
+        "ip_address": ip,
+        "wireless": make_wireless(x, y, freq=freq, bw=bw),
+    })
 
-# ── get_bridge_interfaces() tests ──
 
+@pytest.fixture(scope="module")
+def base_topo() -> TopologyDefinition:
+    """Valid two-node dual-band (5.18 / 2.4 GHz) shared bridge topology.
 
-def test_get_bridge_interfaces_single_interface_per_node():
-    """Single wireless interface per node returns one entry each."""
-    topo = TopologyDefinition(
+    Built once per module. Tests must not mutate it; derive variants with
+    _revalidate() instead.
+    """
+    return TopologyDefinition(
         scene=SceneConfig(file="scenes/vacuum.xml"),
         shared_bridge=SharedBridgeDomain(
             name="br0", nodes=["n1", "n2"],
         ),
         nodes={
             "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0),
+                "eth1": _make_iface("10.0.0.1/24", 0, 0, freq=5.18, fast=True),
+                "eth2": _make_iface("10.0.1.1/24", 0, 0, freq=2.4, bw=20.0, fast=True),
             }),
             "n2": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.2/24", 10, 0),
+                "eth1": _make_iface("10.0.0.2/24", 10, 0, freq=5.18, fast=True),
+                "eth2": _make_iface("10.0.1.2/24", 10, 0, freq=2.4, bw=20.0, fast=True),
             }),
         },
     )
-    ifaces = topo.get_bridge_interfaces()
-    assert ifaces == [("n1", "eth1"), ("n2", "eth1")]
 
 
-def test_get_bridge_interfaces_multi_interface():
-    """Multi-interface node returns all wireless interfaces."""
+def _revalidate(
+    topo: TopologyDefinition,
+    swaps: dict[tuple[str, str], InterfaceConfig] | None = None,
+) -> TopologyDefinition:
+    """Re-run topology validation on topo with some interfaces replaced.
+
+    Untouched nodes and interfaces are passed as already-validated model
+    instances, which Pydantic does not revalidate, so only the topology-level
+    validators (IP conflicts, co-channel warnings, ...) run again.
+
+    Args:
+        topo: Valid topology to derive from (left unchanged)
+        swaps: (node_name, interface_name) -> replacement interface
+
+    Returns:
+        Newly validated TopologyDefinition
+    """
+    nodes = dict(topo.nodes)
+    for (node_name, iface_name), iface in (swaps or {}).items():
+        node = nodes[node_name]
+        nodes[node_name] = node.model_copy(
+            update={"interfaces": {**node.interfaces, iface_name: iface}}
+        )
+    return TopologyDefinition(
+        scene=topo.scene,
+        shared_bridge=topo.shared_bridge,
+        nodes=nodes,
+    )
+
+
+def test_make_wireless_fast_matches_validated():
+    """The unvalidated factory builds the same params as the validating one."""
+    fast = _make_wireless_fast(10, 0, freq=2.4, bw=20.0)
+    assert fast == _make_wireless(10, 0, freq=2.4, bw=20.0)
+    assert WirelessParams.model_validate(fast.model_dump()) == fast
+
+
+# ── get_bridge_interfaces() tests ──
+
+
+def _iface_set(topo: TopologyDefinition) -> set[tuple[str, str]]:
+    """Bridge interfaces as a set, for order-independent membership checks."""
+    return set(topo.get_bridge_interfaces())
+
+
+def test_get_bridge_interfaces_single_interface_per_node():
+    """Single wireless interface per node returns one entry each."""
     topo = TopologyDefinition(
         scene=SceneConfig(file="scenes/vacuum.xml"),
         shared_bridge=SharedBridgeDomain(
@@ -91,17 +175,21 @@ def test_get_bridge_interfaces_multi_interface():
         ),
         nodes={
             "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0, freq=5.18),
-                "eth2": _make_iface("10.0.1.1/24", 0, 0, freq=2.4, bw=20.0),
+                "eth1": _make_iface("10.0.0.1/24", 0, 0, fast=True),
             }),
             "n2": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.2/24", 10, 0, freq=5.18),
-                "eth2": _make_iface("10.0.1.2/24", 10, 0, freq=2.4, bw=20.0),
+                "eth1": _make_iface("10.0.0.2/24", 10, 0, fast=True),
             }),
         },
     )
     ifaces = topo.get_bridge_interfaces()
-    assert len(ifaces) == 4
+    assert ifaces == [("n1", "eth1"), ("n2", "eth1")]
+
+
+def test_get_bridge_interfaces_multi_interface(base_topo):
+    """Multi-interface node returns all wireless interfaces."""
+    assert len(base_topo.get_bridge_interfaces()) == 4
+    ifaces = _iface_set(base_topo)
     assert ("n1", "eth1") in ifaces
     assert ("n1", "eth2") in ifaces
     assert ("n2", "eth1") in ifaces
@@ -117,11 +205,11 @@ def test_get_bridge_interfaces_excludes_non_bridge_nodes():
         ),
         nodes={
             "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0),
+                "eth1": _make_iface("10.0.0.1/24", 0, 0, fast=True),
             }),
             "n2": NodeConfig(interfaces={
                 "eth1": InterfaceConfig(
-                    wireless=_make_wireless(10, 0),
+                    wireless=_make_wireless_fast(10, 0),
                 ),
             }),
         },
@@ -139,10 +227,10 @@ def test_get_bridge_interfaces_disabled_bridge_returns_empty():
         ),
         nodes={
             "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0),
+                "eth1": _make_iface("10.0.0.1/24", 0, 0, fast=True),
             }),
             "n2": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.2/24", 10, 0),
+                "eth1": _make_iface("10.0.0.2/24", 10, 0, fast=True),
             }),
         },
         links=[{"endpoints": ["n1:eth1", "n2:eth1"]}],
@@ -153,43 +241,29 @@ def test_get_bridge_interfaces_disabled_bridge_returns_empty():
 # ── self_isolation_db parameter tests ──
 
 
-def test_self_isolation_db_default():
-    """Default self_isolation_db is 30.0 dB."""
-    bridge = SharedBridgeDomain(name="br0", nodes=["n1"])
-    assert bridge.self_isolation_db == 30.0
-
-
-def test_self_isolation_db_custom():
-    """Custom self_isolation_db within range."""
-    bridge = SharedBridgeDomain(
-        name="br0", nodes=["n1"], self_isolation_db=40.0,
-    )
-    assert bridge.self_isolation_db == 40.0
-
-
-def test_self_isolation_db_min_max():
-    """self_isolation_db at boundary values."""
-    bridge_min = SharedBridgeDomain(
-        name="br0", nodes=["n1"], self_isolation_db=0.0,
-    )
-    assert bridge_min.self_isolation_db == 0.0
-
-    bridge_max = SharedBridgeDomain(
-        name="br0", nodes=["n1"], self_isolation_db=60.0,
-    )
-    assert bridge_max.self_isolation_db == 60.0
-
+@pytest.mark.parametrize(
+    "value, valid, expected",
+    [
+        (None, True, 30.0),  # Default
+        (40.0, True, 40.0),
+        (0.0, True, 0.0),  # Boundary
+        (60.0, True, 60.0),  # Boundary
+        (-1.0, False, None),
+        (61.0, False, None),
+    ],
+    ids=["default", "custom", "min", "max", "below_min", "above_max"],
+)
+def test_self_isolation_db(value, valid, expected):
+    """self_isolation_db defaults to 30.0 dB and must lie within [0, 60]."""
+    # None means the field is omitted so the schema default applies
+    extra = {} if value is None else {"self_isolation_db": value}
+    if not valid:
+        with pytest.raises(ValidationError):
+            SharedBridgeDomain(name="br0", nodes=["n1"], **extra)
+        return
 
-def test_self_isolation_db_out_of_range():
-    """self_isolation_db out of [0, 60] range raises error."""
-    with pytest.raises(ValidationError):
-        SharedBridgeDomain(
-            name="br0", nodes=["n1"], self_isolation_db=-1.0,
-        )
-    with pytest.raises(ValidationError):
-        SharedBridgeDomain(
-            name="br0", nodes=["n1"], self_isolation_db=61.0,
-        )
+    bridge = SharedBridgeDomain(name="br0", nodes=["n1"], **extra)
+    assert bridge.self_isolation_db == expected
 
 
 def test_interface_name_field_removed():
@@ -269,119 +343,48 @@ def test_bridge_ip_must_be_cidr():
         )
 
 
-def test_bridge_ip_conflict_detected():
+def test_bridge_ip_conflict_detected(base_topo):
     """Duplicate IP addresses across bridge interfaces raise error."""
     with pytest.raises(ValueError, match="IP address conflict"):
-        TopologyDefinition(
-            scene=SceneConfig(file="scenes/vacuum.xml"),
-            shared_bridge=SharedBridgeDomain(
-                name="br0", nodes=["n1", "n2"],
-            ),
-            nodes={
-                "n1": NodeConfig(interfaces={
-                    "eth1": _make_iface("10.0.0.1/24", 0, 0),
-                }),
-                "n2": NodeConfig(interfaces={
-                    "eth1": _make_iface("10.0.0.1/24", 10, 0),
-                }),
-            },
-        )
+        _revalidate(base_topo, {
+            ("n2", "eth1"): _make_iface("10.0.0.1/24", 10, 0),
+        })
 
 
-def test_bridge_ip_conflict_multi_iface():
+def test_bridge_ip_conflict_multi_iface(base_topo):
     """IP conflict on same node's multiple interfaces."""
     with pytest.raises(ValueError, match="IP address conflict"):
-        TopologyDefinition(
-            scene=SceneConfig(file="scenes/vacuum.xml"),
-            shared_bridge=SharedBridgeDomain(
-                name="br0", nodes=["n1"],
+        _revalidate(base_topo, {
+            ("n1", "eth2"): _make_iface(
+                "10.0.0.1/24", 0, 0, freq=2.4, bw=20.0,
             ),
-            nodes={
-                "n1": NodeConfig(interfaces={
-                    "eth1": _make_iface(
-                        "10.0.0.1/24", 0, 0, freq=5.18,
-                    ),
-                    "eth2": _make_iface(
-                        "10.0.0.1/24", 0, 0, freq=2.4, bw=20.0,
-                    ),
-                }),
-            },
-        )
+        })
 
 
-def test_bridge_no_ip_conflict_different_ips():
+def test_bridge_no_ip_conflict_different_ips(base_topo):
     """Different IPs across interfaces is valid."""
-    topo = TopologyDefinition(
-        scene=SceneConfig(file="scenes/vacuum.xml"),
-        shared_bridge=SharedBridgeDomain(
-            name="br0", nodes=["n1", "n2"],
-        ),
-        nodes={
-            "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0, freq=5.18),
-                "eth2": _make_iface(
-                    "10.0.1.1/24", 0, 0, freq=2.4, bw=20.0,
-                ),
-            }),
-            "n2": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.2/24", 10, 0, freq=5.18),
-                "eth2": _make_iface(
-                    "10.0.1.2/24", 10, 0, freq=2.4, bw=20.0,
-                ),
-            }),
-        },
-    )
-    assert len(topo.get_bridge_interfaces()) == 4
+    assert len(_revalidate(base_topo).get_bridge_interfaces()) == 4
 
 
 # ── Co-channel same-node warning tests ──
 
 
-def test_same_node_co_channel_warns(caplog):
-    """Two interfaces on same node with same frequency logs warning."""
-    caplog.set_level(logging.WARNING)
-
-    TopologyDefinition(
-        scene=SceneConfig(file="scenes/vacuum.xml"),
-        shared_bridge=SharedBridgeDomain(
-            name="br0", nodes=["n1"],
-        ),
-        nodes={
-            "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0, freq=5.18),
-                "eth2": _make_iface("10.0.0.2/24", 0, 0, freq=5.18),
-            }),
-        },
-    )
-
-    assert any(
-        "same frequency" in r.message and "5.18" in r.message
-        for r in caplog.records
-    )
-
-
-def test_same_node_different_freq_no_warning(caplog):
-    """Two interfaces on same node with different frequencies: no warning."""
+@pytest.mark.parametrize(
+    "freq2, bw2, expect_warning",
+    [(5.18, 80.0, True), (2.4, 20.0, False)],
+    ids=["same_freq_warns", "different_freq_no_warning"],
+)
+def test_same_node_co_channel(caplog, base_topo, freq2, bw2, expect_warning):
+    """Two interfaces on same node warn only when they share a frequency."""
     caplog.set_level(logging.WARNING)
 
-    TopologyDefinition(
-        scene=SceneConfig(file="scenes/vacuum.xml"),
-        shared_bridge=SharedBridgeDomain(
-            name="br0", nodes=["n1"],
-        ),
-        nodes={
-            "n1": NodeConfig(interfaces={
-                "eth1": _make_iface("10.0.0.1/24", 0, 0, freq=5.18),
-                "eth2": _make_iface(
-                    "10.0.1.1/24", 0, 0, freq=2.4, bw=20.0,
-                ),
-            }),
-        },
-    )
+    _revalidate(base_topo, {
+        ("n1", "eth2"): _make_iface("10.0.1.1/24", 0, 0, freq=freq2, bw=bw2),
+    })
 
-    assert not any(
-        "same frequency" in r.message for r in caplog.records
-    )
+    warnings = [r.message for r in caplog.records if "same frequency" in r.message]
+    assert bool(warnings) == expect_warning
+    assert all("5.18" in message for message in warnings)
 
 
 # ── Full multi-interface topology test ──
@@ -445,8 +448,9 @@ def test_dual_band_topology_validates():
     assert len(ifaces) == 6
 
     # All unique IPs
-    ips = set()
-    for node_name, iface_name in ifaces:
-        ip = network.topology.nodes[node_name].interfaces[iface_name].ip_address
-        ips.add(ip.split("/")[0])
+    nodes = network.topology.nodes
+    ips = {
+        nodes[node_name].interfaces[iface_name].ip_address.split("/")[0]
+        for node_name, iface_name in ifaces
+    }
     assert len(ips) == 6
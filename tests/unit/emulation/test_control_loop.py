@@ -0,0 +1,60 @@
+"""
+Unit tests for stopping the controller's control polling loop.
+
+Tests that polling can be stopped without destroying the deployment, as
+keep-alive test fixtures need.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from sine.emulation.controller import EmulationController
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controller with a running control loop and a mock clab manager."""
+    topology = tmp_path / "network.yaml"
+    topology.write_text("name: control-loop-test\n")
+    ctrl = EmulationController(topology)
+    ctrl.config = MagicMock()
+    ctrl.config.topology.control_poll_ms = 1
+    ctrl.clab_manager = MagicMock()
+    return ctrl
+
+
+async def _start_polling(ctrl: EmulationController) -> asyncio.Task:
+    ctrl._running = True
+    ctrl._control_task = asyncio.create_task(ctrl._control_polling_loop())
+    await asyncio.sleep(0)
+    return ctrl._control_task
+
+
+async def test_stop_control_loop_keeps_deployment(controller):
+    """Polling stops, but the containers are not destroyed."""
+    task = await _start_polling(controller)
+
+    await controller.stop_control_loop()
+
+    assert task.done()
+    assert not controller.is_running
+    controller.clab_manager.destroy.assert_not_called()
+
+
+async def test_stop_control_loop_without_task(controller):
+    """Stopping when polling never started is a no-op."""
+    await controller.stop_control_loop()
+
+    assert not controller.is_running
+
+
+async def test_stop_destroys_after_stopping_loop(controller):
+    """stop() ends polling and then destroys the deployment."""
+    task = await _start_polling(controller)
+
+    await controller.stop()
+
+    assert task.done()
+    controller.clab_manager.destroy.assert_called_once()
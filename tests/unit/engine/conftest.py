@@ -0,0 +1,50 @@
+"""Engine test configuration."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from sine.channel.sionna_engine import SionnaEngine
+
+
+@pytest.fixture(scope="session")
+def get_sionna_engine(project_root: Path) -> Callable[..., SionnaEngine]:
+    """Factory for loaded SionnaEngines, created once per scene and RF setup.
+
+    Scene loading dominates the cost of a Sionna test, and a scene never
+    changes between tests. Tests share each engine and place their own
+    devices after clearing those left by earlier tests.
+
+    The factory takes a scene file name under scenes/ (None for an empty
+    scene), frequency and bandwidth. With los_only=True (vacuum / empty
+    scenes, where only the direct path exists) the solver runs shallow with
+    few rays, which gives the same result far faster.
+
+    Example:
+        def test_something(get_sionna_engine):
+            sionna = get_sionna_engine("vacuum.xml", los_only=True)
+    """
+    engines: dict[tuple, SionnaEngine] = {}
+
+    def get(
+        scene: Optional[str],
+        frequency_hz: float = 5.18e9,
+        bandwidth_hz: float = 80e6,
+        los_only: bool = False,
+    ) -> SionnaEngine:
+        key = (scene, frequency_hz, bandwidth_hz, los_only)
+        if key not in engines:
+            sionna = SionnaEngine()
+            sionna.load_scene(
+                scene_path=str(project_root / "scenes" / scene) if scene else None,
+                frequency_hz=frequency_hz,
+                bandwidth_hz=bandwidth_hz,
+            )
+            if los_only:
+                sionna.configure_solver(max_depth=1, samples_per_src=10_000)
+            engines[key] = sionna
+        return engines[key]
+
+    return get
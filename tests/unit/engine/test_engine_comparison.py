@@ -6,112 +6,196 @@ These tests require GPU/CUDA for Sionna and compare:
 - Divergence in indoor/obstacle scenarios
 - Antenna pattern gain consistency
 
-IMPORTANT: These tests are GPU-dependent and will be skipped if Sionna is unavailable.
+IMPORTANT: Tests that run Sionna are GPU-dependent and will be skipped if Sionna
+is unavailable; CPU-only checks (antenna pattern mapping, fallback edge cases)
+always run.
 """
 
+import functools
+import math
+from types import SimpleNamespace
+from typing import NamedTuple
+
+import numpy as np
+import numpy.testing as npt
 import pytest
-from sine.channel.sionna_engine import SionnaEngine, FallbackEngine
-from sine.channel.server import is_sionna_available
+from sine.channel.sionna_engine import FallbackEngine, is_sionna_available
 
 
-# Mark all tests as requiring GPU
-pytestmark = pytest.mark.skipif(
+# Applied (with the sionna marker) to every test that runs Sionna, so
+# CPU-only checks in this module still run without a GPU. The sionna marker
+# also keeps these tests on one xdist worker (see tests/conftest.py).
+requires_sionna = pytest.mark.skipif(
     not is_sionna_available(),
     reason="Requires GPU/CUDA for Sionna RT"
 )
 
 
+class _FallbackLink(NamedTuple):
+    """FallbackEngine results for one TX/RX pair."""
+
+    path_loss_db: float
+    min_delay_ns: float
+    num_paths: int
+    distance_m: float
+
+
+@functools.cache
+def _fallback_link(
+    freq_hz: float,
+    distance_m: float,
+    indoor_loss_db: float = 0.0,
+    tx_z: float = 1.0,
+    rx_z: float = 1.0,
+) -> _FallbackLink:
+    """FSPL fallback results for TX at (0, 0, tx_z) and RX at (distance_m, 0, rx_z).
+
+    The fallback model is a pure function of these inputs, so results are
+    computed once per distinct link and shared between tests.
+    """
+    fallback = FallbackEngine(indoor_loss_db=indoor_loss_db)
+    fallback.load_scene(frequency_hz=freq_hz, bandwidth_hz=80e6)
+    fallback.add_transmitter("tx", (0, 0, tx_z))
+    fallback.add_receiver("rx", (distance_m, 0, rx_z))
+    result = fallback.compute_paths()
+    details = fallback.get_path_details()
+    return _FallbackLink(
+        path_loss_db=result.path_loss_db,
+        min_delay_ns=result.min_delay_ns,
+        num_paths=details.num_paths,
+        distance_m=details.distance_m,
+    )
+
+
+@pytest.fixture(scope="module")
+def sim(get_sionna_engine):
+    """Run one TX/RX link through both engines.
+
+    Returns a callable ``sim(scene, tx_pos, rx_pos, freq=5.18e9, bw=80e6)``
+    giving a SimpleNamespace with ``sionna`` (PathResult), ``sionna_details``
+    (PathDetails from the same trace) and ``fallback`` (_FallbackLink).
+    Devices are iso antennas named "tx" and "rx". ``scene`` is a file under
+    scenes/ or None for an empty scene; ``los_only`` defaults to True since most links here are
+    free-space, and indoor scenes should pass False.
+    """
+    def run(
+        scene,
+        tx_pos,
+        rx_pos,
+        freq=5.18e9,
+        bw=80e6,
+        *,
+        indoor_loss_db=0.0,
+        los_only=True,
+    ) -> SimpleNamespace:
+        sionna = get_sionna_engine(scene, freq, bw, los_only=los_only)
+        sionna.clear_devices()
+        sionna.add_transmitter("tx", tx_pos, antenna_pattern="iso")
+        sionna.add_receiver("rx", rx_pos, antenna_pattern="iso")
+
+        # FSPL depends only on horizontal separation and the two heights
+        horizontal_m = math.dist(tx_pos[:2], rx_pos[:2])
+        fallback = _fallback_link(
+            freq, horizontal_m, indoor_loss_db, tx_z=tx_pos[2], rx_z=rx_pos[2]
+        )
+        result, details = sionna.compute_paths_with_details()
+        return SimpleNamespace(sionna=result, sionna_details=details, fallback=fallback)
+
+    return run
+
+
+# Receiver distances (m) for the multi-distance vacuum comparison
+_DISTANCES = (10.0, 20.0, 50.0, 100.0)
+
+# Reference free-space model that both engines are checked against, so a
+# failure names the engine that drifted rather than just their difference
+_C_M_PER_S = 299_792_458.0
+_FSPL_5G18 = dict(zip(
+    _DISTANCES,
+    (20 * np.log10(_DISTANCES) + 20 * np.log10(5.18e9) - 147.55).tolist(),
+    strict=True,
+))
+_FSPL_20M_5G18 = _FSPL_5G18[20.0]
+
+
+def _expected_delay_ns(distance_m: float) -> float:
+    """Line-of-sight propagation delay in nanoseconds."""
+    return distance_m / _C_M_PER_S * 1e9
+
+
+@pytest.mark.sionna
+@requires_sionna
 class TestFreeSpaceAgreement:
     """Test that Sionna and Fallback agree in free-space scenarios."""
 
-    def test_vacuum_scenario_close_agreement(self, scenes_dir):
+    def test_vacuum_scenario_close_agreement(self, sim):
         """In vacuum, Sionna and fallback should agree within 1-2 dB for LOS."""
-        # Sionna RT with vacuum scene
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(scenes_dir / "vacuum.xml"),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
-        )
+        # Fallback is FSPL + 0 dB indoor loss for vacuum
+        r = sim("vacuum.xml", (0, 0, 1), (20, 0, 1))
+
+        # Fallback is plain FSPL; Sionna should land within 2 dB of it
+        # (Sionna includes more accurate effects)
+        assert r.fallback.path_loss_db == pytest.approx(_FSPL_20M_5G18, abs=0.01)
+        assert r.sionna.path_loss_db == pytest.approx(_FSPL_20M_5G18, abs=2.0)
+
+    @pytest.fixture(scope="class")
+    def vacuum_distance_path_loss(self, get_sionna_engine) -> dict[float, float]:
+        """Sionna path loss at every distance in _DISTANCES, from one ray trace."""
+        sionna = get_sionna_engine("vacuum.xml", los_only=True)
+        sionna.clear_devices()
+        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
+        for i, distance in enumerate(_DISTANCES):
+            sionna.add_receiver(f"rx_{i}", (distance, 0, 1), antenna_pattern="iso")
+        links = sionna.compute_link_paths()
+        return {
+            distance: links[("tx", f"rx_{i}")].path_loss_db
+            for i, distance in enumerate(_DISTANCES)
+        }
+
+    def test_vacuum_multiple_distances(self, vacuum_distance_path_loss):
+        """Test agreement at multiple distances in vacuum."""
+        # Sionna RT (all distances traced together by the fixture)
+        sionna_pl = np.array([vacuum_distance_path_loss[d] for d in _DISTANCES])
+
+        # Fallback
+        fallback_pl = np.array([_fallback_link(5.18e9, d).path_loss_db for d in _DISTANCES])
+
+        # Both should match FSPL (Sionna within 2 dB) at all distances; a
+        # failure reports every distance that is out of tolerance
+        expected_pl = np.array([_FSPL_5G18[d] for d in _DISTANCES])
+        msg = f"distances={_DISTANCES}"
+        npt.assert_allclose(fallback_pl, expected_pl, rtol=0, atol=0.01, err_msg=msg)
+        npt.assert_allclose(sionna_pl, expected_pl, rtol=0, atol=2.0, err_msg=msg)
+
+    def test_link_paths_classify_by_interactions(self, get_sionna_engine):
+        """Batched links take the path type from interactions, as compute_paths() does."""
+        sionna = get_sionna_engine("vacuum.xml", los_only=True)
+        sionna.clear_devices()
+        # 20 m is well beyond the 10 ns (~3 m) delay heuristic's LOS range
         sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
         sionna.add_receiver("rx", (20, 0, 1), antenna_pattern="iso")
-        sionna_result = sionna.compute_paths()
-
-        # Fallback engine (FSPL + 0 dB indoor loss for vacuum)
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (20, 0, 1))
-        fallback_result = fallback.compute_paths()
-
-        # Should agree within 1-2 dB (Sionna includes more accurate effects)
-        diff = abs(sionna_result.path_loss_db - fallback_result.path_loss_db)
-        assert diff < 2.0, (
-            f"Vacuum scenario: path loss diff {diff:.2f} dB exceeds 2 dB "
-            f"(Sionna: {sionna_result.path_loss_db:.2f}, "
-            f"Fallback: {fallback_result.path_loss_db:.2f})"
-        )
 
-    def test_vacuum_multiple_distances(self, scenes_dir):
-        """Test agreement at multiple distances in vacuum."""
-        distances = [10.0, 20.0, 50.0, 100.0]
-
-        for distance in distances:
-            # Sionna RT
-            sionna = SionnaEngine()
-            sionna.load_scene(
-                scene_path=str(scenes_dir / "vacuum.xml"),
-                frequency_hz=5.18e9,
-                bandwidth_hz=80e6
-            )
-            sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-            sionna.add_receiver("rx", (distance, 0, 1), antenna_pattern="iso")
-            sionna_result = sionna.compute_paths()
-
-            # Fallback
-            fallback = FallbackEngine(indoor_loss_db=0.0)
-            fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-            fallback.add_transmitter("tx", (0, 0, 1))
-            fallback.add_receiver("rx", (distance, 0, 1))
-            fallback_result = fallback.compute_paths()
-
-            # Should agree within 2 dB at all distances
-            diff = abs(sionna_result.path_loss_db - fallback_result.path_loss_db)
-            assert diff < 2.0, (
-                f"At {distance}m: diff {diff:.2f} dB > 2 dB "
-                f"(Sionna: {sionna_result.path_loss_db:.2f}, "
-                f"Fallback: {fallback_result.path_loss_db:.2f})"
-            )
+        link = sionna.compute_link_paths()[("tx", "rx")]
+
+        assert link.dominant_path_type == sionna.compute_paths().dominant_path_type == "los"
 
 
+@pytest.mark.sionna
+@requires_sionna
 class TestIndoorDivergence:
     """Test that Sionna shows higher path loss with obstacles."""
 
-    def test_indoor_scenario_divergence(self, scenes_dir):
+    def test_indoor_scenario_divergence(self, scenes_dir, sim):
         """Sionna should show higher path loss than FSPL in indoor scenarios."""
         # Try two_rooms scene if available, otherwise skip
-        two_rooms_scene = scenes_dir / "two_rooms.xml"
-        if not two_rooms_scene.exists():
+        if not (scenes_dir / "two_rooms.xml").exists():
             pytest.skip("two_rooms.xml scene not available")
 
-        # Sionna RT with indoor scene
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(two_rooms_scene),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
-        )
-        # TX in room 1, RX in room 2 (through wall/door)
-        sionna.add_transmitter("tx", (2, 2, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (8, 2, 1), antenna_pattern="iso")
-        sionna_result = sionna.compute_paths()
-
-        # Fallback (FSPL + 10 dB indoor loss estimate)
-        fallback = FallbackEngine(indoor_loss_db=10.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (2, 2, 1))
-        fallback.add_receiver("rx", (8, 2, 1))
-        fallback_result = fallback.compute_paths()
+        # TX in room 1, RX in room 2 (through wall/door); reflections matter
+        # here, so Sionna keeps its default solver settings. Fallback is
+        # FSPL + 10 dB indoor loss estimate.
+        r = sim("two_rooms.xml", (2, 2, 1), (8, 2, 1), indoor_loss_db=10.0, los_only=False)
+        sionna_result, fallback_result = r.sionna, r.fallback
 
         # Sionna should show MORE path loss (walls, obstacles)
         # Exact difference depends on scene geometry, but Sionna >= Fallback expected
@@ -128,221 +212,133 @@ class TestIndoorDivergence:
 class TestAntennaPatternConsistency:
     """Test that both engines use same antenna pattern gains."""
 
-    def test_antenna_pattern_gain_mapping(self):
+    @pytest.mark.parametrize("pattern", ["iso", "dipole", "hw_dipole"])
+    def test_antenna_pattern_gain_mapping(self, pattern):
         """Both engines should use consistent antenna pattern gains."""
         from sine.channel.antenna_patterns import ANTENNA_PATTERN_GAINS
 
-        # Test all standard patterns
-        patterns = ["iso", "dipole", "hw_dipole"]
-
-        for pattern in patterns:
-            # Expected gain from mapping
-            expected_gain = ANTENNA_PATTERN_GAINS[pattern]
-
-            # Note: Sionna embeds gain in path coefficients (tested elsewhere)
-            # Fallback would need to look up gain if it received pattern info
-            # This test documents that the mapping is available
-            assert pattern in ANTENNA_PATTERN_GAINS
-            assert isinstance(expected_gain, float)
+        # Note: Sionna embeds gain in path coefficients (tested elsewhere)
+        # Fallback would need to look up gain if it received pattern info
+        # This test documents that the mapping is available
+        assert pattern in ANTENNA_PATTERN_GAINS
+        assert isinstance(ANTENNA_PATTERN_GAINS[pattern], float)
 
-    def test_isotropic_pattern_consistency(self, scenes_dir):
+    @pytest.mark.sionna
+    @requires_sionna
+    def test_isotropic_pattern_consistency(self, sim):
         """Test that isotropic pattern gives consistent results."""
-        # Sionna with isotropic
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(scenes_dir / "vacuum.xml"),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
-        )
-        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (20, 0, 1), antenna_pattern="iso")
-        sionna_result = sionna.compute_paths()
+        # Sionna with isotropic; fallback isotropic = 0 dBi gain
+        r = sim("vacuum.xml", (0, 0, 1), (20, 0, 1))
 
-        # Fallback (isotropic = 0 dBi gain)
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (20, 0, 1))
-        fallback_result = fallback.compute_paths()
-
-        # Should be very close (isotropic is simplest case)
-        diff = abs(sionna_result.path_loss_db - fallback_result.path_loss_db)
-        assert diff < 2.0
+        # Should be very close to FSPL (isotropic is simplest case)
+        assert r.fallback.path_loss_db == pytest.approx(_FSPL_20M_5G18, abs=0.01)
+        assert r.sionna.path_loss_db == pytest.approx(_FSPL_20M_5G18, abs=2.0)
 
 
+@pytest.mark.sionna
+@requires_sionna
 class TestDelayCalculation:
     """Test delay calculation consistency."""
 
-    def test_delay_consistency(self, scenes_dir):
+    def test_delay_consistency(self, sim):
         """Both engines should compute similar propagation delays."""
         distance = 20.0  # meters
+        r = sim("vacuum.xml", (0, 0, 1), (distance, 0, 1))
 
-        # Sionna
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(scenes_dir / "vacuum.xml"),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
-        )
-        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (distance, 0, 1), antenna_pattern="iso")
-        sionna_result = sionna.compute_paths()
-
-        # Fallback
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (distance, 0, 1))
-        fallback_result = fallback.compute_paths()
-
-        # Expected delay = distance / c ≈ 66.67 ns
-        expected_delay_ns = (distance / 3e8) * 1e9
+        # Expected delay = distance / c ≈ 66.71 ns
+        expected_delay_ns = _expected_delay_ns(distance)
 
-        # Fallback should be close to expected (it uses direct calculation)
-        assert abs(fallback_result.min_delay_ns - expected_delay_ns) < 5.0
+        # Fallback should be close to expected (it uses direct calculation,
+        # with c rounded to 3e8 m/s: ~0.05 ns off at 20 m)
+        assert r.fallback.min_delay_ns == pytest.approx(expected_delay_ns, abs=0.1)
 
         # Sionna delay extraction may vary depending on path detection
         # If delay is 0, it means no valid paths were detected (implementation detail)
         # Just verify it's non-negative
-        assert sionna_result.min_delay_ns >= 0.0
+        assert r.sionna.min_delay_ns >= 0.0
 
 
+@pytest.mark.sionna
+@requires_sionna
 class TestPathDetailsComparison:
     """Test path details from both engines."""
 
-    def test_path_count_difference(self, scenes_dir):
-        """Sionna should detect multiple paths, fallback always reports 1."""
-        # Sionna with scene that has reflections
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(scenes_dir / "vacuum.xml"),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
+    @pytest.fixture(scope="class")
+    def vacuum_20m_results(self, sim) -> SimpleNamespace:
+        """Trace the 20 m vacuum link once for every test in the class."""
+        r = sim("vacuum.xml", (0, 0, 1), (20, 0, 1))
+        return SimpleNamespace(
+            sionna_pl=r.sionna.path_loss_db,
+            sionna_delay=r.sionna.min_delay_ns,
+            sionna_details=r.sionna_details,
+            fallback_pl=r.fallback.path_loss_db,
+            fallback_details=r.fallback,
         )
-        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (20, 0, 1), antenna_pattern="iso")
-        sionna_details = sionna.get_path_details()
-
-        # Fallback
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (20, 0, 1))
-        fallback_details = fallback.get_path_details()
 
+    def test_path_count_difference(self, vacuum_20m_results):
+        """Sionna should detect multiple paths, fallback always reports 1."""
         # Sionna may detect multiple paths (even in vacuum, due to ray tracing)
         # Fallback always reports 1 path
-        assert fallback_details.num_paths == 1
-        assert sionna_details.num_paths >= 1  # At least LOS
+        assert vacuum_20m_results.fallback_details.num_paths == 1
+        assert vacuum_20m_results.sionna_details.num_paths >= 1  # At least LOS
 
-    def test_distance_calculation_agreement(self, scenes_dir):
+    def test_distance_calculation_agreement(self, vacuum_20m_results):
         """Both engines should compute same 3D distance."""
-        # Sionna
-        sionna = SionnaEngine()
-        sionna.load_scene(
-            scene_path=str(scenes_dir / "vacuum.xml"),
-            frequency_hz=5.18e9,
-            bandwidth_hz=80e6
-        )
-        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (20, 0, 1), antenna_pattern="iso")
-        sionna_details = sionna.get_path_details()
-
-        # Fallback
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (20, 0, 1))
-        fallback_details = fallback.get_path_details()
+        sionna_distance = vacuum_20m_results.sionna_details.distance_m
+        fallback_distance = vacuum_20m_results.fallback_details.distance_m
 
         # Distances should match exactly
-        assert abs(sionna_details.distance_m - 20.0) < 0.01
-        assert abs(fallback_details.distance_m - 20.0) < 0.01
-        assert abs(sionna_details.distance_m - fallback_details.distance_m) < 0.01
+        assert sionna_distance == pytest.approx(20.0, abs=0.01)
+        assert fallback_distance == pytest.approx(20.0, abs=0.01)
+        assert sionna_distance == pytest.approx(fallback_distance, abs=0.01)
 
 
+@pytest.mark.sionna
+@requires_sionna
 class TestFrequencyScaling:
     """Test frequency-dependent path loss scaling."""
 
-    def test_frequency_scaling_consistency(self, scenes_dir):
-        """Both engines should scale path loss correctly with frequency."""
-        frequencies = [2.4e9, 5.18e9, 5.8e9]  # 2.4 GHz, 5.18 GHz, 5.8 GHz
-
-        sionna_results = []
-        fallback_results = []
-
-        for freq in frequencies:
-            # Sionna
-            sionna = SionnaEngine()
-            sionna.load_scene(
-                scene_path=str(scenes_dir / "vacuum.xml"),
-                frequency_hz=freq,
-                bandwidth_hz=80e6
-            )
-            sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-            sionna.add_receiver("rx", (20, 0, 1), antenna_pattern="iso")
-            sionna_results.append(sionna.compute_paths().path_loss_db)
-
-            # Fallback
-            fallback = FallbackEngine(indoor_loss_db=0.0)
-            fallback.load_scene(frequency_hz=freq, bandwidth_hz=80e6)
-            fallback.add_transmitter("tx", (0, 0, 1))
-            fallback.add_receiver("rx", (20, 0, 1))
-            fallback_results.append(fallback.compute_paths().path_loss_db)
+    def test_frequency_scaling_consistency(self, sim):
+        """Both engines should scale path loss correctly with frequency (vs 2.4 GHz)."""
+        freqs = (2.4e9, 5.18e9, 5.8e9)
+        links = [sim("vacuum.xml", (0, 0, 1), (20, 0, 1), freq=freq) for freq in freqs]
+        sionna_pls = np.array([r.sionna.path_loss_db for r in links])
+        fallback_pls = np.array([r.fallback.path_loss_db for r in links])
 
         # Higher frequency should give higher path loss (both engines)
-        assert sionna_results[1] > sionna_results[0]  # 5.18 GHz > 2.4 GHz
-        assert fallback_results[1] > fallback_results[0]
-
-        # Differences should be similar
-        sionna_diff = sionna_results[1] - sionna_results[0]
-        fallback_diff = fallback_results[1] - fallback_results[0]
-        assert abs(sionna_diff - fallback_diff) < 1.0  # Within 1 dB
+        assert np.all(np.diff(sionna_pls) > 0)
+        assert np.all(np.diff(fallback_pls) > 0)
+
+        # Increase over the 2.4 GHz baseline should be similar (within 1 dB)
+        npt.assert_allclose(
+            sionna_pls[1:] - sionna_pls[0],
+            fallback_pls[1:] - fallback_pls[0],
+            rtol=0,
+            atol=1.0,
+            err_msg=f"freqs={freqs}",
+        )
 
 
 class TestEdgeCases:
     """Test edge cases for both engines."""
 
     def test_zero_distance_handling(self):
-        """Both engines should handle zero distance (TX == RX position)."""
-        # Sionna - may need a scene, skip if it fails
-        try:
-            sionna = SionnaEngine()
-            sionna.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-            sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-            sionna.add_receiver("rx", (0, 0, 1), antenna_pattern="iso")
-            sionna_result = sionna.compute_paths()
-            sionna_works = True
-        except Exception:
-            sionna_works = False
-
+        """Fallback should handle zero distance (TX == RX position)."""
+        # Sionna's zero-distance result was never asserted on (any failure was
+        # swallowed), so only the fallback engine is checked here.
         # Fallback should handle gracefully (clips to 0.1m)
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (0, 0, 1))
-        fallback_result = fallback.compute_paths()
+        fallback_result = _fallback_link(5.18e9, 0.0)
 
         # Fallback should succeed
         assert fallback_result.path_loss_db > 0
 
-    def test_very_short_distance(self):
+    @pytest.mark.sionna
+    @requires_sionna
+    def test_very_short_distance(self, sim):
         """Test both engines at very short distance (0.5m)."""
-        distance = 0.5
-
-        # Sionna
-        sionna = SionnaEngine()
-        sionna.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        sionna.add_transmitter("tx", (0, 0, 1), antenna_pattern="iso")
-        sionna.add_receiver("rx", (distance, 0, 1), antenna_pattern="iso")
-        sionna_result = sionna.compute_paths()
-
-        # Fallback
-        fallback = FallbackEngine(indoor_loss_db=0.0)
-        fallback.load_scene(frequency_hz=5.18e9, bandwidth_hz=80e6)
-        fallback.add_transmitter("tx", (0, 0, 1))
-        fallback.add_receiver("rx", (distance, 0, 1))
-        fallback_result = fallback.compute_paths()
+        # Empty scene
+        r = sim(None, (0, 0, 1), (0.5, 0, 1))
+        sionna_result, fallback_result = r.sionna, r.fallback
 
         # Both should give reasonable results
         assert sionna_result.path_loss_db > 0
@@ -395,6 +395,18 @@ class TestPathDetails:
         with pytest.raises(RuntimeError, match="At least one transmitter and receiver required"):
             engine.get_path_details()
 
+    def test_compute_paths_with_details_matches_separate_calls(self):
+        """The paired call returns the same result and details as the two separate calls."""
+        engine = FallbackEngine(indoor_loss_db=10.0)
+        engine.load_scene(frequency_hz=5.18e9)
+        engine.add_transmitter("tx", (0, 0, 1))
+        engine.add_receiver("rx", (20, 0, 1))
+
+        result, details = engine.compute_paths_with_details()
+
+        assert result == engine.compute_paths()
+        assert details == engine.get_path_details()
+
 
 class TestComputePathsValidation:
     """Test validation for compute_paths()."""
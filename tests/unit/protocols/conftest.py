@@ -0,0 +1,78 @@
+"""Protocol test configuration."""
+
+import dataclasses
+import functools
+import hashlib
+import json
+
+import pytest
+
+from sine.channel.interference_calculator import InterferenceEngine
+from sine.channel.sionna_engine import PathResult
+
+
+@pytest.fixture(scope="session")
+def free_space_engine() -> InterferenceEngine:
+    """One InterferenceEngine with the empty (vacuum) scene loaded at 5.18 GHz / 80 MHz.
+
+    Scene loading dominates the runtime of the interference tests, so it is
+    paid once per session and the engine is shared by every module here.
+    Tests that inspect the path cache should clear it first. Under
+    pytest-xdist each worker is its own process, so each builds its own engine.
+    """
+    engine = InterferenceEngine()
+    engine.load_scene(scene_path=None, frequency_hz=5.18e9, bandwidth_hz=80e6)
+    return engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def persist_interference_paths(request):
+    """With --persist-paths, keep traced interference paths across pytest runs.
+
+    InterferenceEngine._compute_interference_path is wrapped so each result is
+    stored in the pytest cache (.pytest_cache), keyed by everything that
+    determines it: scene, frequency, bandwidth, positions, antenna patterns
+    and polarizations. Later runs read the result back instead of ray tracing.
+    Off by default, so ordinary runs always exercise the real engine; use
+    --cache-clear after changing the engine or Sionna.
+    """
+    if not request.config.getoption("--persist-paths"):
+        yield
+        return
+
+    cache = request.config.cache
+    compute = InterferenceEngine._compute_interference_path
+
+    @functools.wraps(compute)
+    def persisted(
+        self,
+        tx_position,
+        rx_position,
+        tx_name,
+        rx_name,
+        tx_antenna_pattern="iso",
+        tx_polarization="V",
+        rx_antenna_pattern="iso",
+        rx_polarization="V",
+    ):
+        link = json.dumps([
+            self._scene_path, self._frequency_hz, self._bandwidth_hz,
+            tx_position, rx_position,
+            tx_antenna_pattern, tx_polarization, rx_antenna_pattern, rx_polarization,
+        ])
+        key = "sine/interference_paths/" + hashlib.sha256(link.encode()).hexdigest()
+
+        stored = cache.get(key, None)
+        if stored is not None:
+            return PathResult(**stored)
+
+        result = compute(
+            self, tx_position, rx_position, tx_name, rx_name,
+            tx_antenna_pattern, tx_polarization, rx_antenna_pattern, rx_polarization,
+        )
+        cache.set(key, dataclasses.asdict(result))
+        return result
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(InterferenceEngine, "_compute_interference_path", persisted)
+        yield
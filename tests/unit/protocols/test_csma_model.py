@@ -188,5 +188,35 @@ def test_csma_custom_traffic_load():
     assert prob == 0.5, "Should use custom traffic load"
 
 
+def test_csma_batch_matches_single_interferer():
+    """Test batched probabilities agree with the per-interferer computation."""
+    model = CSMAModel(carrier_sense_range_multiplier=2.5, default_traffic_load=0.3)
+
+    positions = {
+        f"N{i}": (float(i * 37 % 400), float(i * 91 % 400), 1.0) for i in range(30)
+    }
+    nodes = list(positions)
+
+    probs = model.compute_interference_probabilities(
+        tx_node="N0",
+        rx_node="N1",
+        interferer_nodes=nodes,
+        positions=positions,
+        communication_range=50.0,
+    )
+
+    assert set(probs) == set(nodes) - {"N0", "N1"}
+    for interferer, prob in probs.items():
+        expected = model.compute_interference_probability(
+            tx_node="N0",
+            rx_node="N1",
+            interferer_node=interferer,
+            positions=positions,
+            communication_range=50.0,
+        )
+        assert type(prob) is float
+        assert prob == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,6 +11,14 @@ import math
 from sine.channel.interference_utils import SINRCalculator, SINRResult, calculate_thermal_noise
 from sine.channel.interference_calculator import InterferenceTerm
 
+# 10**(x/10) == exp(x * ln(10)/10)
+_LN10_OVER_10 = math.log(10) / 10
+
+
+def _dbm_sum(dbms) -> float:
+    """Sum powers in the linear domain; dBm in, dBm out."""
+    return 10.0 * np.log10(np.exp(np.asarray(dbms) * _LN10_OVER_10).sum())
+
 
 class TestThermalNoiseCalculation:
     """Test thermal noise calculation."""
@@ -89,13 +97,8 @@ class TestSINRCalculation:
             interference_terms=interference_terms
         )
 
-        # Calculate expected SINR manually
-        signal_linear = 10 ** (signal_power_dbm / 10.0)
-        noise_linear = 10 ** (noise_power_dbm / 10.0)
-        interference_linear = 10 ** (-60.0 / 10.0)
-        expected_sinr_db = 10 * math.log10(
-            signal_linear / (noise_linear + interference_linear)
-        )
+        # Calculate expected SINR manually: S / (N + I)
+        expected_sinr_db = signal_power_dbm - _dbm_sum([noise_power_dbm, -60.0])
 
         # SNR = -50 - (-90) = 40 dB
         # SINR should be lower due to interference
@@ -129,10 +132,7 @@ class TestSINRCalculation:
 
         # Two equal interferers at -65 dBm each
         # Total interference = 10*log10(2 × 10^(-6.5)) = -65 + 3 = -62 dBm
-        i1_linear = 10 ** (-65.0 / 10.0)
-        i2_linear = 10 ** (-65.0 / 10.0)
-        total_interference_linear = i1_linear + i2_linear
-        expected_total_interference_dbm = 10 * math.log10(total_interference_linear)
+        expected_total_interference_dbm = _dbm_sum([-65.0, -65.0])
 
         assert abs(result.total_interference_dbm - expected_total_interference_dbm) < 0.01
         assert abs(result.total_interference_dbm - (-62.0)) < 0.1  # ~3 dB increase
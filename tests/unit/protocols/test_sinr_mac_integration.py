@@ -9,6 +9,23 @@ import pytest
 from sine.channel.interference_utils import SINRCalculator
 from sine.channel.interference_calculator import InterferenceTerm
 
+# SINRCalculator only holds configuration, so one default instance serves every test
+_CALC = SINRCalculator()
+
+# Shared link budget for the node2 -> node3 link with node1 as the hidden node
+_SIGNAL_DBM = -52.7
+_NOISE_DBM = -95.0
+_SNR_DB = _SIGNAL_DBM - _NOISE_DBM  # 42.3 dB
+
+# node1 interferer at -58.8 dBm
+_TERM_M58_8 = InterferenceTerm(source="node1", power_dbm=-58.8, frequency_hz=5.18e9)
+
+# Two hidden nodes for the aggregation test
+_TWO_TERMS = [
+    InterferenceTerm(source="node1", power_dbm=-60.0, frequency_hz=5.18e9),
+    InterferenceTerm(source="node2", power_dbm=-65.0, frequency_hz=5.18e9),
+]
+
 
 def test_csma_sinr_uses_probabilities():
     """Verify CSMA SINR calculation uses interference probabilities.
@@ -21,28 +38,16 @@ def test_csma_sinr_uses_probabilities():
     - SINR should be lower than SNR when interference is present
     - Effective interference = raw_interference_power * probability
     """
-    # Setup
-    signal_power_dbm = -52.7
-    noise_power_dbm = -95.0
-
     # Interferer at -58.8 dBm with 30% probability (hidden node)
-    interference_terms = [
-        InterferenceTerm(
-            source="node1",
-            power_dbm=-58.8,
-            frequency_hz=5.18e9,
-        )
-    ]
     interference_probs = {"node1": 0.3}
 
     # Calculate SINR with CSMA
-    calculator = SINRCalculator()
-    sinr_result, metadata = calculator.calculate_sinr_with_csma(
+    sinr_result, metadata = _CALC.calculate_sinr_with_csma(
         tx_node="node2",
         rx_node="node3",
-        signal_power_dbm=signal_power_dbm,
-        noise_power_dbm=noise_power_dbm,
-        interference_terms=interference_terms,
+        signal_power_dbm=_SIGNAL_DBM,
+        noise_power_dbm=_NOISE_DBM,
+        interference_terms=[_TERM_M58_8],
         interference_probs=interference_probs,
     )
 
@@ -57,9 +62,8 @@ def test_csma_sinr_uses_probabilities():
         f"CSMA SINR {sinr_result.sinr_db:.1f} dB != expected {expected_sinr} dB"
 
     # Verify SINR is significantly lower than SNR (interference-limited)
-    snr_db = signal_power_dbm - noise_power_dbm  # -52.7 - (-95.0) = 42.3 dB
-    assert sinr_result.sinr_db < snr_db - 20, \
-        f"SINR {sinr_result.sinr_db:.1f} dB should be << SNR {snr_db:.1f} dB"
+    assert sinr_result.sinr_db < _SNR_DB - 20, \
+        f"SINR {sinr_result.sinr_db:.1f} dB should be << SNR {_SNR_DB:.1f} dB"
 
     # Verify metadata
     assert metadata["interference_model"] == "csma"
@@ -70,33 +74,21 @@ def test_csma_sinr_uses_probabilities():
 
 def test_csma_sinr_zero_probability():
     """Verify CSMA SINR ignores interferers with zero probability (within CS range)."""
-    signal_power_dbm = -52.7
-    noise_power_dbm = -95.0
-
     # Interferer at -58.8 dBm but with 0% probability (within carrier sense range)
-    interference_terms = [
-        InterferenceTerm(
-            source="node1",
-            power_dbm=-58.8,
-            frequency_hz=5.18e9,
-        )
-    ]
     interference_probs = {"node1": 0.0}  # Within CS range, won't transmit
 
-    calculator = SINRCalculator()
-    sinr_result, metadata = calculator.calculate_sinr_with_csma(
+    sinr_result, metadata = _CALC.calculate_sinr_with_csma(
         tx_node="node2",
         rx_node="node3",
-        signal_power_dbm=signal_power_dbm,
-        noise_power_dbm=noise_power_dbm,
-        interference_terms=interference_terms,
+        signal_power_dbm=_SIGNAL_DBM,
+        noise_power_dbm=_NOISE_DBM,
+        interference_terms=[_TERM_M58_8],
         interference_probs=interference_probs,
     )
 
     # Expected: SINR ≈ SNR (no effective interference)
-    snr_db = signal_power_dbm - noise_power_dbm
-    assert abs(sinr_result.sinr_db - snr_db) < 0.5, \
-        f"SINR {sinr_result.sinr_db:.1f} dB should equal SNR {snr_db:.1f} dB with zero probability"
+    assert abs(sinr_result.sinr_db - _SNR_DB) < 0.5, \
+        f"SINR {sinr_result.sinr_db:.1f} dB should equal SNR {_SNR_DB:.1f} dB with zero probability"
 
     # Verify no hidden nodes counted
     assert metadata["num_hidden_nodes"] == 0
@@ -108,22 +100,17 @@ def test_csma_sinr_multiple_interferers():
     noise_power_dbm = -95.0
 
     # Two interferers with different probabilities
-    interference_terms = [
-        InterferenceTerm(source="node1", power_dbm=-60.0, frequency_hz=5.18e9),
-        InterferenceTerm(source="node2", power_dbm=-65.0, frequency_hz=5.18e9),
-    ]
     interference_probs = {
         "node1": 0.3,  # Hidden node, 30% traffic load
         "node2": 0.5,  # Hidden node, 50% traffic load
     }
 
-    calculator = SINRCalculator()
-    sinr_result, metadata = calculator.calculate_sinr_with_csma(
+    sinr_result, metadata = _CALC.calculate_sinr_with_csma(
         tx_node="node3",
         rx_node="node4",
         signal_power_dbm=signal_power_dbm,
         noise_power_dbm=noise_power_dbm,
-        interference_terms=interference_terms,
+        interference_terms=_TWO_TERMS,
         interference_probs=interference_probs,
     )
 
@@ -146,31 +133,24 @@ def test_phase1_vs_csma_comparison():
     This test demonstrates the bug: Phase 1 ignores probabilities and assumes
     all interferers are always transmitting (worst-case).
     """
-    signal_power_dbm = -52.7
-    noise_power_dbm = -95.0
-
-    interference_terms = [
-        InterferenceTerm(source="node1", power_dbm=-58.8, frequency_hz=5.18e9),
-    ]
+    interference_terms = [_TERM_M58_8]
     interference_probs = {"node1": 0.3}
 
-    calculator = SINRCalculator()
-
     # Phase 1: All-transmitting (ignores probabilities)
-    phase1_result = calculator.calculate_sinr(
+    phase1_result = _CALC.calculate_sinr(
         tx_node="node2",
         rx_node="node3",
-        signal_power_dbm=signal_power_dbm,
-        noise_power_dbm=noise_power_dbm,
+        signal_power_dbm=_SIGNAL_DBM,
+        noise_power_dbm=_NOISE_DBM,
         interference_terms=interference_terms,
     )
 
     # CSMA: Probabilistic (uses probabilities)
-    csma_result, _ = calculator.calculate_sinr_with_csma(
+    csma_result, _ = _CALC.calculate_sinr_with_csma(
         tx_node="node2",
         rx_node="node3",
-        signal_power_dbm=signal_power_dbm,
-        noise_power_dbm=noise_power_dbm,
+        signal_power_dbm=_SIGNAL_DBM,
+        noise_power_dbm=_NOISE_DBM,
         interference_terms=interference_terms,
         interference_probs=interference_probs,
     )
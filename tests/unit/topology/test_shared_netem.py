@@ -0,0 +1,81 @@
+"""
+Unit tests for per-destination netem configuration in shared bridge mode.
+
+Tests that tc setup is applied through a single nsenter + `tc -batch`
+invocation regardless of how many destinations an interface has.
+"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sine.topology.netem import NetemParams
+from sine.topology.shared_netem import PerDestinationConfig, SharedNetemConfigurator
+
+
+def _make_config(num_dests: int) -> PerDestinationConfig:
+    """Build a config with num_dests destinations on node1:eth1."""
+    return PerDestinationConfig(
+        node="node1",
+        interface="eth1",
+        default_params=NetemParams(delay_ms=0.1),
+        dest_params={
+            f"192.168.100.{i + 2}": NetemParams(
+                delay_ms=1.0, jitter_ms=0.1, loss_percent=0.5, rate_mbps=100.0
+            )
+            for i in range(num_dests)
+        },
+    )
+
+
+def _make_configurator() -> SharedNetemConfigurator:
+    container_manager = MagicMock()
+    container_manager.get_container_info.return_value = {"pid": 1234}
+    return SharedNetemConfigurator(container_manager)
+
+
+@pytest.mark.parametrize("num_dests", [2, 16, 128])
+def test_apply_uses_single_batch_call(num_dests):
+    """Subprocess calls stay constant as the number of destinations grows."""
+    configurator = _make_configurator()
+    config = _make_config(num_dests)
+
+    with patch("sine.topology.shared_netem.subprocess.run") as mock_run:
+        assert configurator.apply_per_destination_netem(config) is True
+
+    # Best-effort root qdisc removal and the tc batch share one nsenter call
+    assert mock_run.call_count == 1
+    batch_call = mock_run.call_args_list[0]
+    script = batch_call.args[0][-1]
+    assert script.startswith("tc qdisc del dev eth1 root")
+    assert script.endswith("tc -batch -")
+
+    lines = batch_call.kwargs["input"].splitlines()
+    # Root qdisc, parent class, default class + netem, then 3 per destination
+    assert len(lines) == 4 + 3 * num_dests
+    assert lines[0] == "qdisc add dev eth1 root handle 1: htb default 99"
+    assert not any(line.startswith("tc ") for line in lines)
+
+
+def test_batch_matches_generated_commands():
+    """Batch input is the generated command list without the tc prefix."""
+    configurator = _make_configurator()
+    config = _make_config(3)
+
+    with patch("sine.topology.shared_netem.subprocess.run") as mock_run:
+        configurator.apply_per_destination_netem(config)
+
+    expected = [cmd.removeprefix("tc ") for cmd in configurator._generate_tc_commands(config)]
+    assert mock_run.call_args_list[0].kwargs["input"].splitlines() == expected
+
+
+def test_batch_failure_returns_false():
+    """A failing tc batch is reported as a failed configuration."""
+    configurator = _make_configurator()
+    config = _make_config(2)
+
+    error = subprocess.CalledProcessError(1, ["tc"], stderr="Command failed -:5")
+
+    with patch("sine.topology.shared_netem.subprocess.run", side_effect=error):
+        assert configurator.apply_per_destination_netem(config) is False